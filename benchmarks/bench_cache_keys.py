@@ -0,0 +1,95 @@
+"""
+Benchmark: cost of deriving cache keys from large tool arguments.
+
+Compares the previous key derivation (`json.dumps(..., sort_keys=True, default=str)`
+and MD5) with the canonical keys of `mcpy_cli.app_builder.call_keys`, encoded with
+orjson when it is installed and with the standard library, on a tool call carrying a
+large document and a batch of records.
+
+Usage:
+    python benchmarks/bench_cache_keys.py [--rows 20000] [--repeat 20]
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import patch
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from mcpy_cli.app_builder import call_keys  # noqa: E402
+
+
+def make_arguments(rows: int) -> Dict[str, Any]:
+    """Arguments of an indexing-like tool: a long text and many records."""
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return {
+        "document": "lorem ipsum dolor sit amet " * rows,
+        "records": [
+            {
+                "id": index,
+                "name": f"record {index}",
+                "score": index / 7,
+                "tags": ["alpha", "beta", "gamma"][: index % 3 + 1],
+                "position": {"x": index % 101, "y": [1.5, 2.5, 3.5]},
+            }
+            for index in range(rows)
+        ],
+        "since": created,
+        "dry_run": False,
+    }
+
+
+def legacy_key(arguments: Dict[str, Any]) -> str:
+    args_str = json.dumps(arguments, sort_keys=True, default=str)
+    return hashlib.md5(f"tool:{args_str}".encode()).hexdigest()
+
+
+def canonical_key(arguments: Dict[str, Any]) -> Any:
+    return call_keys.call_key(arguments, "tool")
+
+
+def canonical_key_stdlib(arguments: Dict[str, Any]) -> Any:
+    with patch.object(call_keys, "orjson", None):
+        return call_keys.call_key(arguments, "tool")
+
+
+def measure(func: Callable[[Any], Any], value: Any, repeat: int) -> float:
+    func(value)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(value)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    arguments = make_arguments(args.rows)
+    size = len(json.dumps(arguments, default=str)) / 1024
+    print(f"Arguments: {size:.0f} KiB of JSON, hash: {call_keys.HASH_NAME}")
+
+    derivations: List[Tuple[str, Callable[[Any], Any]]] = [
+        ("md5 + json (previous)", legacy_key),
+        ("canonical + json", canonical_key_stdlib),
+    ]
+    if call_keys.orjson is not None:
+        derivations.append(("canonical + orjson", canonical_key))
+    else:
+        print("orjson is not installed, skipped")
+
+    print(f"{'derivation':<24}{'ms':>10}")
+    for name, derive in derivations:
+        print(f"{name:<24}{measure(derive, arguments, args.repeat):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: throughput of a CPU-bound pure-Python tool, thread pool vs. process pool.
+
+Each scenario sends `--calls` concurrent tool calls through an in-memory FastMCP
+client. Threads share one core because of the GIL, so their throughput stays flat;
+the process pool should scale close to linearly with the number of workers, up to
+the number of cores.
+
+Usage:
+    python benchmarks/bench_process_pool.py [--calls 32] [--limit 60000]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from mcpy_cli.app_builder import create_mcp_instances, discover_and_group_functions  # noqa: E402
+from mcpy_cli.app_builder.execution import ToolProcessPool, ToolThreadPool  # noqa: E402
+
+TOOL_SOURCE = '''
+def count_primes(limit: int) -> int:
+    """Count primes below the limit by trial division."""
+    return sum(
+        1 for n in range(2, limit) if all(n % d for d in range(2, int(n**0.5) + 1))
+    )
+'''
+
+
+async def measure(file_mcp, calls: int, limit: int) -> float:
+    from fastmcp import Client
+
+    async with Client(file_mcp) as client:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[client.call_tool("count_primes", {"limit": limit}) for _ in range(calls)]
+        )
+        return calls / (time.perf_counter() - start)
+
+
+def build_instance(tool_file: pathlib.Path, tool_executor):
+    functions_by_file, base_dir = discover_and_group_functions(str(tool_file))
+    instances = create_mcp_instances(
+        functions_by_file, base_dir, "Benchmark", tool_executor=tool_executor
+    )
+    return instances[tool_file][0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=32)
+    parser.add_argument("--limit", type=int, default=60000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpu_count})
+    print(f"CPU count: {cpu_count}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tool_file = pathlib.Path(temp_dir).resolve() / "cpu_tools.py"
+        tool_file.write_text(TOOL_SOURCE)
+
+        print(f"{'executor':<10}{'workers':>10}{'calls/s':>12}")
+        for workers in worker_counts:
+            for executor in ("thread", "process"):
+                if executor == "thread":
+                    pool = ToolThreadPool(workers)
+                else:
+                    pool = ToolProcessPool(workers, tool_file.parent)
+                file_mcp = build_instance(tool_file, pool)
+                if executor == "process":
+                    # Warm the workers so process start-up is not measured
+                    pool.start()
+                    asyncio.run(measure(file_mcp, workers, 10))
+                throughput = asyncio.run(measure(file_mcp, args.calls, args.limit))
+                pool.shutdown(wait=True)
+                print(f"{executor:<10}{workers:>10}{throughput:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: JSON serialization cost of large nested tool results.
+
+Compares FastMCP's default tool result serializer (pydantic, pretty-printed) with the
+standard library, pydantic-core and orjson serializers of
+`mcpy_cli.utils.serialization`, on the encoding of tool results and the decoding done
+when event store messages are replayed.
+
+Usage:
+    python benchmarks/bench_serialization.py [--rows 2000] [--repeat 50]
+"""
+
+import argparse
+import datetime
+import pathlib
+import sys
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from mcpy_cli.utils.serialization import (  # noqa: E402
+    SERIALIZER_JSON,
+    SERIALIZER_ORJSON,
+    SERIALIZER_PYDANTIC,
+    get_serializer,
+)
+
+
+def make_payload(rows: int) -> Dict[str, Any]:
+    """A search-like result: many records with nested lists, dicts and dates."""
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return {
+        "query": "mcp",
+        "total": rows,
+        "results": [
+            {
+                "id": str(uuid.UUID(int=index)),
+                "title": f"Document {index}",
+                "score": index / rows,
+                "created": created + datetime.timedelta(minutes=index),
+                "tags": ["alpha", "beta", "gamma"][: index % 3 + 1],
+                "metadata": {
+                    "author": {"name": "Ada", "id": index % 17},
+                    "sections": [
+                        {"heading": f"Part {part}", "words": part * 100}
+                        for part in range(5)
+                    ],
+                },
+            }
+            for index in range(rows)
+        ],
+    }
+
+
+def measure(func: Callable[[Any], Any], value: Any, repeat: int) -> float:
+    func(value)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(value)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    from fastmcp.tools.tool import default_serializer
+
+    payload = make_payload(args.rows)
+    serializers: List[Any] = [("fastmcp", default_serializer, None)]
+    for name in (SERIALIZER_JSON, SERIALIZER_PYDANTIC, SERIALIZER_ORJSON):
+        try:
+            serializer = get_serializer(name)
+        except ImportError:
+            print(f"{name} is not installed, skipped")
+            continue
+        serializers.append((name, serializer.dumps, serializer.loads))
+
+    print(f"{'serializer':<12}{'dumps ms':>10}{'loads ms':>10}{'KiB':>10}")
+    for name, dumps, loads in serializers:
+        text = dumps(payload)
+        dumps_ms = measure(dumps, payload, args.repeat)
+        loads_ms = measure(loads, text, args.repeat) if loads else float("nan")
+        size = len(text.encode("utf-8")) / 1024
+        print(f"{name:<12}{dumps_ms:>10.2f}{loads_ms:>10.2f}{size:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: throughput of a blocking `time.sleep` tool, inline vs. thread pool.
+
+Each scenario sends `--calls` tool calls with the given concurrency through an
+in-memory FastMCP client and reports calls per second. Inline execution serializes
+on the event loop regardless of concurrency; the thread pool should scale with
+concurrency up to its size.
+
+Usage:
+    python benchmarks/bench_thread_offload.py [--calls 64] [--delay 0.05]
+"""
+
+import argparse
+import asyncio
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from mcpy_cli.app_builder import create_mcp_instances, discover_and_group_functions  # noqa: E402
+from mcpy_cli.app_builder.execution import ToolThreadPool  # noqa: E402
+
+TOOL_SOURCE = '''
+import time
+
+def blocking_io(delay: float) -> float:
+    """Simulate a blocking I/O call."""
+    time.sleep(delay)
+    return delay
+'''
+
+
+async def measure(file_mcp, calls: int, concurrency: int, delay: float) -> float:
+    from fastmcp import Client
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with Client(file_mcp) as client:
+
+        async def one_call():
+            async with semaphore:
+                await client.call_tool("blocking_io", {"delay": delay})
+
+        start = time.perf_counter()
+        await asyncio.gather(*[one_call() for _ in range(calls)])
+        return calls / (time.perf_counter() - start)
+
+
+def build_instance(tool_file: pathlib.Path, tool_executor=None):
+    functions_by_file, base_dir = discover_and_group_functions(str(tool_file))
+    instances = create_mcp_instances(
+        functions_by_file, base_dir, "Benchmark", tool_executor=tool_executor
+    )
+    return instances[tool_file][0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=64)
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--pool-size", type=int, default=32)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tool_file = pathlib.Path(temp_dir).resolve() / "bench_tools.py"
+        tool_file.write_text(TOOL_SOURCE)
+
+        print(f"{'executor':<10}{'concurrency':>12}{'calls/s':>12}")
+        for concurrency in (1, 4, 16, 32):
+            for executor in ("inline", "thread"):
+                pool = ToolThreadPool(args.pool_size) if executor == "thread" else None
+                file_mcp = build_instance(tool_file, pool)
+                throughput = asyncio.run(
+                    measure(file_mcp, args.calls, concurrency, args.delay)
+                )
+                if pool is not None:
+                    pool.shutdown()
+                print(f"{executor:<10}{concurrency:>12}{throughput:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
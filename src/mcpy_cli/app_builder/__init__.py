@@ -3,23 +3,43 @@ MCP application builder modules.
 """
 
 from .application_factory import create_mcp_application
-from .instance_factory import create_mcp_instances, discover_and_group_functions
+from .instance_factory import (
+    create_mcp_instances,
+    create_lazy_mcp_instances,
+    discover_and_group_functions,
+    discover_and_group_functions_static,
+)
 from .middleware import (
     SessionMiddleware,
     get_current_session_id,
     set_current_session_id,
 )
-from .caching import SessionToolCallCache
+from .caching import ResultStore, SessionToolCallCache
+from .coalescing import ToolCallCoalescer
+from .result_cache import ToolResultCache
+from .manifest import DiscoveryManifest
+from .lazy_loading import LazyModuleLoader
+from .hot_reload import HotReloader
+from .lifecycle import ModuleLifecycle
 from .routing import get_route_from_path, validate_resource_prefix
 
 __all__ = [
     "create_mcp_application",
     "create_mcp_instances",
     "discover_and_group_functions",
+    "create_lazy_mcp_instances",
+    "discover_and_group_functions_static",
     "SessionMiddleware",
     "get_current_session_id",
     "set_current_session_id",
     "SessionToolCallCache",
+    "ResultStore",
+    "ToolCallCoalescer",
+    "ToolResultCache",
+    "DiscoveryManifest",
+    "LazyModuleLoader",
+    "HotReloader",
+    "ModuleLifecycle",
     "get_route_from_path",
     "validate_resource_prefix",
 ]
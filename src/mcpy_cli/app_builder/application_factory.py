@@ -4,19 +4,55 @@ Factory for creating complete MCP applications with multiple FastMCP instances.
 
 import logging
 import os
+import pathlib
+import sqlite3
 
 from typing import List, Optional, Any, cast
 from contextlib import asynccontextmanager, AsyncExitStack
 from starlette.applications import Starlette
-from starlette.routing import Mount
+from starlette.requests import Request
+from starlette.routing import Mount, Route
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
-from ..utils import TransformationError
+from ..utils import TransformationError, normalize_path
+from ..utils.profiling import profile_phase
+from ..utils.serialization import (
+    SERIALIZER_AUTO,
+    FastJSONResponse,
+    serialize_tool_result,
+    set_serializer,
+)
 from .mocking import get_fastmcp_class, FastMCPType
 from .middleware import SessionMiddleware, SSEDebugMiddleware, AsyncSessionMiddleware, SSEURLRewriteMiddleware
-from .caching import SessionToolCallCache
-from .instance_factory import discover_and_group_functions, create_mcp_instances
+from .caching import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_MAX_ENTRIES_PER_SESSION,
+    CACHE_BACKEND_MEMORY,
+    DEFAULT_COMPACT_INTERVAL,
+    ResultStoreCompactor,
+    SessionToolCallCache,
+    create_result_store,
+    default_cache_path,
+)
+from .instance_factory import (
+    discover_and_group_functions,
+    discover_and_group_functions_static,
+    create_mcp_instances,
+    create_lazy_mcp_instances,
+    rebuild_mcp_instances,
+)
+from .hot_reload import ComposedReloadTarget, HotReloader, RoutedReloadTarget
+from .lazy_loading import LazyModuleLoader
+from .lifecycle import ModuleLifecycle
+from .manifest import DiscoveryManifest
+from .execution import EXECUTOR_INLINE, ToolExecutors
+from .limits import ToolLimits
+from .result_cache import ToolResultCache
+from .batch_call import DEFAULT_BATCH_CONCURRENCY, BatchCaller
+from .tool_errors import install_tool_error_passthrough
+from ..tool_options import ToolOptionsConfig
 
 logger = logging.getLogger(__name__)
 
@@ -52,9 +88,80 @@ def create_mcp_application(
     stateless_http: bool = False,
     json_response: bool = False,
     legacy_sse: bool = False,
+    discovery_workers: Optional[int] = None,
+    discovery_cache: bool = False,
+    discovery_cache_path: Optional[str] = None,
+    lazy_tools: bool = False,
+    lazy_idle_timeout: Optional[float] = None,
+    scan_max_depth: Optional[int] = None,
+    hot_reload: bool = False,
+    hot_reload_poll_interval: float = 1.0,
+    executor: str = EXECUTOR_INLINE,
+    executor_workers: Optional[int] = None,
+    stats_path: Optional[str] = None,
+    tool_config: Optional[str] = None,
+    tool_timeout: Optional[float] = None,
+    batch_tool: bool = False,
+    batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    cache_max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+    cache_max_entries_per_session: Optional[int] = DEFAULT_MAX_ENTRIES_PER_SESSION,
+    cache_max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    cache_ttl: Optional[float] = None,
+    pure_cache_max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+    pure_cache_max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    pure_cache_ttl: Optional[float] = None,
+    cache_backend: str = CACHE_BACKEND_MEMORY,
+    cache_path: Optional[str] = None,
+    cache_compact_interval: float = DEFAULT_COMPACT_INTERVAL,
+    serializer: str = SERIALIZER_AUTO,
 ) -> Starlette:
     """
     Creates a Starlette application with multiple FastMCP instances.
+
+    With `lazy_tools`, tools are registered from static metadata and their modules are
+    imported on the first call that targets them; `lazy_idle_timeout` additionally
+    evicts modules that have been idle for that many seconds. `scan_max_depth` limits
+    how deep source directories are scanned; `.mcpyignore` rules always apply.
+
+    With `hot_reload`, a watcher runs during the application lifespan and rebuilds
+    only the FastMCP instance of a changed file, swapping it into the running app.
+
+    `executor` selects where synchronous tools run: "inline" on the event loop,
+    "thread" in a pool of `executor_workers` threads, or "process" in a pool of
+    `executor_workers` pre-warmed worker processes. Tools can override it with
+    `tool_options(executor=...)`. `stats_path` exposes runtime statistics (executor
+    gauges, cache counters, ...) as JSON at that path.
+
+    `tool_config` is a JSON file with per-tool options, such as concurrency limits,
+    that override what tools declare with `tool_options` (see `mcpy_cli.tool_options`).
+    `tool_timeout` is the timeout in seconds of tools that do not set their own.
+
+    With `batch_tool`, composed applications expose a `batch_call` tool that runs a
+    list of tool calls concurrently, at most `batch_concurrency` at a time.
+
+    In stateful JSON response mode, tool results are cached per session. The cache
+    holds at most `cache_max_entries` results (`cache_max_entries_per_session` per
+    session) of at most `cache_max_bytes` bytes in total, evicting the least recently
+    used first; `cache_ttl` expires results after that many seconds. A session's
+    results are dropped when the client ends the session.
+
+    Results of tools declared pure (`tool_options(pure=True)` or the tool config) are
+    cached across sessions in every mode, at most `pure_cache_max_entries` results of
+    at most `pure_cache_max_bytes` bytes, expiring after `pure_cache_ttl` seconds
+    unless the tool sets its own `cache_ttl` (see `mcpy_cli.app_builder.result_cache`).
+
+    `cache_backend` selects where both caches keep their results: "memory" in the
+    process, or "sqlite" in the database at `cache_path` (by default in the user cache
+    directory), shared by all worker processes of the host and kept across restarts.
+    Expired results are removed every `cache_compact_interval` seconds.
+
+    `serializer` selects the JSON serializer of tool results, JSON responses and
+    stored events: "auto" (orjson when installed, pydantic-core otherwise), "orjson",
+    "pydantic" or "json" (see `mcpy_cli.utils.serialization`).
+
+    Tool modules defining `mcp_startup`/`mcp_shutdown` have them run during the
+    application lifespan, and tools with `warmup` options are called once at
+    startup (see `mcpy_cli.app_builder.lifecycle`).
     """
     logger.info(
         f"Initializing multi-mount MCP application with base name {mcp_server_name}"
@@ -77,10 +184,56 @@ def create_mcp_application(
                 "Legacy SSE mode is incompatible with stateless HTTP mode. Please disable --stateless-http when using --legacy-sse."
             )
 
+    try:
+        set_serializer(serializer)
+    except (ValueError, ImportError) as e:
+        raise TransformationError(f"Failed to select the JSON serializer: {e}") from e
+
     # Discover and group functions by file
-    functions_by_file, base_dir = discover_and_group_functions(
-        source_path_str, target_function_names
-    )
+    lazy_functions_by_file = None
+    if lazy_tools:
+        lazy_functions_by_file, base_dir = discover_and_group_functions_static(
+            source_path_str, target_function_names, scan_max_depth
+        )
+    else:
+        functions_by_file, base_dir = discover_and_group_functions(
+            source_path_str, target_function_names, discovery_workers, scan_max_depth
+        )
+
+    db_path = pathlib.Path(cache_path) if cache_path else default_cache_path(base_dir)
+    tool_call_cache = None
+    try:
+        if not stateless_http and json_response:
+            tool_call_cache = SessionToolCallCache(
+                store=create_result_store(
+                    cache_backend,
+                    "session",
+                    db_path,
+                    cache_max_entries,
+                    cache_max_entries_per_session,
+                    cache_max_bytes,
+                    cache_ttl,
+                )
+            )
+            logger.info("Tool call cache initialized for stateful JSON response mode")
+        tool_result_cache = ToolResultCache(
+            store=create_result_store(
+                cache_backend,
+                "pure",
+                db_path,
+                pure_cache_max_entries,
+                None,
+                pure_cache_max_bytes,
+                pure_cache_ttl,
+            )
+        )
+        cache_compactor = ResultStoreCompactor(
+            [tool_result_cache.store]
+            + ([tool_call_cache.store] if tool_call_cache else []),
+            cache_compact_interval,
+        )
+    except (ValueError, sqlite3.Error) as e:
+        raise TransformationError(f"Failed to initialize the tool caches: {e}") from e
 
     # Set up middleware stack
     middleware = []
@@ -92,7 +245,14 @@ def create_mcp_application(
         logger.info("Using AsyncSessionMiddleware for SSE compatibility")
     else:
         # Use regular SessionMiddleware for non-SSE modes
-        middleware.append(Middleware(SessionMiddleware))
+        middleware.append(
+            Middleware(
+                SessionMiddleware,
+                on_session_closed=tool_call_cache.clear_session_async
+                if tool_call_cache
+                else None,
+            )
+        )
 
     if cors_enabled:
         effective_cors_origins = (
@@ -121,9 +281,8 @@ def create_mcp_application(
             logger.info(f"Added SSEURLRewriteMiddleware with root_path: {app_root_path}")
         logger.info("Added SSEDebugMiddleware for legacy SSE debugging")
 
-    # Create event store and cache as needed
+    # Create event store as needed
     event_store = None
-    tool_call_cache = None
 
     if enable_event_store and not json_response and not stateless_http:
         from ..mcp_event_store import SQLiteEventStore
@@ -134,48 +293,235 @@ def create_mcp_application(
         except Exception as e:
             logger.error(f"Failed to initialize MCP event store: {e}")
 
-    if not stateless_http and json_response:
-        tool_call_cache = SessionToolCallCache()
-        logger.info("Tool call cache initialized for stateful JSON response mode")
+    try:
+        tool_executor = ToolExecutors(executor, executor_workers, base_dir)
+        tool_limits = ToolLimits(
+            ToolOptionsConfig.from_file(pathlib.Path(tool_config))
+            if tool_config
+            else None,
+            base_dir,
+            tool_timeout,
+            tool_result_cache,
+        )
+    except ValueError as e:
+        raise TransformationError(str(e))
+
+    manifest = None
+    if discovery_cache:
+        manifest = DiscoveryManifest(
+            base_dir,
+            target_function_names,
+            pathlib.Path(discovery_cache_path) if discovery_cache_path else None,
+        )
+        logger.info(f"Using discovery manifest at {manifest.manifest_path}")
 
     # Create MCP instances
-    mcp_instances = create_mcp_instances(
-        functions_by_file, base_dir, mcp_server_name, tool_call_cache
-    )
+    lazy_loader = None
+    if lazy_functions_by_file is not None:
+        lazy_loader = LazyModuleLoader(
+            idle_timeout=lazy_idle_timeout, base_dir=base_dir
+        )
+        mcp_instances = create_lazy_mcp_instances(
+            lazy_functions_by_file,
+            base_dir,
+            mcp_server_name,
+            lazy_loader,
+            tool_call_cache,
+            manifest,
+            tool_executor,
+            tool_limits,
+        )
+    else:
+        mcp_instances = create_mcp_instances(
+            functions_by_file,
+            base_dir,
+            mcp_server_name,
+            tool_call_cache,
+            manifest,
+            tool_executor,
+            tool_limits,
+        )
+
+    if manifest is not None:
+        manifest.save()
+        stats = manifest.get_stats()
+        logger.info(
+            f"Discovery manifest reused {stats['hits']}/{stats['hits'] + stats['misses']} "
+            f"file(s) ({stats['hit_rate']:.0%} hit rate)"
+        )
 
     if not mcp_instances:
         raise TransformationError(
             "No FastMCP instances could be created with valid tools."
         )
     starlette_app: Starlette = Starlette()
-    if mode == "composed":
-        starlette_app = _create_composed_application(
-            mcp_instances,
-            mcp_server_name,
-            mcp_server_root_path,
-            mcp_service_base_path,
-            middleware,
-            event_store,
-            json_response,
-            stateless_http,
-            tool_call_cache,
-            legacy_sse,
+    # Mounting is profiled as its own phase; the rest is HTTP app creation
+    with profile_phase("http_app"):
+        if mode == "composed":
+            starlette_app = _create_composed_application(
+                mcp_instances,
+                mcp_server_name,
+                mcp_server_root_path,
+                mcp_service_base_path,
+                middleware,
+                event_store,
+                json_response,
+                stateless_http,
+                tool_call_cache,
+                legacy_sse,
+                batch_tool,
+                batch_concurrency,
+            )
+        elif mode == "routed":
+            starlette_app = _create_routed_application(
+                mcp_instances,
+                mcp_service_base_path,
+                middleware,
+                event_store,
+                json_response,
+                stateless_http,
+                tool_call_cache,
+                legacy_sse,
+            )
+        else:
+            raise TransformationError(f"Invalid mode: {mode}")
+    if batch_tool and mode != "composed":
+        logger.warning("The batch_call tool is only available in composed mode")
+
+    if lazy_loader is not None:
+        starlette_app.state.lazy_loader = lazy_loader
+
+    module_lifecycle = ModuleLifecycle(
+        mcp_instances, base_dir, tool_limits, tool_executor, lazy_loader
+    )
+    starlette_app.state.tool_executor = tool_executor
+    starlette_app.state.tool_limits = tool_limits
+    starlette_app.state.tool_coalescer = tool_limits.coalescer
+    starlette_app.state.tool_result_cache = tool_limits.result_cache
+    starlette_app.state.module_lifecycle = module_lifecycle
+    starlette_app.state.cache_compactor = cache_compactor
+    # Executors are started first, so warm-up calls can run in them
+    starlette_app.router.lifespan_context = _manage_resources(
+        module_lifecycle.wrap_lifespan(starlette_app.router.lifespan_context),
+        tool_executor,
+        cache_compactor,
+        *([lazy_loader] if lazy_loader is not None else []),
+    )
+
+    if stats_path:
+        starlette_app.router.routes.insert(
+            0, Route(stats_path, endpoint=_stats_endpoint, methods=["GET"])
         )
-        return starlette_app
-    elif mode == "routed":
-        starlette_app = _create_routed_application(
-            mcp_instances,
-            mcp_service_base_path,
-            middleware,
-            event_store,
-            json_response,
-            stateless_http,
-            tool_call_cache,
-            legacy_sse,
+        logger.info(f"Runtime statistics available at {stats_path}")
+
+    if hot_reload:
+        if mode == "composed":
+            reload_target: Any = ComposedReloadTarget(
+                starlette_app.state.fastmcp_instance, _mount_file_instance
+            )
+        else:
+            reload_target = RoutedReloadTarget(
+                starlette_app,
+                lambda file_mcp: _create_file_app(
+                    file_mcp,
+                    mcp_service_base_path,
+                    middleware,
+                    event_store,
+                    json_response,
+                    stateless_http,
+                    legacy_sse,
+                ),
+            )
+
+        def clear_caches() -> None:
+            # Results of the previous code must not be served for the new one
+            tool_limits.result_cache.clear()
+            if tool_call_cache is not None:
+                tool_call_cache.clear()
+
+        hot_reloader = HotReloader(
+            source_path=pathlib.Path(normalize_path(source_path_str)).resolve(),
+            base_dir=base_dir,
+            mcp_instances=mcp_instances,
+            build_instances=lambda file_paths: rebuild_mcp_instances(
+                file_paths,
+                base_dir,
+                mcp_server_name,
+                target_function_names,
+                tool_call_cache,
+                lazy_loader,
+                tool_executor,
+                tool_limits,
+            ),
+            target=reload_target,
+            poll_interval=hot_reload_poll_interval,
+            scan_max_depth=scan_max_depth,
+            on_reload=clear_caches,
+            lifecycle=module_lifecycle,
+        )
+        starlette_app.router.lifespan_context = hot_reloader.wrap_lifespan(
+            starlette_app.router.lifespan_context
+        )
+        starlette_app.state.hot_reloader = hot_reloader
+        logger.info("Incremental hot reload enabled")
+
+    return starlette_app
+
+
+def _manage_resources(lifespan_context, *resources):
+    """
+    Wrap a lifespan so the given resources are started with the app and shut down
+    when it stops.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app):
+        for resource in resources:
+            resource.start()
+        try:
+            async with lifespan_context(app) as state:
+                yield state
+        finally:
+            for resource in resources:
+                resource.shutdown()
+
+    return lifespan
+
+
+# Components stored in app.state whose get_stats() is exposed at `stats_path`
+STATS_COMPONENTS = [
+    "tool_executor",
+    "tool_limits",
+    "tool_coalescer",
+    "tool_result_cache",
+    "tool_call_cache",
+    "lazy_loader",
+    "batch_caller",
+    "module_lifecycle",
+]
+
+
+async def _stats_endpoint(request: Request) -> FastJSONResponse:
+    """Return the statistics of all runtime components of the application."""
+    stats = {}
+    for name in STATS_COMPONENTS:
+        component = getattr(request.app.state, name, None)
+        if component is not None:
+            stats[name] = component.get_stats()
+    return FastJSONResponse(stats)
+
+
+def _mount_file_instance(main_mcp: Any, route_path: str, file_mcp: Any) -> None:
+    """Mount a file's FastMCP instance on the composed server, replacing any previous one."""
+    with profile_phase("mount"):
+        main_mcp.mount(
+            route_path,
+            file_mcp,
+            as_proxy=False,
+            resource_separator="+",
+            tool_separator="_",
+            prompt_separator=".",
         )
-        return starlette_app
-    else:
-        raise TransformationError(f"Invalid mode: {mode}")
 
 
 def _create_composed_application(
@@ -189,22 +535,29 @@ def _create_composed_application(
     stateless_http,
     tool_call_cache,
     legacy_sse,
+    batch_tool=False,
+    batch_concurrency=DEFAULT_BATCH_CONCURRENCY,
 ):
     """Create a composed application."""
     FastMCP = get_fastmcp_class()
-    main_mcp: FastMCPType = FastMCP(name=mcp_server_name)
+    main_mcp: FastMCPType = FastMCP(
+        name=mcp_server_name, tool_serializer=serialize_tool_result
+    )
+    install_tool_error_passthrough(main_mcp)
+
+    batch_caller = None
+    if batch_tool:
+        try:
+            batch_caller = BatchCaller(main_mcp, batch_concurrency)
+        except ValueError as e:
+            raise TransformationError(str(e))
+        if not batch_caller.register():
+            batch_caller = None
 
     # Mount each file's FastMCP instance
     for file_path, (file_mcp, route_path, tools_registered) in mcp_instances.items():
         try:
-            main_mcp.mount(
-                route_path,
-                file_mcp,
-                as_proxy=False,
-                resource_separator="+",
-                tool_separator="_",
-                prompt_separator=".",
-            )
+            _mount_file_instance(main_mcp, route_path, file_mcp)
             logger.info(f"Mounted FastMCP instance '{file_mcp.name}' at '{route_path}'")
         except Exception as e:
             logger.error(f"Failed to mount FastMCP instance '{file_mcp.name}': {e}")
@@ -253,6 +606,8 @@ def _create_composed_application(
 
     # Store references in app state
     app.state.fastmcp_instance = main_mcp
+    if batch_caller:
+        app.state.batch_caller = batch_caller
     if event_store:
         app.state.event_store = event_store
     if tool_call_cache:
@@ -276,33 +631,15 @@ def _create_routed_application(
     apps = []
 
     for file_path, (file_mcp, route_path, tools_registered) in mcp_instances.items():
-        if legacy_sse:
-            # Use proper SSE transport via create_sse_app function
-            from fastmcp.server.http import create_sse_app
-            
-            # Split the base path into SSE connection and message paths
-            sse_path = mcp_service_base_path + '/sse'
-            message_path = mcp_service_base_path + "/messages"
-            
-            file_app = create_sse_app(
-                server=cast(Any, file_mcp),
-                message_path=message_path,
-                sse_path=sse_path,
-                middleware=middleware if middleware else None,
-            )
-            logger.info(f"Using proper SSE transport for '{file_mcp.name}' with endpoints: {sse_path} (SSE), {message_path} (messages)")
-        else:
-            # Use modern streamable HTTP transport
-            from fastmcp.server.http import create_streamable_http_app
-
-            file_app = create_streamable_http_app(
-                server=cast(Any, file_mcp),
-                streamable_http_path=mcp_service_base_path,
-                event_store=event_store,
-                json_response=json_response,
-                stateless_http=stateless_http,
-                middleware=middleware if middleware else None,
-            )
+        file_app = _create_file_app(
+            file_mcp,
+            mcp_service_base_path,
+            middleware,
+            event_store,
+            json_response,
+            stateless_http,
+            legacy_sse,
+        )
         routes.append(Mount("/" + route_path, app=file_app))
         apps.append(file_app)
 
@@ -320,3 +657,43 @@ def _create_routed_application(
         app.state.tool_call_cache = tool_call_cache
 
     return app
+
+
+def _create_file_app(
+    file_mcp,
+    mcp_service_base_path,
+    middleware,
+    event_store,
+    json_response,
+    stateless_http,
+    legacy_sse,
+):
+    """Create the ASGI app serving a single file's FastMCP instance in routed mode."""
+    if legacy_sse:
+        # Use proper SSE transport via create_sse_app function
+        from fastmcp.server.http import create_sse_app
+
+        # Split the base path into SSE connection and message paths
+        sse_path = mcp_service_base_path + '/sse'
+        message_path = mcp_service_base_path + "/messages"
+
+        file_app = create_sse_app(
+            server=cast(Any, file_mcp),
+            message_path=message_path,
+            sse_path=sse_path,
+            middleware=middleware if middleware else None,
+        )
+        logger.info(f"Using proper SSE transport for '{file_mcp.name}' with endpoints: {sse_path} (SSE), {message_path} (messages)")
+    else:
+        # Use modern streamable HTTP transport
+        from fastmcp.server.http import create_streamable_http_app
+
+        file_app = create_streamable_http_app(
+            server=cast(Any, file_mcp),
+            streamable_http_path=mcp_service_base_path,
+            event_store=event_store,
+            json_response=json_response,
+            stateless_http=stateless_http,
+            middleware=middleware if middleware else None,
+        )
+    return file_app
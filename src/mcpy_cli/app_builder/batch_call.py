@@ -0,0 +1,164 @@
+"""
+Built-in `batch_call` tool for composed MCP applications.
+
+Agents often issue many independent tool calls in a row, each paying a full HTTP
+round trip and the session middleware. The `batch_call` tool takes a list of
+`{tool, arguments}` items, runs them concurrently on the composed server under a
+fan-out limit and returns one result per item, in order. A failing item does not
+fail the batch; its error is reported in its own result.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+from .tool_errors import find_tool_protocol_error
+from .validation import register_tool
+
+logger = logging.getLogger(__name__)
+
+BATCH_TOOL_NAME = "batch_call"
+DEFAULT_BATCH_CONCURRENCY = 8
+DEFAULT_MAX_BATCH_SIZE = 100
+
+
+class BatchCallItem(BaseModel):
+    """One tool call of a batch."""
+
+    tool: str = Field(description="Name of the tool to call")
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict, description="Arguments of the tool call"
+    )
+
+
+class BatchCaller:
+    """
+    Runs batches of tool calls against a FastMCP server.
+
+    Calls are dispatched through the server's own tool call path, so per-tool
+    executors, caches, concurrency limits and timeouts apply to every item exactly as
+    they do to individual calls.
+    """
+
+    def __init__(
+        self,
+        mcp_instance: Any,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """
+        Args:
+            mcp_instance: The FastMCP server whose tools are called.
+            max_concurrency: Maximum number of items of one batch running at once.
+            max_batch_size: Maximum number of items in one batch.
+
+        Raises:
+            ValueError: If a limit is not a positive integer.
+        """
+        if max_concurrency < 1 or max_batch_size < 1:
+            raise ValueError(
+                "Batch concurrency and batch size must be positive integers"
+            )
+        self.mcp_instance = mcp_instance
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.calls = 0
+        self.errors = 0
+
+    async def _call_item(
+        self, item: BatchCallItem, semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        if item.tool == BATCH_TOOL_NAME:
+            self.errors += 1
+            return {
+                "tool": item.tool,
+                "ok": False,
+                "error": {"message": "batch_call cannot be nested"},
+            }
+        async with semaphore:
+            try:
+                contents = await self.mcp_instance._mcp_call_tool(
+                    item.tool, item.arguments
+                )
+            except Exception as e:
+                self.errors += 1
+                protocol_error = find_tool_protocol_error(e)
+                if protocol_error is not None:
+                    error = protocol_error.error.model_dump(exclude_none=True)
+                else:
+                    error = {"message": str(e)}
+                return {"tool": item.tool, "ok": False, "error": error}
+        return {
+            "tool": item.tool,
+            "ok": True,
+            "content": [
+                content.model_dump(mode="json", exclude_none=True)
+                for content in contents
+            ],
+        }
+
+    async def call(self, calls: List[BatchCallItem]) -> List[Dict[str, Any]]:
+        """
+        Run a batch of tool calls concurrently.
+
+        Args:
+            calls: The tool calls to run.
+
+        Returns:
+            One result per call, in the order of `calls`. Successful results hold the
+            tool's `content`; failed ones hold an `error` with a `message` and, for
+            protocol errors such as timeouts, the JSON-RPC `code` and `data`.
+
+        Raises:
+            ValueError: If the batch has more than `max_batch_size` items.
+        """
+        if len(calls) > self.max_batch_size:
+            raise ValueError(
+                f"A batch can hold at most {self.max_batch_size} calls, got {len(calls)}"
+            )
+        self.batches += 1
+        self.calls += len(calls)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return list(
+            await asyncio.gather(*[self._call_item(item, semaphore) for item in calls])
+        )
+
+    def register(self) -> bool:
+        """
+        Register the `batch_call` tool on the server.
+
+        Returns:
+            False if the server cannot dispatch tool calls (the test mock).
+        """
+        if not hasattr(self.mcp_instance, "_mcp_call_tool"):
+            logger.warning("The batch_call tool is not supported by this server")
+            return False
+
+        async def batch_call(calls: List[BatchCallItem]) -> List[Dict[str, Any]]:
+            return await self.call(calls)
+
+        register_tool(
+            self.mcp_instance,
+            batch_call,
+            BATCH_TOOL_NAME,
+            "Call several tools concurrently in one request. Takes a list of "
+            "{tool, arguments} items and returns one result per item, in order; "
+            "each result has ok set and either the tool's content or an error.",
+        )
+        logger.info(
+            f"Registered the {BATCH_TOOL_NAME} tool with fan-out {self.max_concurrency}"
+        )
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get batch counters."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_batch_size": self.max_batch_size,
+            "batches": self.batches,
+            "calls": self.calls,
+            "errors": self.errors,
+        }
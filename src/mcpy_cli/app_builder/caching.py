@@ -1,110 +1,603 @@
 """
 Tool call caching functionality for MCP applications.
+
+Cached results live in a `ResultStore` backend: in process memory (the default), or
+in a SQLite database on local disk that survives restarts and is shared by all
+worker processes on the host (see `sqlite_cache`).
 """
 
+import asyncio
 import functools
+import hashlib
+import inspect
 import logging
-from typing import Any, Callable, Dict, Optional
+import os
+import pathlib
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
+from ..utils.serialization import dumps_bytes
+from .call_keys import bind_arguments, call_key
 from .middleware import get_current_session_id
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_ENTRIES_PER_SESSION = 1000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_COMPACT_INTERVAL = 60.0
+
+CACHE_BACKEND_MEMORY = "memory"
+CACHE_BACKEND_SQLITE = "sqlite"
+CACHE_BACKEND_CHOICES = (CACHE_BACKEND_MEMORY, CACHE_BACKEND_SQLITE)
+
+
+def approximate_size(value: Any) -> int:
+    """Approximate memory held by a cached result: the size of its JSON encoding."""
+    try:
+        return len(dumps_bytes(value))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class _CacheEntry:
+    """A cached result with its approximate size and expiry time."""
+
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+def validate_cache_limits(**limits: Optional[float]) -> None:
+    """
+    Check that cache limits are positive.
+
+    Raises:
+        ValueError: If a limit is not None and not positive.
+    """
+    for name, value in limits.items():
+        if value is not None and value <= 0:
+            raise ValueError(f"Cache {name} must be positive, got {value!r}")
+
+
+class ResultStore(ABC):
+    """
+    Interface of cache backends: results grouped (e.g. by session or tool), keyed
+    within their group and bounded in entries and bytes.
+    """
+
+    backend: str
+    # Whether operations may block on I/O; async callers then run them in a thread
+    blocking = True
+
+    @abstractmethod
+    def get(self, group: str, key: str) -> Optional[Any]:
+        """Return a stored result, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(
+        self, group: str, key: str, result: Any, ttl: Optional[float] = None
+    ) -> bool:
+        """
+        Store a result, evicting others as needed.
+
+        Args:
+            group: The group of the entry.
+            key: The key of the entry within its group.
+            result: The result. None is not stored.
+            ttl: Seconds after which the entry expires, instead of the default TTL.
+
+        Returns:
+            True if the result was stored.
+        """
+
+    @abstractmethod
+    def clear_group(self, group: str) -> None:
+        """Remove all entries of a group."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def compact(self) -> None:
+        """Remove expired entries and release the space they held."""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the size, limits and counters of the store."""
+
+    def close(self) -> None:
+        """Release the resources of the store."""
+
+
+async def call_store(store: ResultStore, func: Callable[..., T], *args: Any) -> T:
+    """
+    Run an operation of a store from async code.
+
+    Operations of blocking stores, such as waiting for the SQLite write lock, run in a
+    worker thread, so they never stall the other requests on the event loop. Those of
+    in-memory stores run directly.
+    """
+    if store.blocking:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+class BoundedResultStore(ResultStore):
+    """
+    In-memory store of results, grouped (e.g. by session or tool) and bounded.
+
+    Entries are evicted least recently used first when a group holds more than
+    `max_entries_per_group` entries, or when all groups together hold more than
+    `max_entries` entries or `max_bytes` bytes. Entries older than their TTL are never
+    returned. The store is safe to use from several threads.
+    """
+
+    backend = CACHE_BACKEND_MEMORY
+    blocking = False
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_entries_per_group: Optional[int] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries across all groups. None means
+                unbounded.
+            max_entries_per_group: Maximum number of entries of one group. None
+                means unbounded.
+            max_bytes: Maximum approximate size in bytes of all results. None means
+                unbounded.
+            ttl: Default seconds after which an entry expires. None keeps entries
+                until they are evicted.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        validate_cache_limits(
+            max_entries=max_entries,
+            max_entries_per_group=max_entries_per_group,
+            max_bytes=max_bytes,
+            ttl=ttl,
+        )
+        self.max_entries = max_entries
+        self.max_entries_per_group = max_entries_per_group
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # group -> {key -> entry}, each in least recently used order
+        self._groups: Dict[str, "OrderedDict[str, _CacheEntry]"] = {}
+        # Every entry of every group, in least recently used order
+        self._lru: "OrderedDict[Tuple[str, str], _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.oversized = 0
+
+    def _remove(self, group: str, key: str) -> None:
+        """Remove an entry; the lock must be held."""
+        entry = self._lru.pop((group, key), None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        entries = self._groups.get(group)
+        if entries is not None:
+            entries.pop(key, None)
+            if not entries:
+                del self._groups[group]
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop expired entries from the least recently used end; the lock must be held."""
+        while self._lru:
+            (group, key), entry = next(iter(self._lru.items()))
+            if entry.expires_at is None or entry.expires_at > now:
+                break
+            self._remove(group, key)
+            self.expirations += 1
+
+    def _over_budget(self) -> bool:
+        return (self.max_entries is not None and len(self._lru) > self.max_entries) or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        )
+
+    def get(self, group: str, key: str) -> Optional[Any]:
+        """Return a stored result, or None if it is missing or expired."""
+        with self._lock:
+            entries = self._groups.get(group)
+            entry = entries.get(key) if entries else None
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(group, key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            entries.move_to_end(key)  # type: ignore[union-attr]
+            self._lru.move_to_end((group, key))
+            self.hits += 1
+            return entry.value
+
+    def set(
+        self, group: str, key: str, result: Any, ttl: Optional[float] = None
+    ) -> bool:
+        """
+        Store a result, evicting others as needed.
+
+        Args:
+            group: The group of the entry.
+            key: The key of the entry within its group.
+            result: The result. None is not stored.
+            ttl: Seconds after which the entry expires, instead of the default TTL.
+
+        Returns:
+            True if the result was stored, False if it is None or larger than the
+            byte budget.
+        """
+        if result is None:
+            # Indistinguishable from a miss, so there is no point in storing it
+            return False
+        size = approximate_size(result)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.oversized += 1
+            return False
+
+        ttl = ttl if ttl is not None else self.ttl
+        now = time.monotonic()
+        entry = _CacheEntry(result, size, now + ttl if ttl is not None else None)
+        with self._lock:
+            self._remove(group, key)
+            entries = self._groups.setdefault(group, OrderedDict())
+            entries[key] = entry
+            self._lru[(group, key)] = entry
+            self._bytes += size
+
+            self._evict_expired(now)
+            if (
+                self.max_entries_per_group is not None
+                and len(entries) > self.max_entries_per_group
+            ):
+                self._remove(group, next(iter(entries)))
+                self.evictions += 1
+            while self._over_budget():
+                self._remove(*next(iter(self._lru)))
+                self.evictions += 1
+        return True
+
+    def clear_group(self, group: str) -> None:
+        """Remove all entries of a group."""
+        with self._lock:
+            entries = self._groups.get(group)
+            if entries is None:
+                return
+            for key in list(entries):
+                self._remove(group, key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._groups.clear()
+            self._lru.clear()
+            self._bytes = 0
+
+    def compact(self) -> None:
+        """Remove expired entries, including those behind more recently used ones."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                group_key
+                for group_key, entry in self._lru.items()
+                if entry.expires_at is not None and entry.expires_at <= now
+            ]
+            for group, key in expired:
+                self._remove(group, key)
+            self.expirations += len(expired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the size, limits and counters of the store."""
+        with self._lock:
+            return {
+                "backend": self.backend,
+                "groups": len(self._groups),
+                "entries": len(self._lru),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "oversized": self.oversized,
+                "max_entries": self.max_entries,
+                "max_entries_per_group": self.max_entries_per_group,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+            }
+
 
 class SessionToolCallCache:
     """
-    Simple in-memory cache for tool call results per session.
+    Cache for tool call results per session, in memory unless another store is given.
     Used in stateful + JSON response mode to cache tool call results.
+
+    The cache is bounded: entries are evicted least recently used first when a
+    session holds more than `max_entries_per_session` entries, or when all sessions
+    together hold more than `max_entries` entries or `max_bytes` bytes. Entries
+    older than `ttl` seconds are never returned.
     """
 
-    def __init__(self):
-        self._cache: Dict[
-            str, Dict[str, Any]
-        ] = {}  # session_id -> {tool_call_key -> result}
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_entries_per_session: Optional[int] = DEFAULT_MAX_ENTRIES_PER_SESSION,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        ttl: Optional[float] = None,
+        store: Optional[ResultStore] = None,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of entries across all sessions. None means
+                unbounded.
+            max_entries_per_session: Maximum number of entries of one session. None
+                means unbounded.
+            max_bytes: Maximum approximate size in bytes of all cached results. None
+                means unbounded.
+            ttl: Seconds after which an entry expires. None keeps entries until they
+                are evicted.
+            store: The backend holding the results, grouped by session. When given,
+                the limits are those of the store and the other arguments are
+                ignored.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        self._store = (
+            store
+            if store is not None
+            else BoundedResultStore(
+                max_entries, max_entries_per_session, max_bytes, ttl
+            )
+        )
         logger.info("Initialized SessionToolCallCache for stateful JSON response mode")
 
-    def get_cache_key(self, tool_name: str, tool_args: Dict[str, Any]) -> str:
-        """Generate a cache key from tool name and arguments."""
-        import json
-        import hashlib
+    @property
+    def store(self) -> ResultStore:
+        """The backend holding the cached results."""
+        return self._store
 
-        # Create a deterministic key from tool name and sorted args
-        args_str = json.dumps(tool_args, sort_keys=True, default=str)
-        key_data = f"{tool_name}:{args_str}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+    def get_cache_key(self, tool_name: str, tool_args: Dict[str, Any]) -> Optional[str]:
+        """
+        Generate a cache key from tool name and arguments, or None if the arguments
+        have no canonical key (see `mcpy_cli.app_builder.call_keys`).
+        """
+        return call_key(tool_args, tool_name)
 
     def get(
         self, session_id: str, tool_name: str, tool_args: Dict[str, Any]
     ) -> Optional[Any]:
         """Get cached result for a tool call in a specific session."""
-        if session_id not in self._cache:
-            return None
-
         cache_key = self.get_cache_key(tool_name, tool_args)
-        result = self._cache[session_id].get(cache_key)
-
+        if cache_key is None:
+            return None
+        result = self._store.get(session_id, cache_key)
         if result is not None:
             logger.info(f"Cache hit for session {session_id}, tool {tool_name}")
-
         return result
 
     def set(
         self, session_id: str, tool_name: str, tool_args: Dict[str, Any], result: Any
     ) -> None:
         """Cache a tool call result for a specific session."""
-        if session_id not in self._cache:
-            self._cache[session_id] = {}
-
         cache_key = self.get_cache_key(tool_name, tool_args)
-        self._cache[session_id][cache_key] = result
-
-        logger.info(f"Cached result for session {session_id}, tool {tool_name}")
+        if cache_key is not None and self._store.set(session_id, cache_key, result):
+            logger.info(f"Cached result for session {session_id}, tool {tool_name}")
 
     def clear_session(self, session_id: str) -> None:
         """Clear all cached results for a specific session."""
-        if session_id in self._cache:
-            del self._cache[session_id]
-            logger.debug(f"Cleared cache for session {session_id}")
+        self._store.clear_group(session_id)
+        logger.debug(f"Cleared cache for session {session_id}")
+
+    async def clear_session_async(self, session_id: str) -> None:
+        """Clear all cached results of a session without blocking the event loop."""
+        await call_store(self._store, self.clear_session, session_id)
+
+    def clear(self) -> None:
+        """Clear cached results for all sessions."""
+        self._store.clear()
+        logger.debug("Cleared tool call cache for all sessions")
 
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_sessions = len(self._cache)
-        total_entries = sum(
-            len(session_cache) for session_cache in self._cache.values()
-        )
-        return {"total_sessions": total_sessions, "total_cached_entries": total_entries}
+        stats = self._store.get_stats()
+        return {
+            "total_sessions": stats.pop("groups"),
+            "total_cached_entries": stats.pop("entries"),
+            "max_entries_per_session": stats.pop("max_entries_per_group"),
+            **stats,
+        }
+
+    def create_cached_tool(
+        self, func: Callable[..., Any], tool_name: Optional[str] = None
+    ) -> Callable[..., Any]:
+        """
+        Create a cached version of a tool function.
+
+        The wrapper is async and awaits the results of async tools, so the result is
+        cached rather than a coroutine. It keeps the wrapped function's name,
+        docstring and signature, so FastMCP derives the same schema. Results are
+        cached per session, as returned by `get_current_session_id` for the task
+        running the call; calls without a session are not cached.
 
-    def create_cached_tool(self, func: Callable[..., Any]) -> Callable[..., Any]:
-        """Create a cached version of a tool function."""
+        Args:
+            func: The tool callable, synchronous or async. Results are keyed on
+                the arguments bound to its signature, so positional and keyword
+                forms of a call share a result.
+            tool_name: Name the results are cached under. Defaults to the function
+                name.
+
+        Returns:
+            An async callable suitable for FastMCP tool registration.
+        """
+        name = tool_name or func.__name__
 
         @functools.wraps(func)
-        def cached_wrapper(*args, **kwargs):
-            # Get current session ID
+        async def cached_wrapper(*args, **kwargs):
             session_id = get_current_session_id()
 
             if session_id is None:
                 # No session context, execute function directly
-                logger.info(
-                    f"No session context for {func.__name__}, executing directly"
-                )
-                return func(*args, **kwargs)
+                logger.debug(f"No session context for {name}, executing directly")
+                result = func(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
 
-            # Check cache first
-            cached_result = self.get(session_id, func.__name__, kwargs)
-            if cached_result is not None:
-                logger.info(f"Cache hit for {func.__name__} in session {session_id}")
-                return cached_result
+            arguments = bind_arguments(func, args, kwargs)
+            if arguments is not None:
+                cached_result = await call_store(
+                    self._store, self.get, session_id, name, arguments
+                )
+                if cached_result is not None:
+                    return cached_result
 
-            # Execute function and cache result
-            logger.info(
-                f"Cache miss for {func.__name__} in session {session_id}, executing function"
-            )
             result = func(*args, **kwargs)
-
-            # Cache the result
-            self.set(session_id, func.__name__, kwargs, result)
-            logger.info(f"Cached result for {func.__name__} in session {session_id}")
-
+            if inspect.isawaitable(result):
+                result = await result
+            if arguments is not None:
+                await call_store(
+                    self._store, self.set, session_id, name, arguments, result
+                )
             return result
 
         return cached_wrapper
+
+
+def default_cache_path(base_dir: pathlib.Path) -> pathlib.Path:
+    """
+    Default location of the SQLite cache of an application.
+
+    Like discovery manifests, caches live in the XDG cache directory
+    (``$XDG_CACHE_HOME`` or ``~/.cache``) under ``mcpy-cli/caches``, named after a hash
+    of the source directory, so applications serving different sources never share
+    results.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(pathlib.Path.home() / ".cache")
+    source_key = hashlib.sha256(str(base_dir.resolve()).encode()).hexdigest()[:16]
+    return pathlib.Path(cache_home) / "mcpy-cli" / "caches" / f"{source_key}.db"
+
+
+def create_result_store(
+    backend: str,
+    namespace: str,
+    db_path: Optional[Union[str, pathlib.Path]] = None,
+    max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+    max_entries_per_group: Optional[int] = None,
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    ttl: Optional[float] = None,
+) -> ResultStore:
+    """
+    Create a cache backend.
+
+    Args:
+        backend: "memory" or "sqlite".
+        namespace: Name telling apart the caches sharing one SQLite database.
+        db_path: The SQLite database file. Required for the "sqlite" backend.
+        max_entries: Maximum number of entries. None means unbounded.
+        max_entries_per_group: Maximum number of entries of one group. None means
+            unbounded.
+        max_bytes: Maximum size in bytes of all results. None means unbounded.
+        ttl: Default seconds after which entries expire. None keeps entries until
+            they are evicted.
+
+    Returns:
+        The store.
+
+    Raises:
+        ValueError: If the backend is unknown or a limit is not positive.
+    """
+    if backend == CACHE_BACKEND_MEMORY:
+        return BoundedResultStore(max_entries, max_entries_per_group, max_bytes, ttl)
+    if backend == CACHE_BACKEND_SQLITE:
+        if db_path is None:
+            raise ValueError("The sqlite cache backend requires a database path")
+        from .sqlite_cache import SQLiteResultStore
+
+        return SQLiteResultStore(
+            db_path, namespace, max_entries, max_entries_per_group, max_bytes, ttl
+        )
+    raise ValueError(
+        f"Unknown cache backend '{backend}', expected one of {', '.join(CACHE_BACKEND_CHOICES)}"
+    )
+
+
+class ResultStoreCompactor:
+    """
+    Compacts cache stores periodically in a background thread, so expired entries
+    do not linger until the bounds evict them.
+    """
+
+    def __init__(
+        self, stores: List[ResultStore], interval: float = DEFAULT_COMPACT_INTERVAL
+    ):
+        """
+        Args:
+            stores: The stores to compact.
+            interval: Seconds between compactions.
+
+        Raises:
+            ValueError: If the interval is not positive.
+        """
+        validate_cache_limits(compact_interval=interval)
+        self.stores = stores
+        self.interval = interval
+        self.compactions = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def compact(self) -> None:
+        """Compact every store once."""
+        for store in self.stores:
+            try:
+                store.compact()
+            except Exception as e:
+                logger.warning(f"Failed to compact the {store.backend} cache: {e}")
+        self.compactions += 1
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            self.compact()
+
+    def start(self) -> None:
+        """Start compacting in the background."""
+        if self._thread is not None or not self.stores:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop,),
+            name="mcpy-cache-compactor",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop compacting and release the stores' resources."""
+        self._stop.set()
+        if self._thread is not None and wait:
+            self._thread.join(timeout=self.interval)
+        self._thread = None
+        for store in self.stores:
+            store.close()
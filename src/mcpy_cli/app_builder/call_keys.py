@@ -0,0 +1,245 @@
+"""
+Canonical keys of tool calls for MCP applications.
+
+The session and pure tool caches and the call coalescer identify a call by a key
+derived from its arguments. The arguments are first bound to the tool's signature
+with defaults applied, so `f(1)`, `f(a=1)` and `f(a=1, b=<default>)` share a key.
+Every argument is then encoded to JSON with sorted keys, with orjson when it is
+installed and the standard library otherwise. Values JSON has no type for (bytes,
+sets, dates, decimals, paths, pydantic models, dataclasses, ...) are encoded with an
+explicit type tag, so they do not collide with a string of the same text. Values of
+any other type make a call unkeyable: it then runs without caching or coalescing,
+rather than risk two calls sharing a key through `str()`. As in the JSON the tool
+arguments arrive in, tuples are encoded like lists and dict keys as strings, and
+orjson encodes UUIDs and enums by their value; the values of one parameter have one
+type, so this does not merge calls.
+
+The encoding is hashed with xxh3-128 when xxhash is installed
+(`pip install mcpy-cli[fast]`) and with BLAKE2b otherwise, both much faster than the
+cryptographic hashes on large arguments.
+"""
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import hashlib
+import inspect
+import json
+import logging
+import math
+import pathlib
+import uuid
+import weakref
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - depends on the environment
+    xxhash = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Key of the type name in the encoding of values JSON has no type for
+TYPE_TAG = "__mcpy_type__"
+
+HASH_NAME = "xxh3_128" if xxhash is not None else "blake2b"
+
+if orjson is not None:
+    # Dates, dataclasses and subclasses of str, int, dict and list go to _typed
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+_JSON_TYPES: Tuple[Any, ...] = (str, int, float, dict, list, tuple)
+
+# Signatures of tool callables, or None for callables without one
+_signatures: "weakref.WeakKeyDictionary[Any, Optional[inspect.Signature]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _new_hash() -> Any:
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+def _tag(obj: Any, value: Any) -> Dict[str, Any]:
+    cls = type(obj)
+    return {TYPE_TAG: f"{cls.__module__}.{cls.__qualname__}", "value": value}
+
+
+def _typed(obj: Any) -> Any:
+    """Encode a value JSON has no type for with a type tag, for `default=`."""
+    if isinstance(obj, enum.Enum):
+        return _tag(obj, obj.value)
+    for base in _JSON_TYPES:
+        if isinstance(obj, base):
+            # A subclass of a JSON type, passed through by orjson
+            return _tag(obj, base(obj))
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return _tag(obj, bytes(obj).hex())
+    if isinstance(obj, (set, frozenset)):
+        # Sorted by encoding, as the items need not be comparable
+        return _tag(obj, sorted(encode_canonical(item).decode() for item in obj))
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return _tag(obj, obj.isoformat())
+    if isinstance(obj, datetime.timedelta):
+        return _tag(obj, [obj.days, obj.seconds, obj.microseconds])
+    if isinstance(obj, (decimal.Decimal, uuid.UUID, pathlib.PurePath, complex)):
+        return _tag(obj, str(obj))
+    if isinstance(obj, BaseModel):
+        return _tag(obj, obj.model_dump())
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _tag(
+            obj, {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        )
+    raise TypeError(
+        f"Cannot derive a canonical key from a value of type {type(obj).__qualname__}"
+    )
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether a JSON value contains NaN or an infinity, which orjson encodes as null."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        cls = type(item)
+        if cls is float:
+            if not math.isfinite(item):
+                return True
+        elif cls is dict:
+            stack.extend(item.values())
+        elif cls is list or cls is tuple:
+            stack.extend(item)
+    return False
+
+
+def _orjson_typed(obj: Any) -> Any:
+    """`_typed` for orjson, refusing tagged values that contain NaN or infinities."""
+    value = _typed(obj)
+    if _has_non_finite(value):
+        raise TypeError("NaN and infinities are encoded by the standard library")
+    return value
+
+
+def _stdlib_encode(value: Any) -> bytes:
+    return json.dumps(
+        value,
+        default=_typed,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def encode_canonical(value: Any) -> bytes:
+    """
+    Encode a value to canonical JSON.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The UTF-8 encoded JSON.
+
+    Raises:
+        TypeError: If the value contains a type that cannot be encoded canonically.
+        ValueError: If the value contains a circular reference.
+    """
+    if orjson is None:
+        return _stdlib_encode(value)
+    try:
+        encoded: bytes = orjson.dumps(
+            value, default=_orjson_typed, option=_ORJSON_OPTIONS
+        )
+    except orjson.JSONEncodeError:
+        # Integers beyond 64 bits, non-string dict keys, non-finite floats in a
+        # tagged value or an unkeyable value
+        return _stdlib_encode(value)
+    if b"null" in encoded and _has_non_finite(value):
+        # orjson encodes NaN and infinities as null; values without null in their
+        # encoding are not walked at all
+        return _stdlib_encode(value)
+    return encoded
+
+
+def _signature(func: Callable[..., Any]) -> Optional[inspect.Signature]:
+    try:
+        return _signatures[func]
+    except (KeyError, TypeError):
+        pass
+    try:
+        signature: Optional[inspect.Signature] = inspect.signature(func)
+    except (TypeError, ValueError):
+        signature = None
+    try:
+        _signatures[func] = signature
+    except TypeError:
+        # Not weakly referenceable; computed again on the next call
+        pass
+    return signature
+
+
+def bind_arguments(
+    func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Map the arguments of a call to the parameter names of the callable.
+
+    Args:
+        func: The tool callable.
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
+
+    Returns:
+        The arguments by parameter name, with defaults applied, or None if they do
+        not match the signature (the call itself will fail). Without a signature,
+        the keyword arguments, provided there are no positional ones.
+    """
+    signature = _signature(func)
+    if signature is None:
+        return None if args else dict(kwargs)
+    try:
+        bound = signature.bind(*args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def call_key(arguments: Mapping[str, Any], tool_name: str = "") -> Optional[str]:
+    """
+    Generate a canonical key of a call.
+
+    Args:
+        arguments: The arguments by parameter name, see `bind_arguments`.
+        tool_name: Name of the tool, to tell apart calls of different tools.
+
+    Returns:
+        The hex digest of the tool name and the canonically encoded arguments, or
+        None if an argument cannot be encoded canonically.
+    """
+    digest = _new_hash()
+    digest.update(tool_name.encode("utf-8"))
+    for name in sorted(arguments):
+        try:
+            encoded = encode_canonical(arguments[name])
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Call of '{tool_name}' has no canonical key: {e}")
+            return None
+        # JSON never contains a raw NUL, so the fields cannot run into each other
+        digest.update(b"\x00" + name.encode("utf-8") + b"\x00")
+        digest.update(encoded)
+    return str(digest.hexdigest())
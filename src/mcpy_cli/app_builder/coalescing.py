@@ -0,0 +1,176 @@
+"""
+Coalescing of identical concurrent tool calls for MCP applications.
+
+When many calls of the same tool with the same arguments arrive while one of them is
+still running, they all wait for that one execution ("singleflight") instead of
+running the tool again, and all receive its result or exception. Nothing is kept once
+the execution finishes; repeated calls after that run the tool again.
+
+Coalescing is opt-in per tool with the `coalesce` option: "session" merges calls
+within one session, "global" merges calls across sessions and should only be used
+for tools whose result does not depend on the caller.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..tool_options import COALESCE_GLOBAL
+from .call_keys import bind_arguments, call_key
+from .middleware import get_current_session_id
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One in-flight execution and the number of calls waiting for it."""
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class ToolCallCoalescer:
+    """
+    Shares one in-flight execution between identical concurrent tool calls.
+
+    The execution runs in its own task, so a waiting call that is cancelled does not
+    cancel it for the others; it is only cancelled when every waiting call is.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Tuple[Optional[str], str, str], _Flight] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def get_call_key(tool_args: Dict[str, Any]) -> Optional[str]:
+        """
+        Generate a canonical key from tool arguments, or None if they have none (see
+        `mcpy_cli.app_builder.call_keys`).
+        """
+        return call_key(tool_args)
+
+    def _tool_stats(self, tool_name: str) -> Dict[str, int]:
+        stats = self._stats.get(tool_name)
+        if stats is None:
+            stats = self._stats[tool_name] = {
+                "calls": 0,
+                "executions": 0,
+                "hits": 0,
+                "merged_executions": 0,
+            }
+        return stats
+
+    async def call(
+        self,
+        tool_name: str,
+        scope: str,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        Call a tool, joining an identical call that is already running.
+
+        Args:
+            tool_name: The tool key, used to tell tools apart and in statistics.
+            scope: "session" to merge calls of one session, "global" to merge calls
+                across sessions.
+            func: The tool callable, synchronous or async.
+            args: Positional arguments for the callable.
+            kwargs: Keyword arguments for the callable. Together with the positional
+                ones, bound to the signature, they identify the call.
+
+        Returns:
+            The result of the shared execution.
+        """
+        session_id = None if scope == COALESCE_GLOBAL else get_current_session_id()
+        arguments = bind_arguments(func, args, kwargs)
+        args_key = self.get_call_key(arguments) if arguments is not None else None
+        if args_key is None or (scope != COALESCE_GLOBAL and session_id is None):
+            # Calls without a canonical key, or without a session (calls of
+            # different clients cannot be told apart), run on their own
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        stats = self._tool_stats(tool_name)
+        stats["calls"] += 1
+        key = (session_id, tool_name, args_key)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start(key, func, args, kwargs)
+            stats["executions"] += 1
+        else:
+            stats["hits"] += 1
+            if flight.waiters == 1:
+                stats["merged_executions"] += 1
+            logger.debug(f"Joined in-flight call of tool '{tool_name}'")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Identical calls arriving before the task finishes start afresh
+                # instead of joining the cancelled one
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _start(
+        self,
+        key: Tuple[Optional[str], str, str],
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> _Flight:
+        async def execute() -> Any:
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        flight = _Flight(asyncio.ensure_future(execute()))
+        self._flights[key] = flight
+
+        def remove(task: "asyncio.Task[Any]") -> None:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+        flight.task.add_done_callback(remove)
+        return flight
+
+    def wrap_tool(
+        self, func: Callable[..., Any], tool_name: str, scope: str
+    ) -> Callable[..., Any]:
+        """
+        Wrap a tool so identical concurrent calls share one execution.
+
+        The wrapper keeps the wrapped function's name, docstring and signature, so
+        FastMCP derives the same schema as for the original function.
+        """
+
+        @functools.wraps(func)
+        async def coalesced_tool(*args, **kwargs):
+            return await self.call(tool_name, scope, func, args, kwargs)
+
+        return coalesced_tool
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing counters, in total and per tool."""
+        totals = {"calls": 0, "executions": 0, "hits": 0, "merged_executions": 0}
+        for tool_stats in self._stats.values():
+            for name, value in tool_stats.items():
+                totals[name] += value
+        return {
+            **totals,
+            "in_flight": len(self._flights),
+            "tools": {name: dict(stats) for name, stats in self._stats.items()},
+        }
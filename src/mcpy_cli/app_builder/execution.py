@@ -0,0 +1,726 @@
+"""
+Tool execution strategies for MCP applications.
+
+By default tools run inline: synchronous tools execute directly on the event loop,
+so a blocking call stalls every session served by the worker. With an executor,
+synchronous tools are offloaded and awaited instead; `async def` tools stay on the
+event loop unless a tool explicitly asks for the process pool.
+
+- "thread" runs tools in a bounded thread pool. This suits blocking I/O, but CPU-bound
+  pure-Python tools still share one core because of the GIL.
+- "process" runs tools in a pool of pre-warmed worker processes. Each worker imports
+  the tool modules by file path once; arguments and results are pickled. A call that
+  is cancelled while it runs has its worker killed and replaced.
+
+The executor is chosen globally and can be overridden per tool with
+`mcpy_cli.tool_options.tool_options(executor=...)`.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import multiprocessing
+import os
+import pathlib
+import queue
+import signal
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from pydantic import TypeAdapter
+
+from ..discovery import SHUTDOWN_HOOK, STARTUP_HOOK, module_registry
+from ..tool_options import (
+    EXECUTOR_CHOICES,
+    EXECUTOR_INLINE,
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    get_tool_options,
+)
+from .lifecycle import run_module_hook
+from .middleware import (
+    clear_current_session_id,
+    get_current_session_id,
+    set_current_session_id,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "EXECUTOR_CHOICES",
+    "EXECUTOR_INLINE",
+    "EXECUTOR_PROCESS",
+    "EXECUTOR_THREAD",
+    "ToolThreadPool",
+    "ToolProcessPool",
+    "ToolExecutors",
+    "is_async_callable",
+    "create_offloaded_tool",
+    "create_process_tool",
+]
+
+
+class ToolThreadPool:
+    """
+    Bounded thread pool that runs synchronous tools off the event loop.
+
+    Calls beyond `max_workers` wait in the executor queue. The pool tracks how many
+    calls are queued and how many threads are busy, see `get_stats`.
+
+    Threads cannot be interrupted: a call cancelled while it runs (for example because
+    it timed out) is abandoned, it keeps its thread until the function returns and its
+    result is discarded.
+    """
+
+    out_of_process = False
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Maximum number of concurrently running tool calls. Defaults
+                to the `ThreadPoolExecutor` default of min(32, CPU count + 4).
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mcpy-tool"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self.completed = 0
+        self.abandoned = 0
+        logger.info(f"Initialized tool thread pool with {self.max_workers} thread(s)")
+
+    def _invoke(
+        self,
+        context: contextvars.Context,
+        session_id: Optional[str],
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        # Carry the caller's session over to the worker thread so session-scoped
+        # features such as the tool call cache keep working
+        if session_id is not None:
+            set_current_session_id(session_id)
+        try:
+            return context.run(func, *args, **kwargs)
+        finally:
+            clear_current_session_id()
+            with self._lock:
+                self._active -= 1
+                self.completed += 1
+
+    def _on_done(self, future: Any) -> None:
+        # A call cancelled while still queued never reaches _invoke
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a synchronous callable in the pool and await its result.
+
+        Args:
+            func: The callable to run.
+            *args: Positional arguments for the callable.
+            **kwargs: Keyword arguments for the callable.
+
+        Returns:
+            The callable's return value.
+        """
+        with self._lock:
+            self._queued += 1
+        future = self._executor.submit(
+            self._invoke,
+            contextvars.copy_context(),
+            get_current_session_id(),
+            func,
+            args,
+            kwargs,
+        )
+        future.add_done_callback(self._on_done)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # Queued calls are cancelled; running ones can only be abandoned
+            if not future.cancelled():
+                with self._lock:
+                    self.abandoned += 1
+                logger.warning(
+                    f"Abandoned a running call of {func!r} in the tool thread pool"
+                )
+            raise
+
+    def for_tool(
+        self,
+        func: Optional[Callable[..., Any]],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Optional["ToolThreadPool"]:
+        """Return this pool for synchronous tools and None for async tools."""
+        if func is not None and is_async_callable(func):
+            return None
+        return self
+
+    def wrap_tool(
+        self, func: Callable[..., Any], func_name: str, file_path: Any
+    ) -> Callable[..., Any]:
+        """Wrap a synchronous tool so its calls run in this pool."""
+        return create_offloaded_tool(func, self)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool gauges and counters."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "active_threads": self._active,
+                "completed": self.completed,
+                "abandoned": self.abandoned,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting calls and release the worker threads."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def is_async_callable(func: Callable[..., Any]) -> bool:
+    """Whether calling `func` returns an awaitable that must stay on the event loop."""
+    if inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func):
+        return True
+    call = getattr(func, "__call__", None)
+    return inspect.iscoroutinefunction(call)
+
+
+def create_offloaded_tool(
+    func: Callable[..., Any], thread_pool: ToolThreadPool
+) -> Callable[..., Any]:
+    """
+    Wrap a synchronous tool so that each call runs in the thread pool.
+
+    The wrapper keeps the wrapped function's name, docstring and signature, so
+    FastMCP derives the same schema as for the original function.
+
+    Args:
+        func: The synchronous tool function.
+        thread_pool: The pool to run calls in.
+
+    Returns:
+        An async callable suitable for FastMCP tool registration.
+    """
+
+    @functools.wraps(func)
+    async def offloaded_tool(*args, **kwargs):
+        return await thread_pool.run(func, *args, **kwargs)
+
+    return offloaded_tool
+
+
+# Worker process state, set up by _process_worker_init in each worker
+_worker_base_dir: Optional[pathlib.Path] = None
+_worker_adapters: Dict[Tuple[str, str], Tuple[Any, TypeAdapter]] = {}
+# The module version of each file whose startup hook ran in this worker
+_worker_modules: Dict[str, Any] = {}
+
+
+def _process_worker_start(file_path: str, module: Any) -> None:
+    """Run the lifecycle hooks of a module (re)imported by a worker process."""
+    previous = _worker_modules.get(file_path)
+    if previous is module:
+        return
+    if previous is not None:
+        run_module_hook(previous, SHUTDOWN_HOOK)
+    _worker_modules[file_path] = module
+    run_module_hook(module, STARTUP_HOOK)
+
+
+def _process_worker_init(file_paths: List[str], base_dir: Optional[str]) -> None:
+    """Import the tool modules and start them once when a worker process starts."""
+    global _worker_base_dir
+    _worker_base_dir = pathlib.Path(base_dir) if base_dir else None
+    for file_path in file_paths:
+        module = module_registry.load(pathlib.Path(file_path), _worker_base_dir)
+        if module is None:
+            logger.error(f"Tool worker {os.getpid()} failed to import {file_path}")
+        else:
+            _process_worker_start(file_path, module)
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _process_worker_call(
+    file_path: str,
+    func_name: str,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    validate: bool,
+) -> Any:
+    """
+    Run a tool function inside a worker process.
+
+    The module is taken from the worker's module registry, so it is imported once per
+    worker and again only after the file changed. With `validate`, the keyword
+    arguments are validated against the function signature first (used by lazy
+    tools, whose arguments are not validated by the server).
+    """
+    module = module_registry.load(pathlib.Path(file_path), _worker_base_dir)
+    if module is None:
+        raise ImportError(f"Failed to load tool module from {file_path}")
+    _process_worker_start(file_path, module)
+    func = getattr(module, func_name, None)
+    if func is None or not callable(func):
+        raise AttributeError(f"Function '{func_name}' no longer exists in {file_path}")
+
+    if validate:
+        cached = _worker_adapters.get((file_path, func_name))
+        if cached is None or cached[0] is not func:
+            cached = (func, TypeAdapter(func))
+            _worker_adapters[(file_path, func_name)] = cached
+        result = cached[1].validate_python(kwargs)
+    else:
+        result = func(*args, **kwargs)
+
+    if inspect.isawaitable(result):
+        result = asyncio.run(_await(result))
+    return result
+
+
+def _process_worker_main(
+    conn: Any, file_paths: List[str], base_dir: Optional[str]
+) -> None:
+    """Entry point of a worker process: serve calls from the pipe until told to stop."""
+    # Interrupts are handled by the server, which stops the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _process_worker_init(file_paths, base_dir)
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+        try:
+            reply = (True, _process_worker_call(*request))
+        except Exception as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except (EOFError, OSError):
+            break
+        except Exception as e:
+            # The result or exception could not be pickled; nothing was sent yet
+            conn.send(
+                (False, RuntimeError(f"Tool result could not be sent back: {e!r}"))
+            )
+    for module in _worker_modules.values():
+        run_module_hook(module, SHUTDOWN_HOOK)
+
+
+class ToolCallKilledError(RuntimeError):
+    """The worker process running a tool call was killed before it finished."""
+
+
+class _ProcessCall:
+    """A tool call queued for or running in a worker process."""
+
+    def __init__(self, request: Tuple[Any, ...]):
+        self.request = request
+        self.future: Future = Future()
+        # The worker process running the call, while it runs
+        self.process: Optional[Any] = None
+        self.killed = False
+        # Set when the call is cancelled before it reaches a worker
+        self.cancelled = False
+
+
+class ToolProcessPool:
+    """
+    Persistent pool of worker processes that runs CPU-bound tools in parallel.
+
+    Workers are started with the "spawn" method and import every tool file routed to
+    the pool once, by file path and under the same module names as the server, so
+    calls only ship the file path, function name, arguments and result. A worker
+    re-imports a tool file that changed on disk on its next call.
+
+    Each worker is driven by its own manager thread. When a call is cancelled while
+    it runs (for example because it timed out), only the worker running it is killed
+    and replaced; calls in the other workers are unaffected. A worker that dies on its
+    own is replaced as well.
+    """
+
+    out_of_process = True
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        base_dir: Optional[pathlib.Path] = None,
+    ):
+        """
+        Args:
+            max_workers: Number of worker processes. Defaults to the CPU count.
+            base_dir: Base directory of the tool files, used to derive module names.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.base_dir = base_dir
+        self._context = multiprocessing.get_context("spawn")
+        self._file_paths: Set[pathlib.Path] = set()
+        self._calls: "queue.Queue[Optional[_ProcessCall]]" = queue.Queue()
+        self._managers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self._pending = 0
+        self._busy = 0
+        self.completed = 0
+        self.killed = 0
+        self.restarts = 0
+
+    def _spawn(self) -> Tuple[Any, Any]:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_process_worker_main,
+            args=(
+                child_conn,
+                sorted(str(path) for path in self._file_paths),
+                str(self.base_dir) if self.base_dir else None,
+            ),
+            name="mcpy-tool-worker",
+            # Daemonic, so workers never outlive the server
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _manage_worker(self) -> None:
+        """Feed queued calls to one worker process, replacing it when it dies."""
+        process, conn = self._spawn()
+        try:
+            while True:
+                call = self._calls.get()
+                if call is None:
+                    break
+                with self._lock:
+                    self._pending -= 1
+                if not call.future.set_running_or_notify_cancel():
+                    continue
+                if not self._run_call(process, conn, call):
+                    conn.close()
+                    process.join(timeout=1)
+                    process, conn = self._spawn()
+        finally:
+            try:
+                conn.send(None)
+            except Exception:
+                pass
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+            conn.close()
+
+    def _run_call(self, process: Any, conn: Any, call: _ProcessCall) -> bool:
+        """Run a call in a worker. Returns False if the worker has to be replaced."""
+        with self._lock:
+            cancelled = call.cancelled
+            if not cancelled:
+                self._busy += 1
+                call.process = process
+        if cancelled:
+            # Cancelled after the call was taken from the queue, before it was sent
+            call.future.set_exception(
+                ToolCallKilledError("The tool call was cancelled before it started")
+            )
+            return True
+        alive = True
+        reply: Tuple[bool, Any] = (False, None)
+        try:
+            conn.send(call.request)
+            reply = conn.recv()
+        except (EOFError, OSError):
+            alive = False
+        except Exception as e:
+            # The arguments could not be pickled; nothing was sent to the worker
+            reply = (False, e)
+
+        with self._lock:
+            call.process = None
+            self._busy -= 1
+            self.completed += 1
+            killed = call.killed
+            if not alive and not killed:
+                self.restarts += 1
+
+        if killed:
+            call.future.set_exception(
+                ToolCallKilledError("The tool call was cancelled and its worker killed")
+            )
+            return False
+        if not alive:
+            logger.error("A tool worker process died, starting a new one")
+            call.future.set_exception(
+                ToolCallKilledError("The tool worker process died during the call")
+            )
+            return False
+        ok, value = reply
+        if ok:
+            call.future.set_result(value)
+        else:
+            call.future.set_exception(value)
+        return True
+
+    def _kill(self, call: _ProcessCall) -> None:
+        """Kill the worker running a call, if the call is still running."""
+        with self._lock:
+            if call.process is None:
+                # Not sent to a worker yet; `_run_call` fails it instead of sending it
+                call.cancelled = True
+                return
+            call.killed = True
+            self.killed += 1
+            call.process.kill()
+        logger.warning(f"Killed the tool worker running {call.request[1]}")
+
+    def start(self) -> None:
+        """Start all workers now so they import the tool modules before the first call."""
+        with self._lock:
+            if self._started or self._closed:
+                return
+            self._started = True
+        for index in range(self.max_workers):
+            manager = threading.Thread(
+                target=self._manage_worker, name=f"mcpy-process-{index}", daemon=True
+            )
+            manager.start()
+            self._managers.append(manager)
+        logger.info(
+            f"Starting tool process pool with {self.max_workers} worker(s) for "
+            f"{len(self._file_paths)} file(s)"
+        )
+
+    async def call(
+        self,
+        file_path: pathlib.Path,
+        func_name: str,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        validate: bool = False,
+    ) -> Any:
+        """
+        Call a tool function in a worker process and await its result.
+
+        If the awaiting task is cancelled while the call runs, the worker running it
+        is killed and replaced.
+
+        Args:
+            file_path: The file that defines the function.
+            func_name: The module-level name of the function.
+            args: Positional arguments, pickled to the worker.
+            kwargs: Keyword arguments, pickled to the worker.
+            validate: Validate `kwargs` against the function signature in the worker.
+
+        Returns:
+            The function's return value, pickled back from the worker.
+        """
+        if self._closed:
+            raise RuntimeError("The tool process pool is shut down")
+        self.start()
+        call = _ProcessCall((str(file_path), func_name, args, kwargs or {}, validate))
+        with self._lock:
+            self._pending += 1
+        self._calls.put(call)
+        try:
+            return await asyncio.wrap_future(call.future)
+        except asyncio.CancelledError:
+            self._kill(call)
+            raise
+
+    def for_tool(
+        self,
+        func: Optional[Callable[..., Any]],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Optional["ToolProcessPool"]:
+        """Return this pool for synchronous tools and None for async tools."""
+        if func is not None and is_async_callable(func):
+            return None
+        return self
+
+    def wrap_tool(
+        self, func: Callable[..., Any], func_name: str, file_path: pathlib.Path
+    ) -> Callable[..., Any]:
+        """Wrap a tool so its calls run in a worker process."""
+        self._file_paths.add(file_path)
+        return create_process_tool(func, func_name, file_path, self)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool gauges and counters."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "pending_calls": self._pending,
+                "busy_workers": self._busy,
+                "completed": self.completed,
+                "killed": self.killed,
+                "restarts": self.restarts,
+                "tool_files": len(self._file_paths),
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop the worker processes once they finish their current call.
+
+        Args:
+            wait: Wait for the workers to stop.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for _ in self._managers:
+            self._calls.put(None)
+        if wait:
+            for manager in self._managers:
+                manager.join()
+
+
+def create_process_tool(
+    func: Callable[..., Any],
+    func_name: str,
+    file_path: pathlib.Path,
+    process_pool: ToolProcessPool,
+) -> Callable[..., Any]:
+    """
+    Wrap a tool so that each call runs in the process pool.
+
+    The function itself is never pickled: workers look it up by file path and name.
+    The wrapper keeps the function's name, docstring and signature, so FastMCP derives
+    the same schema and validates arguments before they are sent to a worker.
+
+    Args:
+        func: The tool function, as loaded by discovery.
+        func_name: The module-level name of the function.
+        file_path: The file that defines the function.
+        process_pool: The pool to run calls in.
+
+    Returns:
+        An async callable suitable for FastMCP tool registration.
+    """
+
+    @functools.wraps(func)
+    async def process_tool(*args, **kwargs):
+        return await process_pool.call(file_path, func_name, args, kwargs)
+
+    return process_tool
+
+
+class ToolExecutors:
+    """
+    The executors of an application: a global default plus per-tool overrides.
+
+    A tool runs in the executor named by its `tool_options(executor=...)`, or in the
+    default executor otherwise. Pools are created when the first tool needs them. By
+    default async tools stay on the event loop; only an explicit per-tool "process"
+    option moves them into a worker process.
+    """
+
+    def __init__(
+        self,
+        default: str = EXECUTOR_INLINE,
+        max_workers: Optional[int] = None,
+        base_dir: Optional[pathlib.Path] = None,
+    ):
+        """
+        Args:
+            default: The executor used by tools without their own option.
+            max_workers: Size of the default executor's pool. Other pools use their
+                own defaults.
+            base_dir: Base directory of the tool files, used by the process pool.
+
+        Raises:
+            ValueError: If `default` is not a known executor.
+        """
+        if default not in EXECUTOR_CHOICES:
+            raise ValueError(
+                f"Invalid executor '{default}', expected one of {', '.join(EXECUTOR_CHOICES)}"
+            )
+        self.default = default
+        self.max_workers = max_workers
+        self.base_dir = base_dir
+        self.thread_pool: Optional[ToolThreadPool] = None
+        self.process_pool: Optional[ToolProcessPool] = None
+
+    def _workers_for(self, kind: str) -> Optional[int]:
+        return self.max_workers if kind == self.default else None
+
+    def get(self, kind: str) -> Optional[Union[ToolThreadPool, ToolProcessPool]]:
+        """Return the executor of a kind, creating its pool on first use."""
+        if kind == EXECUTOR_THREAD:
+            if self.thread_pool is None:
+                self.thread_pool = ToolThreadPool(self._workers_for(kind))
+            return self.thread_pool
+        if kind == EXECUTOR_PROCESS:
+            if self.process_pool is None:
+                self.process_pool = ToolProcessPool(
+                    self._workers_for(kind), self.base_dir
+                )
+            return self.process_pool
+        return None
+
+    def for_tool(
+        self,
+        func: Optional[Callable[..., Any]],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Union[ToolThreadPool, ToolProcessPool]]:
+        """
+        Return the executor a tool runs in, or None if it runs inline.
+
+        Args:
+            func: The tool function, or None if it is not loaded (lazy tools).
+            options: The tool's effective options (see `ToolLimits.options_for`).
+                Defaults to the options declared with `tool_options`.
+        """
+        if options is None:
+            options = get_tool_options(func)
+        kind = options.get("executor")
+        if kind is None:
+            executor = self.get(self.default)
+            return executor.for_tool(func) if executor is not None else None
+        if kind == EXECUTOR_THREAD and func is not None and is_async_callable(func):
+            return None
+        return self.get(kind)
+
+    def wrap_tool(
+        self, func: Callable[..., Any], func_name: str, file_path: pathlib.Path
+    ) -> Callable[..., Any]:
+        """Wrap a tool for the executor it runs in."""
+        executor = self.for_tool(func)
+        if executor is None:
+            return func
+        return executor.wrap_tool(func, func_name, file_path)
+
+    def start(self) -> None:
+        """Start the worker processes, if any tool runs in the process pool."""
+        if self.process_pool is not None:
+            self.process_pool.start()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the statistics of every pool in use."""
+        stats: Dict[str, Any] = {"default": self.default}
+        if self.thread_pool is not None:
+            stats[EXECUTOR_THREAD] = self.thread_pool.get_stats()
+        if self.process_pool is not None:
+            stats[EXECUTOR_PROCESS] = self.process_pool.get_stats()
+        return stats
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down every pool in use."""
+        for pool in (self.thread_pool, self.process_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait)
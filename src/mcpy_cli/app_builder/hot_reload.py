@@ -0,0 +1,330 @@
+"""
+Incremental hot reload for MCP applications.
+
+Instead of restarting the server, the reloader watches the source tree and, when a
+file changes, rebuilds only that file's FastMCP instance and swaps it into the running
+application. Changes are detected with `watchfiles` (inotify, FSEvents, ...) when it
+is installed and by polling file fingerprints otherwise.
+"""
+
+import asyncio
+import logging
+import pathlib
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from starlette.routing import Mount
+
+from ..utils.path_utils import iter_python_files, load_ignore_rules
+
+logger = logging.getLogger(__name__)
+
+InstanceMap = Dict[pathlib.Path, Tuple[Any, str, int]]
+
+
+class ComposedReloadTarget:
+    """
+    Swaps per-file FastMCP instances mounted on the composed `main_mcp` server.
+
+    Re-mounting a prefix replaces a single entry of the server's mount table, so
+    sessions stay open and only calls to the changed file's tools see new code.
+    """
+
+    def __init__(self, main_mcp: Any, mount_instance: Callable[[Any, str, Any], None]):
+        self.main_mcp = main_mcp
+        self.mount_instance = mount_instance
+
+    async def swap(self, route_path: str, file_mcp: Any) -> None:
+        self.mount_instance(self.main_mcp, route_path, file_mcp)
+
+    async def remove(self, route_path: str) -> None:
+        if route_path in getattr(self.main_mcp, "_mounted_servers", {}):
+            self.main_mcp.unmount(route_path)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class RoutedReloadTarget:
+    """
+    Swaps the per-file ASGI apps mounted on a routed Starlette application.
+
+    A replacement app's lifespan (its session manager) is started before the app is
+    swapped into the route list, and stopped when the app is replaced again or the
+    server shuts down. Apps created at startup keep running under the application
+    lifespan. Only sessions on the changed route are affected by a swap.
+    """
+
+    def __init__(self, app: Any, create_file_app: Callable[[Any], Any]):
+        self.app = app
+        self.create_file_app = create_file_app
+        self._stacks: Dict[str, AsyncExitStack] = {}
+
+    def _route_index(self, route_path: str) -> Optional[int]:
+        path = "/" + route_path
+        for index, route in enumerate(self.app.router.routes):
+            if isinstance(route, Mount) and route.path == path:
+                return index
+        return None
+
+    async def _close(self, route_path: str) -> None:
+        stack = self._stacks.pop(route_path, None)
+        if stack is not None:
+            await stack.aclose()
+
+    async def swap(self, route_path: str, file_mcp: Any) -> None:
+        file_app = self.create_file_app(file_mcp)
+        stack = AsyncExitStack()
+        await stack.enter_async_context(file_app.router.lifespan_context(file_app))
+
+        mount = Mount("/" + route_path, app=file_app)
+        index = self._route_index(route_path)
+        if index is None:
+            self.app.router.routes.append(mount)
+        else:
+            self.app.router.routes[index] = mount
+
+        await self._close(route_path)
+        self._stacks[route_path] = stack
+
+    async def remove(self, route_path: str) -> None:
+        index = self._route_index(route_path)
+        if index is not None:
+            del self.app.router.routes[index]
+        await self._close(route_path)
+
+    async def aclose(self) -> None:
+        for route_path in list(self._stacks):
+            await self._close(route_path)
+
+
+class HotReloader:
+    """
+    Watches a source tree and applies file changes to a running application.
+    """
+
+    def __init__(
+        self,
+        source_path: pathlib.Path,
+        base_dir: pathlib.Path,
+        mcp_instances: InstanceMap,
+        build_instances: Callable[
+            [List[pathlib.Path]], Tuple[InstanceMap, List[pathlib.Path]]
+        ],
+        target: Any,
+        poll_interval: float = 1.0,
+        scan_max_depth: Optional[int] = None,
+        on_reload: Optional[Callable[[], None]] = None,
+        lifecycle: Optional[Any] = None,
+    ):
+        """
+        Args:
+            source_path: The source file or directory being served.
+            base_dir: Base directory of the discovered source files.
+            mcp_instances: The application's instance map. It is updated in place.
+            build_instances: Rebuilds the instances of the given files and returns
+                (instances, files that failed to load).
+            target: The ComposedReloadTarget or RoutedReloadTarget to swap into.
+            poll_interval: Seconds between scans when polling for changes.
+            scan_max_depth: Maximum directory depth that is watched.
+            on_reload: Optional callback invoked after every applied change set.
+            lifecycle: Optional ModuleLifecycle that restarts reloaded modules.
+        """
+        self.source_path = source_path
+        self._single_file = source_path.suffix == ".py"
+        self.base_dir = base_dir
+        self.mcp_instances = mcp_instances
+        self.build_instances = build_instances
+        self.target = target
+        self.poll_interval = poll_interval
+        self.scan_max_depth = scan_max_depth
+        self.on_reload = on_reload
+        self.lifecycle = lifecycle
+        self._ignore_rules = load_ignore_rules(base_dir)
+        self._fingerprints: Optional[Dict[pathlib.Path, Tuple[int, int]]] = None
+        self._lock = asyncio.Lock()
+        self.reloads = 0
+        self.last_reload_ms = 0.0
+
+    def is_watched(self, file_path: pathlib.Path) -> bool:
+        """Whether a changed path belongs to the served source files."""
+        if self._single_file:
+            return file_path == self.source_path
+        if file_path.suffix != ".py":
+            return False
+        try:
+            relative_path = file_path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return False
+        if (
+            self.scan_max_depth is not None
+            and relative_path.count("/") > self.scan_max_depth
+        ):
+            return False
+        return not self._ignore_rules.is_path_excluded(relative_path)
+
+    def _snapshot(self) -> Dict[pathlib.Path, Tuple[int, int]]:
+        """Fingerprint every watched file by (mtime_ns, size)."""
+        if self._single_file:
+            paths = [self.source_path]
+        else:
+            paths = list(iter_python_files(self.base_dir, self.scan_max_depth))
+        fingerprints = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            fingerprints[path] = (stat.st_mtime_ns, stat.st_size)
+        return fingerprints
+
+    def poll_changes(self) -> Set[pathlib.Path]:
+        """
+        Compare the source tree against the previous scan.
+
+        The first call records the baseline and reports no changes.
+
+        Returns:
+            Files that were modified, added or deleted since the previous call.
+        """
+        current = self._snapshot()
+        previous = self._fingerprints
+        self._fingerprints = current
+        if previous is None:
+            return set()
+        changed = {
+            path
+            for path, fingerprint in current.items()
+            if previous.get(path) != fingerprint
+        }
+        changed.update(path for path in previous if path not in current)
+        return changed
+
+    async def apply_changes(self, changed_paths: Set[pathlib.Path]) -> Dict[str, int]:
+        """
+        Rebuild the instances of changed files and swap them into the application.
+
+        Files that fail to import keep serving their previous instance.
+
+        Args:
+            changed_paths: Files that were modified, added or deleted.
+
+        Returns:
+            Counts of "updated", "added", "removed" and "failed" files.
+        """
+        counts = {"updated": 0, "added": 0, "removed": 0, "failed": 0}
+        if not changed_paths:
+            return counts
+
+        async with self._lock:
+            start = time.perf_counter()
+            existing = sorted(path for path in changed_paths if path.exists())
+            rebuilt: InstanceMap = {}
+            failed: List[pathlib.Path] = []
+            if existing:
+                rebuilt, failed = await asyncio.to_thread(
+                    self.build_instances, existing
+                )
+
+            applied: List[pathlib.Path] = []
+            for file_path in sorted(changed_paths):
+                previous = self.mcp_instances.get(file_path)
+                instance = rebuilt.get(file_path)
+                if file_path in failed:
+                    logger.error(
+                        f"Hot reload of {file_path} failed, keeping the previous version"
+                    )
+                    counts["failed"] += 1
+                elif instance is not None:
+                    file_mcp, route_path, _ = instance
+                    if previous is not None and previous[1] != route_path:
+                        await self.target.remove(previous[1])
+                    await self.target.swap(route_path, file_mcp)
+                    self.mcp_instances[file_path] = instance
+                    counts["updated" if previous is not None else "added"] += 1
+                    applied.append(file_path)
+                elif previous is not None:
+                    await self.target.remove(previous[1])
+                    del self.mcp_instances[file_path]
+                    counts["removed"] += 1
+                    applied.append(file_path)
+
+            if self.lifecycle is not None:
+                await self.lifecycle.reload(applied)
+            if self.on_reload is not None:
+                self.on_reload()
+            self.reloads += 1
+            self.last_reload_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                f"Hot reload applied to {len(changed_paths)} file(s) in "
+                f"{self.last_reload_ms:.1f} ms: {counts}"
+            )
+        return counts
+
+    async def _watch_with_watchfiles(self, awatch: Callable[..., Any]) -> None:
+        watch_path = self.source_path if self._single_file else self.base_dir
+        logger.info(f"Hot reload watching {watch_path} with watchfiles")
+        async for changes in awatch(watch_path):
+            changed = {
+                pathlib.Path(path)
+                for _, path in changes
+                if self.is_watched(pathlib.Path(path))
+            }
+            await self.apply_changes(changed)
+
+    async def _watch_with_polling(self) -> None:
+        logger.info(
+            f"Hot reload polling {self.base_dir} every {self.poll_interval:g}s "
+            "(install 'watchfiles' for native file system events)"
+        )
+        if self._fingerprints is None:
+            await asyncio.to_thread(self.poll_changes)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            changed = await asyncio.to_thread(self.poll_changes)
+            await self.apply_changes(changed)
+
+    async def run(self) -> None:
+        """Watch for changes until cancelled."""
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            await self._watch_with_polling()
+        else:
+            await self._watch_with_watchfiles(awatch)
+
+    def wrap_lifespan(self, lifespan_context: Callable[[Any], Any]) -> Callable:
+        """
+        Wrap an application lifespan so the watcher runs while the server is up.
+
+        Args:
+            lifespan_context: The application's existing lifespan context factory.
+
+        Returns:
+            A lifespan context factory suitable for `router.lifespan_context`.
+        """
+
+        @asynccontextmanager
+        async def lifespan(app):
+            async with lifespan_context(app) as state:
+                task = asyncio.create_task(self._run_safely())
+                try:
+                    yield state
+                finally:
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+                    await self.target.aclose()
+
+        return lifespan
+
+    async def _run_safely(self) -> None:
+        try:
+            await self.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Hot reload watcher stopped: {e}", exc_info=True)
@@ -7,36 +7,54 @@ import os
 import pathlib
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from ..discovery import discover_py_files, discover_functions
+from ..discovery import discover_py_files, discover_functions, module_registry
+from ..static_discovery import (
+    StaticFunctionInfo,
+    _parse_module,
+    discover_functions_static,
+)
+from ..tool_options import TOOL_OPTIONS_ATTR
 from ..utils import TransformationError, normalize_path
+from ..utils.profiling import profile_phase
+from ..utils.serialization import serialize_tool_result
 from .mocking import get_fastmcp_class, FastMCPType
 from .routing import get_route_from_path, validate_resource_prefix
-from .validation import validate_and_wrap_tool, get_module_docstring
+from .validation import (
+    build_tool_description,
+    validate_and_wrap_tool,
+    wrap_tool_function,
+    get_module_docstring,
+    get_registered_tool_schema,
+)
 from .caching import SessionToolCallCache
+from .manifest import DiscoveryManifest
+from .lazy_loading import LazyModuleLoader, create_lazy_tool
+from .limits import ToolLimits
+from .tool_errors import install_tool_error_passthrough
 
 logger = logging.getLogger(__name__)
 
 
-def discover_and_group_functions(
-    source_path_str: str, target_function_names: Optional[List[str]] = None
-) -> Tuple[Dict[pathlib.Path, List[Tuple[Callable[..., Any], str]]], pathlib.Path]:
+def _discover_source_files(
+    source_path_str: str,
+    scan_max_depth: Optional[int] = None,
+) -> Tuple[List[pathlib.Path], pathlib.Path]:
     """
-    Discovers Python files, extracts functions, and groups them by file path.
+    Discovers the Python files of a source path and its base directory.
 
     Args:
         source_path_str: Path to the Python file or directory containing functions.
-        target_function_names: Optional list of function names to expose. If None, all are exposed.
+        scan_max_depth: Optional maximum directory depth to scan.
 
     Returns:
-        A tuple containing:
-        - Dictionary mapping file paths to lists of (function, function_name) tuples
-        - Base directory path for relative path calculations
+        A tuple of (Python files, base directory for relative path calculations).
 
     Raises:
-        TransformationError: If no Python files or functions are found.
+        TransformationError: If no Python files are found.
     """
     try:
-        py_files = discover_py_files(source_path_str)
+        with profile_phase("scan"):
+            py_files = discover_py_files(source_path_str, max_depth=scan_max_depth)
     except (FileNotFoundError, ValueError) as e:
         logger.error(f"Error discovering Python files: {e}")
         raise TransformationError(f"Failed to discover Python files: {e}")
@@ -64,18 +82,56 @@ def discover_and_group_functions(
     else:
         base_dir = source_path
 
-    functions_to_wrap = discover_functions(py_files, target_function_names)
+    return py_files, base_dir
+
+
+def _no_functions_error(
+    target_function_names: Optional[List[str]],
+) -> TransformationError:
+    """Builds the error raised when discovery finds nothing to wrap."""
+    message = "No functions found to wrap as MCP tools."
+    if target_function_names:
+        message += f" (Specified functions: {target_function_names} not found, or no functions in source matching criteria)."
+    else:
+        message += " (No functions discovered in the source path matching criteria)."
+    logger.error(message)
+    return TransformationError(message)
+
+
+def discover_and_group_functions(
+    source_path_str: str,
+    target_function_names: Optional[List[str]] = None,
+    discovery_workers: Optional[int] = None,
+    scan_max_depth: Optional[int] = None,
+) -> Tuple[Dict[pathlib.Path, List[Tuple[Callable[..., Any], str]]], pathlib.Path]:
+    """
+    Discovers Python files, extracts functions, and groups them by file path.
+
+    Args:
+        source_path_str: Path to the Python file or directory containing functions.
+        target_function_names: Optional list of function names to expose. If None, all are exposed.
+        discovery_workers: Optional number of threads used to import files concurrently.
+        scan_max_depth: Optional maximum directory depth to scan.
+
+    Returns:
+        A tuple containing:
+        - Dictionary mapping file paths to lists of (function, function_name) tuples
+        - Base directory path for relative path calculations
+
+    Raises:
+        TransformationError: If no Python files or functions are found.
+    """
+    py_files, base_dir = _discover_source_files(source_path_str, scan_max_depth)
+
+    functions_to_wrap = discover_functions(
+        py_files,
+        target_function_names,
+        max_workers=discovery_workers,
+        base_dir=base_dir,
+    )
 
     if not functions_to_wrap:
-        message = "No functions found to wrap as MCP tools."
-        if target_function_names:
-            message += f" (Specified functions: {target_function_names} not found, or no functions in source matching criteria)."
-        else:
-            message += (
-                " (No functions discovered in the source path matching criteria)."
-            )
-        logger.error(message)
-        raise TransformationError(message)
+        raise _no_functions_error(target_function_names)
 
     # Group functions by file path to create one FastMCP instance per file
     functions_by_file: Dict[pathlib.Path, List[Tuple[Callable[..., Any], str]]] = {}
@@ -87,11 +143,57 @@ def discover_and_group_functions(
     return functions_by_file, base_dir
 
 
+def discover_and_group_functions_static(
+    source_path_str: str,
+    target_function_names: Optional[List[str]] = None,
+    scan_max_depth: Optional[int] = None,
+) -> Tuple[Dict[pathlib.Path, List[StaticFunctionInfo]], pathlib.Path]:
+    """
+    Discovers functions without importing user modules and groups them by file path.
+
+    Args:
+        source_path_str: Path to the Python file or directory containing functions.
+        target_function_names: Optional list of function names to expose. If None, all are exposed.
+        scan_max_depth: Optional maximum directory depth to scan.
+
+    Returns:
+        A tuple containing:
+        - Dictionary mapping file paths to lists of StaticFunctionInfo records
+        - Base directory path for relative path calculations
+
+    Raises:
+        TransformationError: If no Python files or functions are found.
+    """
+    py_files, base_dir = _discover_source_files(source_path_str, scan_max_depth)
+
+    with profile_phase("static_parse"):
+        functions_to_wrap = discover_functions_static(py_files, target_function_names)
+    if not functions_to_wrap:
+        raise _no_functions_error(target_function_names)
+
+    functions_by_file: Dict[pathlib.Path, List[StaticFunctionInfo]] = {}
+    for function_info in functions_to_wrap:
+        functions_by_file.setdefault(function_info.file_path, []).append(
+            function_info
+        )
+
+    return functions_by_file, base_dir
+
+
+def _get_instance_name(file_path: pathlib.Path, base_dir: pathlib.Path) -> str:
+    """Generate a unique name for a file's FastMCP instance based on its path."""
+    relative_path = file_path.relative_to(base_dir)
+    return str(relative_path).replace(os.sep, "_").replace(".py", "")
+
+
 def create_mcp_instances(
     functions_by_file: Dict[pathlib.Path, List[Tuple[Callable[..., Any], str]]],
     base_dir: pathlib.Path,
     mcp_server_name: str,
     tool_call_cache: Optional[SessionToolCallCache] = None,
+    manifest: Optional[DiscoveryManifest] = None,
+    tool_executor: Optional[Any] = None,
+    tool_limits: Optional[ToolLimits] = None,
 ) -> Dict[pathlib.Path, Tuple[Any, str, int]]:
     """
     Creates FastMCP instances for each file and registers functions as tools.
@@ -101,6 +203,10 @@ def create_mcp_instances(
         base_dir: Base directory path for relative path calculations
         mcp_server_name: Base name for FastMCP servers
         tool_call_cache: Optional cache for tool call results
+        manifest: Optional discovery manifest. Unchanged files reuse the recorded
+            descriptions and schemas instead of being validated again.
+        tool_executor: Optional executor that synchronous tools are offloaded to
+        tool_limits: Optional per-tool options and concurrency limits
 
     Returns:
         Dictionary mapping file paths to tuples of (FastMCP instance, route path, tools count)
@@ -117,11 +223,19 @@ def create_mcp_instances(
     for file_path, funcs in functions_by_file.items():
         # Generate a unique name for this FastMCP instance based on file path
         relative_path = file_path.relative_to(base_dir)
-        file_specific_name = str(relative_path).replace(os.sep, "_").replace(".py", "")
-        instance_name = f"{file_specific_name}"
+        instance_name = _get_instance_name(file_path, base_dir)
+
+        cached_entry = manifest.lookup(file_path) if manifest else None
+        cached_tools: Dict[str, Dict[str, Any]] = (
+            cached_entry["tools"] if cached_entry else {}
+        )
 
         # Extract the module docstring to use as instructions
-        instructions = get_module_docstring(file_path)
+        if cached_entry is not None:
+            module_docstring = cached_entry.get("docstring")
+        else:
+            module_docstring = get_module_docstring(file_path)
+        instructions = module_docstring
         if instructions:
             logger.info(
                 f"Using module docstring as instructions for FastMCP instance '{instance_name}'"
@@ -134,21 +248,56 @@ def create_mcp_instances(
             instructions = f"MCP server for {relative_path} functionality"
 
         logger.info(f"Creating FastMCP instance '{instance_name}' for {file_path}")
-        file_mcp: FastMCPType = FastMCP(name=instance_name, instructions=instructions)
+        file_mcp: FastMCPType = FastMCP(
+            name=instance_name,
+            instructions=instructions,
+            tool_serializer=serialize_tool_result,
+        )
+        install_tool_error_passthrough(file_mcp)
 
         # Register all functions from this file as tools
         tools_registered = 0
+        tool_records: Dict[str, Dict[str, Any]] = {}
         for func, func_name in funcs:
             logger.info(f"Processing function '{func_name}' from {file_path}...")
             try:
-                validate_and_wrap_tool(
-                    file_mcp, func, func_name, file_path, tool_call_cache
-                )
+                cached_tool = cached_tools.get(func_name)
+                if cached_tool is not None:
+                    registered = wrap_tool_function(
+                        mcp_instance=file_mcp,
+                        func=func,
+                        func_name=func_name,
+                        file_path=file_path,
+                        docstring=cached_tool["description"],
+                        tool_call_cache=tool_call_cache,
+                        parameters=cached_tool.get("parameters"),
+                        tool_executor=tool_executor,
+                        tool_limits=tool_limits,
+                    )
+                else:
+                    registered = validate_and_wrap_tool(
+                        file_mcp,
+                        func,
+                        func_name,
+                        file_path,
+                        tool_call_cache,
+                        tool_executor,
+                        tool_limits,
+                    )
+                if not registered:
+                    continue
                 tools_registered += 1
+                if manifest is not None:
+                    tool_records[func_name] = cached_tool or _describe_tool(
+                        file_mcp, func_name
+                    )
             except Exception as e:
                 logger.error(f"Error registering function {func_name}: {e}")
                 continue
 
+        if manifest is not None and cached_entry is None:
+            manifest.record(file_path, module_docstring, tool_records)
+
         # Skip if no tools were registered
         if tools_registered == 0:
             logger.warning(
@@ -164,3 +313,203 @@ def create_mcp_instances(
         mcp_instances[file_path] = (file_mcp, route_path_verified, tools_registered)
 
     return mcp_instances
+
+
+def create_lazy_mcp_instances(
+    functions_by_file: Dict[pathlib.Path, List[StaticFunctionInfo]],
+    base_dir: pathlib.Path,
+    mcp_server_name: str,
+    loader: LazyModuleLoader,
+    tool_call_cache: Optional[SessionToolCallCache] = None,
+    manifest: Optional[DiscoveryManifest] = None,
+    tool_executor: Optional[Any] = None,
+    tool_limits: Optional[ToolLimits] = None,
+) -> Dict[pathlib.Path, Tuple[Any, str, int]]:
+    """
+    Creates FastMCP instances whose tools import their module on first call.
+
+    Descriptions and schemas come from the discovery manifest when a file is
+    unchanged, and from static analysis of the source otherwise.
+
+    Args:
+        functions_by_file: Dictionary mapping file paths to StaticFunctionInfo records
+        base_dir: Base directory path for relative path calculations
+        mcp_server_name: Base name for FastMCP servers
+        loader: The loader importing tool modules on demand
+        tool_call_cache: Optional cache for tool call results
+        manifest: Optional discovery manifest providing recorded schemas
+        tool_executor: Optional executor that synchronous tool functions are
+            offloaded to once their module is loaded
+        tool_limits: Optional per-tool options and concurrency limits. Options
+            declared with `tool_options` are read from the source, so only those
+            written as literals apply to lazy tools.
+
+    Returns:
+        Dictionary mapping file paths to tuples of (FastMCP instance, route path, tools count)
+    """
+    FastMCP = get_fastmcp_class()
+    logger.info(f"Creating lazily loaded FastMCP instances for '{mcp_server_name}'")
+
+    mcp_instances = {}
+    for file_path, function_infos in functions_by_file.items():
+        relative_path = file_path.relative_to(base_dir)
+        instance_name = _get_instance_name(file_path, base_dir)
+
+        cached_entry = manifest.lookup(file_path) if manifest else None
+        cached_tools: Dict[str, Dict[str, Any]] = (
+            cached_entry["tools"] if cached_entry else {}
+        )
+        if cached_entry is not None:
+            instructions = cached_entry.get("docstring")
+        else:
+            instructions = get_module_docstring(file_path)
+        if not instructions:
+            instructions = f"MCP server for {relative_path} functionality"
+
+        file_mcp: FastMCPType = FastMCP(
+            name=instance_name,
+            instructions=instructions,
+            tool_serializer=serialize_tool_result,
+        )
+        install_tool_error_passthrough(file_mcp)
+
+        tools_registered = 0
+        for function_info in function_infos:
+            func_name = function_info.name
+            cached_tool = cached_tools.get(func_name)
+            if cached_tool is not None:
+                description = cached_tool["description"]
+                parameters = cached_tool.get("parameters")
+            else:
+                description = build_tool_description(
+                    function_info.docstring, function_info.comments
+                )
+                parameters = function_info.parameters
+
+            if parameters is None:
+                logger.error(
+                    f"Function '{func_name}' in '{file_path}' with *args or **kwargs is not supported as a tool"
+                )
+                continue
+
+            lazy_tool = create_lazy_tool(
+                loader,
+                file_path,
+                func_name,
+                tool_executor,
+                streaming=function_info.streaming,
+            )
+            if function_info.options:
+                setattr(lazy_tool, TOOL_OPTIONS_ATTR, dict(function_info.options))
+            registered = wrap_tool_function(
+                mcp_instance=file_mcp,
+                func=lazy_tool,
+                func_name=func_name,
+                file_path=file_path,
+                docstring=description,
+                tool_call_cache=tool_call_cache,
+                parameters=parameters,
+                tool_limits=tool_limits,
+            )
+            if registered:
+                tools_registered += 1
+
+        if tools_registered == 0:
+            logger.warning(
+                f"No tools were successfully created and registered for {file_path}. Skipping."
+            )
+            continue
+
+        route_path = get_route_from_path(file_path, base_dir)
+        route_path_verified = validate_resource_prefix(f"{route_path}")
+        mcp_instances[file_path] = (file_mcp, route_path_verified, tools_registered)
+        logger.info(
+            f"Registered {tools_registered} lazy tool(s) for {file_path} without importing it"
+        )
+
+    return mcp_instances
+
+
+def rebuild_mcp_instances(
+    file_paths: List[pathlib.Path],
+    base_dir: pathlib.Path,
+    mcp_server_name: str,
+    target_function_names: Optional[List[str]] = None,
+    tool_call_cache: Optional[SessionToolCallCache] = None,
+    lazy_loader: Optional[LazyModuleLoader] = None,
+    tool_executor: Optional[Any] = None,
+    tool_limits: Optional[ToolLimits] = None,
+) -> Tuple[Dict[pathlib.Path, Tuple[Any, str, int]], List[pathlib.Path]]:
+    """
+    Rebuilds the FastMCP instances of specific files from their current contents.
+
+    Used by hot reload: only the given files are re-imported (or re-parsed in lazy
+    mode), every other module stays untouched.
+
+    Args:
+        file_paths: The changed files to rebuild
+        base_dir: Base directory path for relative path calculations
+        mcp_server_name: Base name for FastMCP servers
+        target_function_names: Optional list of function names to expose
+        tool_call_cache: Optional cache for tool call results
+        lazy_loader: The loader of a lazily loaded application, if any
+        tool_executor: Optional executor that synchronous tools are offloaded to
+        tool_limits: Optional per-tool options and concurrency limits
+
+    Returns:
+        A tuple of (rebuilt instances, files that failed to import or parse). Files in
+        neither collection no longer define any tools.
+    """
+    for file_path in file_paths:
+        module_registry.discard(file_path)
+        if lazy_loader is not None:
+            lazy_loader.discard(file_path)
+
+    if lazy_loader is not None:
+        failed = [path for path in file_paths if _parse_module(path) is None]
+        functions_by_file: Dict[pathlib.Path, List[StaticFunctionInfo]] = {}
+        for function_info in discover_functions_static(
+            file_paths, target_function_names
+        ):
+            functions_by_file.setdefault(function_info.file_path, []).append(
+                function_info
+            )
+        instances = create_lazy_mcp_instances(
+            functions_by_file,
+            base_dir,
+            mcp_server_name,
+            lazy_loader,
+            tool_call_cache,
+            tool_executor=tool_executor,
+            tool_limits=tool_limits,
+        )
+    else:
+        functions_to_wrap = discover_functions(
+            file_paths, target_function_names, base_dir=base_dir
+        )
+        failed = [path for path in file_paths if module_registry.get(path) is None]
+        grouped: Dict[pathlib.Path, List[Tuple[Callable[..., Any], str]]] = {}
+        for func, func_name, file_path in functions_to_wrap:
+            grouped.setdefault(file_path, []).append((func, func_name))
+        instances = create_mcp_instances(
+            grouped,
+            base_dir,
+            mcp_server_name,
+            tool_call_cache,
+            tool_executor=tool_executor,
+            tool_limits=tool_limits,
+        )
+
+    return instances, failed
+
+
+def _describe_tool(mcp_instance: Any, func_name: str) -> Dict[str, Any]:
+    """Build the manifest record of a freshly registered tool."""
+    tool_manager = getattr(mcp_instance, "_tool_manager", None)
+    description = ""
+    if tool_manager is not None and tool_manager.has_tool(func_name):
+        description = tool_manager.get_tool(func_name).description
+    return {
+        "description": description,
+        "parameters": get_registered_tool_schema(mcp_instance, func_name),
+    }
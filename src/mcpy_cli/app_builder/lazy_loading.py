@@ -0,0 +1,310 @@
+"""
+Lazy tool registration for MCP applications.
+
+In lazy mode, tools are registered from statically derived metadata and the backing
+module is imported only when one of its tools is first called. Optionally, modules
+that have not been used for a while are dropped again by a background thread that
+runs during the application lifespan; modules with calls in flight are never dropped.
+"""
+
+import asyncio
+import inspect
+import logging
+import pathlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+from pydantic import TypeAdapter
+
+from ..discovery import module_registry
+from .execution import is_async_callable
+from .streaming import is_stream, is_streaming_function, stream_result
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of the seconds between two checks for idle modules
+MAX_EVICTION_INTERVAL = 60.0
+
+
+class _LoadedModule:
+    """A module loaded on demand together with its per-function validators."""
+
+    def __init__(self, module: Any):
+        self.module = module
+        self.last_used = time.monotonic()
+        self.adapters: Dict[str, TypeAdapter] = {}
+        # Number of tool calls currently using the module
+        self.in_use = 0
+
+
+class LazyModuleLoader:
+    """
+    Imports tool modules on first use and optionally evicts idle ones.
+
+    Validators are kept per loaded module rather than in the global TypeAdapter
+    cache, so evicting a module releases every reference held by this loader.
+    Third-party packages the module imported stay in `sys.modules`.
+
+    Tool calls hold the module they run from with `acquire`/`release`; a module is
+    idle once its last call has finished, and only idle modules are evicted, so a
+    long call never sees its module imported a second time under it.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: Optional[float] = None,
+        base_dir: Optional[pathlib.Path] = None,
+        eviction_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            idle_timeout: Seconds after which an unused module is evicted. None keeps
+                loaded modules for the lifetime of the process.
+            base_dir: The base directory module names are derived from.
+            eviction_interval: Seconds between two checks for idle modules while the
+                loader is started. Defaults to half the idle timeout, at most
+                `MAX_EVICTION_INTERVAL`.
+        """
+        self.idle_timeout = idle_timeout
+        self.base_dir = base_dir
+        if eviction_interval is None and idle_timeout is not None:
+            eviction_interval = min(max(idle_timeout / 2, 0.1), MAX_EVICTION_INTERVAL)
+        self.eviction_interval = eviction_interval
+        self._modules: Dict[pathlib.Path, _LoadedModule] = {}
+        self._pinned: Set[pathlib.Path] = set()
+        self._locks: Dict[pathlib.Path, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # Guards the in-use counters against concurrent eviction
+        self._usage_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.loads = 0
+        self.evictions = 0
+
+    def _lock_for(self, file_path: pathlib.Path) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(file_path, threading.Lock())
+
+    def is_loaded(self, file_path: pathlib.Path) -> bool:
+        """Whether the module for a file is currently loaded."""
+        return file_path in self._modules
+
+    def load(self, file_path: pathlib.Path) -> _LoadedModule:
+        """
+        Load the module for a file, importing it at most once at a time.
+
+        Raises:
+            ImportError: If the module cannot be loaded.
+        """
+        loaded = self._modules.get(file_path)
+        if loaded is not None:
+            return loaded
+
+        with self._lock_for(file_path):
+            loaded = self._modules.get(file_path)
+            if loaded is None:
+                start = time.perf_counter()
+                module = module_registry.load(file_path, self.base_dir)
+                if module is None:
+                    raise ImportError(f"Failed to load tool module from {file_path}")
+                loaded = _LoadedModule(module)
+                self._modules[file_path] = loaded
+                self.loads += 1
+                logger.info(
+                    f"Lazily imported {file_path} in {(time.perf_counter() - start) * 1000:.1f} ms"
+                )
+        return loaded
+
+    def acquire(self, file_path: pathlib.Path) -> _LoadedModule:
+        """
+        Load the module for a file and mark it in use until `release` is called.
+
+        Raises:
+            ImportError: If the module cannot be loaded.
+        """
+        while True:
+            loaded = self.load(file_path)
+            with self._usage_lock:
+                # Retry if the module was evicted between loading and marking it
+                if self._modules.get(file_path) is loaded:
+                    loaded.in_use += 1
+                    loaded.last_used = time.monotonic()
+                    return loaded
+
+    def release(self, loaded: _LoadedModule) -> None:
+        """Mark a module acquired with `acquire` as no longer used by that call."""
+        with self._usage_lock:
+            loaded.in_use -= 1
+            loaded.last_used = time.monotonic()
+
+    def get_validator(self, file_path: pathlib.Path, func_name: str) -> TypeAdapter:
+        """
+        Return the validating callable of a tool function, loading its module if needed.
+        """
+        loaded = self.load(file_path)
+        loaded.last_used = time.monotonic()
+        adapter = loaded.adapters.get(func_name)
+        if adapter is None:
+            func = getattr(loaded.module, func_name, None)
+            if func is None or not callable(func):
+                raise AttributeError(
+                    f"Function '{func_name}' no longer exists in {file_path}"
+                )
+            adapter = TypeAdapter(func)
+            loaded.adapters[func_name] = adapter
+        return adapter
+
+    def pin(self, file_path: pathlib.Path) -> None:
+        """Keep the module of a file loaded even when it is idle."""
+        self._pinned.add(file_path)
+
+    def discard(self, file_path: pathlib.Path) -> None:
+        """Drop a loaded module so the next call imports the file again."""
+        with self._lock_for(file_path):
+            if self._modules.pop(file_path, None) is not None:
+                module_registry.discard(file_path)
+
+    def get_function(self, file_path: pathlib.Path, func_name: str) -> Optional[Any]:
+        """Return a tool function, loading its module if needed."""
+        return getattr(self.load(file_path).module, func_name, None)
+
+    def is_async(self, file_path: pathlib.Path, func_name: str) -> bool:
+        """Whether a loaded tool function must be awaited on the event loop."""
+        func = self.get_function(file_path, func_name)
+        return func is not None and is_async_callable(func)
+
+    def evict_idle(self) -> int:
+        """
+        Drop modules that have no calls in flight and have not been used within
+        `idle_timeout`.
+
+        Returns:
+            The number of evicted modules.
+        """
+        if self.idle_timeout is None:
+            return 0
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = 0
+        for file_path, loaded in list(self._modules.items()):
+            if file_path in self._pinned:
+                continue
+            with self._lock_for(file_path), self._usage_lock:
+                if (
+                    self._modules.get(file_path) is loaded
+                    and not loaded.in_use
+                    and loaded.last_used <= deadline
+                ):
+                    del self._modules[file_path]
+                    module_registry.discard(file_path)
+                    evicted += 1
+                    logger.info(f"Evicted idle tool module {file_path}")
+        self.evictions += evicted
+        return evicted
+
+    def _run(self, stop: threading.Event, interval: float) -> None:
+        while not stop.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Failed to evict idle tool modules: {e}")
+
+    def start(self) -> None:
+        """Start evicting idle modules in the background, if an idle timeout is set."""
+        if self._thread is not None or self.eviction_interval is None:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop, self.eviction_interval),
+            name="mcpy-lazy-evictor",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop evicting idle modules."""
+        self._stop.set()
+        if self._thread is not None and wait:
+            self._thread.join(timeout=self.eviction_interval)
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get loader statistics."""
+        return {
+            "loaded_modules": len(self._modules),
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+
+def create_lazy_tool(
+    loader: LazyModuleLoader,
+    file_path: pathlib.Path,
+    func_name: str,
+    tool_executor: Optional[Any] = None,
+    streaming: bool = False,
+) -> Callable[..., Any]:
+    """
+    Create a proxy callable that imports and invokes a tool function on demand.
+
+    The proxy accepts the tool arguments as keyword arguments. Argument validation
+    against the real signature happens after the module is loaded. The first import
+    runs in a worker thread so it does not block the event loop.
+
+    Args:
+        loader: The loader that owns the module objects.
+        file_path: The path to the file containing the function.
+        func_name: The name of the function.
+        tool_executor: Optional executor that picks where the function runs. With the
+            process pool as default executor, the module is only imported by the
+            worker processes.
+        streaming: Whether the function is a generator function, as found by static
+            discovery. Generators cannot be sent back from worker processes, so such
+            tools always run in the server process.
+
+    Returns:
+        An async callable suitable for FastMCP tool registration.
+    """
+
+    async def lazy_tool(**kwargs: Any) -> Any:
+        executor = tool_executor.for_tool(None) if tool_executor is not None else None
+        if executor is not None and executor.out_of_process and not streaming:
+            # Worker processes import the module and validate the arguments, so the
+            # server process never has to import it
+            return await executor.call(file_path, func_name, kwargs=kwargs, validate=True)
+
+        if not loader.is_loaded(file_path):
+            # Import the module and build the validator off the event loop
+            await asyncio.to_thread(loader.get_validator, file_path, func_name)
+        loaded = loader.acquire(file_path)
+        try:
+            return await run(loader.get_validator(file_path, func_name), kwargs)
+        finally:
+            loader.release(loaded)
+
+    async def run(validator: TypeAdapter, kwargs: Dict[str, Any]) -> Any:
+        executor = None
+        if tool_executor is not None:
+            func = loader.get_function(file_path, func_name)
+            executor = tool_executor.for_tool(func)
+            if executor is not None and executor.out_of_process:
+                if func is None or not is_streaming_function(func):
+                    return await executor.call(
+                        file_path, func_name, kwargs=kwargs, validate=True
+                    )
+                # Generators cannot be sent back from worker processes
+                executor = None
+        if executor is not None:
+            result = await executor.run(validator.validate_python, kwargs)
+        else:
+            result = validator.validate_python(kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+        if is_stream(result):
+            return await stream_result(result, func_name, executor)
+        return result
+
+    lazy_tool.__name__ = func_name
+    lazy_tool.__qualname__ = func_name
+    return lazy_tool
@@ -0,0 +1,338 @@
+"""
+Startup and shutdown hooks of tool modules for MCP applications.
+
+Tool modules that need heavy resources (ML models, connection pools, ...) can acquire
+them in a module-level `mcp_startup` function and release them in `mcp_shutdown`,
+instead of at import time where they can neither be awaited nor cleaned up:
+
+    model = None
+
+    def mcp_startup():
+        global model
+        model = load_model("weights.bin")
+
+    async def mcp_shutdown():
+        await pool.close()
+
+The hooks take no arguments, may be synchronous or async, and are not exposed as
+tools. When the application starts, the startup hooks of all modules run
+concurrently (synchronous ones in threads); then every tool with `warmup` sample
+arguments (see `mcpy_cli.tool_options`) is called with them, so the first real
+request does not pay for cold caches. When the application stops, the shutdown hooks
+run concurrently as well. A failing hook is logged and does not keep the other
+modules from starting; the shutdown hook of a module whose startup hook failed is
+not run.
+
+Hooks run in every process that imports the module to serve its tools: the server
+process, unless all tools of the module run in the process pool, and each worker of
+the process pool. In lazy mode, modules that define hooks are imported at startup and
+never evicted for being idle. A hot reloaded module runs the shutdown hook of its
+previous version and the startup hook of the new one, and its tools are warmed up
+again.
+"""
+
+import asyncio
+import inspect
+import logging
+import pathlib
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from ..discovery import LIFECYCLE_HOOKS, SHUTDOWN_HOOK, STARTUP_HOOK, module_registry
+from ..static_discovery import find_lifecycle_hooks_static
+from ..tool_options import get_tool_options
+from .streaming import is_streaming_function
+
+logger = logging.getLogger(__name__)
+
+
+def get_module_hook(module: Any, hook_name: str) -> Optional[Callable[..., Any]]:
+    """Return a lifecycle hook defined by a module, or None."""
+    hook: Optional[Callable[..., Any]] = getattr(module, hook_name, None)
+    if not callable(hook) or getattr(hook, "__module__", None) != module.__name__:
+        # Hooks imported from another module belong to that module
+        return None
+    return hook
+
+
+def run_module_hook(module: Any, hook_name: str) -> bool:
+    """
+    Run a lifecycle hook of a module synchronously, outside any event loop.
+
+    Used by worker processes. Returns False if the hook failed.
+    """
+    hook = get_module_hook(module, hook_name)
+    if hook is None:
+        return True
+    try:
+        result = hook()
+        if inspect.isawaitable(result):
+
+            async def wait() -> Any:
+                return await result
+
+            asyncio.run(wait())
+    except Exception as e:
+        logger.error(
+            f"Hook {hook_name} of {module.__name__} failed: {e}", exc_info=True
+        )
+        return False
+    return True
+
+
+async def _call_hook(hook: Callable[..., Any]) -> None:
+    if inspect.iscoroutinefunction(hook):
+        await hook()
+        return
+    result = await asyncio.to_thread(hook)
+    if inspect.isawaitable(result):
+        await result
+
+
+class ModuleLifecycle:
+    """
+    Runs the startup and shutdown hooks of tool modules and the warm-up calls of
+    their tools.
+    """
+
+    def __init__(
+        self,
+        mcp_instances: Dict[pathlib.Path, Any],
+        base_dir: pathlib.Path,
+        tool_limits: Optional[Any] = None,
+        tool_executor: Optional[Any] = None,
+        lazy_loader: Optional[Any] = None,
+    ):
+        """
+        Args:
+            mcp_instances: The application's instance map, from file path to
+                (FastMCP instance, route path, tools count). Hot reload updates it in
+                place.
+            base_dir: The source directory, used for names in logs and statistics.
+            tool_limits: Optional ToolLimits resolving the tool options.
+            tool_executor: Optional ToolExecutors, used to tell modules whose tools
+                all run in the process pool.
+            lazy_loader: The LazyModuleLoader of a lazily loaded application, if any.
+        """
+        self.mcp_instances = mcp_instances
+        self.base_dir = base_dir
+        self.tool_limits = tool_limits
+        self.tool_executor = tool_executor
+        self.lazy_loader = lazy_loader
+        # Modules whose startup hook ran successfully, or that only have a shutdown
+        # hook, by file
+        self._started: Dict[pathlib.Path, Any] = {}
+        self._module_stats: Dict[str, Dict[str, Any]] = {}
+        self._warmup_stats: Dict[str, Dict[str, Any]] = {}
+
+    def _name(self, file_path: pathlib.Path) -> str:
+        try:
+            return file_path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def _options(
+        self,
+        func: Optional[Callable[..., Any]],
+        func_name: str,
+        file_path: pathlib.Path,
+    ) -> Dict[str, Any]:
+        if self.tool_limits is None:
+            return dict(get_tool_options(func))
+        options: Dict[str, Any] = self.tool_limits.options_for(
+            func, func_name, file_path
+        )
+        return options
+
+    async def _tools(self, file_path: pathlib.Path) -> Dict[str, Any]:
+        """The tools of a file's FastMCP instance, by name."""
+        instance = self.mcp_instances.get(file_path)
+        get_tools = getattr(instance[0], "get_tools", None) if instance else None
+        if get_tools is None:
+            return {}
+        tools: Dict[str, Any] = await get_tools()
+        return tools
+
+    def _runs_in_server(
+        self, module: Any, file_path: pathlib.Path, tool_names: List[str]
+    ) -> bool:
+        """Whether any tool of a module runs in the server process."""
+        if self.tool_executor is None:
+            return True
+        for func_name in tool_names:
+            func = getattr(module, func_name, None)
+            executor = self.tool_executor.for_tool(
+                func, self._options(func, func_name, file_path)
+            )
+            if executor is None or not executor.out_of_process:
+                return True
+            if func is not None and is_streaming_function(func):
+                return True
+        return False
+
+    async def _load_module(self, file_path: pathlib.Path) -> Optional[Any]:
+        """Return the module of a file whose hooks the server process runs."""
+        if self.lazy_loader is None:
+            module = module_registry.get(file_path)
+        else:
+            if not find_lifecycle_hooks_static(file_path):
+                return None
+            executor = (
+                self.tool_executor.for_tool(None)
+                if self.tool_executor is not None
+                else None
+            )
+            if executor is not None and executor.out_of_process:
+                # Lazy tools are then only ever imported by the worker processes
+                return None
+            loaded = await asyncio.to_thread(self.lazy_loader.load, file_path)
+            self.lazy_loader.pin(file_path)
+            module = loaded.module
+        if module is None:
+            return None
+        if not any(get_module_hook(module, name) for name in LIFECYCLE_HOOKS):
+            return None
+        tool_names = list(await self._tools(file_path))
+        if not self._runs_in_server(module, file_path, tool_names):
+            logger.debug(
+                f"Hooks of {self._name(file_path)} only run in the process pool workers"
+            )
+            return None
+        return module
+
+    async def _start_file(self, file_path: pathlib.Path) -> None:
+        name = self._name(file_path)
+        try:
+            module = await self._load_module(file_path)
+        except Exception as e:
+            logger.error(f"Failed to load {name} for its startup hook: {e}")
+            self._module_stats[name] = {"started": False, "error": str(e)}
+            return
+        if module is None:
+            return
+
+        hook = get_module_hook(module, STARTUP_HOOK)
+        stats: Dict[str, Any] = {"started": True, "startup_ms": 0.0, "error": None}
+        self._module_stats[name] = stats
+        if hook is not None:
+            start = time.perf_counter()
+            try:
+                await _call_hook(hook)
+            except Exception as e:
+                logger.error(f"Startup hook of {name} failed: {e}", exc_info=True)
+                stats.update(started=False, error=str(e))
+                return
+            finally:
+                stats["startup_ms"] = (time.perf_counter() - start) * 1000
+            logger.info(f"Started {name} in {stats['startup_ms']:.1f} ms")
+        self._started[file_path] = module
+
+    async def _stop_file(self, file_path: pathlib.Path) -> None:
+        module = self._started.pop(file_path, None)
+        if module is None:
+            return
+        hook = get_module_hook(module, SHUTDOWN_HOOK)
+        if hook is None:
+            return
+        name = self._name(file_path)
+        try:
+            await _call_hook(hook)
+        except Exception as e:
+            logger.error(f"Shutdown hook of {name} failed: {e}", exc_info=True)
+            return
+        logger.info(f"Shut down {name}")
+
+    async def _warm_up_tool(self, file_path: pathlib.Path, tool: Any) -> None:
+        module = module_registry.get(file_path)
+        func = getattr(module, tool.name, None) if module is not None else None
+        samples = self._options(func, tool.name, file_path).get("warmup")
+        if samples is None:
+            return
+        if not isinstance(samples, list):
+            samples = [samples]
+
+        key = f"{self._name(file_path)}:{tool.name}"
+        stats = {"calls": 0, "failures": 0, "ms": 0.0}
+        self._warmup_stats[key] = stats
+        for arguments in samples:
+            start = time.perf_counter()
+            try:
+                await tool.run(arguments)
+            except Exception as e:
+                stats["failures"] += 1
+                logger.warning(f"Warm-up call of tool '{key}' failed: {e}")
+            finally:
+                stats["calls"] += 1
+                stats["ms"] += (time.perf_counter() - start) * 1000
+        logger.info(f"Warmed up tool '{key}' in {stats['ms']:.1f} ms")
+
+    async def _warm_up_file(self, file_path: pathlib.Path) -> None:
+        tools = await self._tools(file_path)
+        await asyncio.gather(
+            *(self._warm_up_tool(file_path, tool) for tool in tools.values())
+        )
+
+    async def startup(self) -> None:
+        """Run the startup hooks of all modules concurrently, then the warm-ups."""
+        start = time.perf_counter()
+        file_paths = list(self.mcp_instances)
+        await asyncio.gather(*(self._start_file(path) for path in file_paths))
+        await asyncio.gather(*(self._warm_up_file(path) for path in file_paths))
+        if self._started or self._warmup_stats:
+            logger.info(
+                f"Started {len(self._started)} module(s) and warmed up "
+                f"{len(self._warmup_stats)} tool(s) in "
+                f"{(time.perf_counter() - start) * 1000:.1f} ms"
+            )
+
+    async def shutdown(self) -> None:
+        """Run the shutdown hooks of all started modules concurrently."""
+        await asyncio.gather(*(self._stop_file(path) for path in list(self._started)))
+
+    async def reload(self, file_paths: List[pathlib.Path]) -> None:
+        """
+        Restart hot reloaded modules: stop their previous version, then start and
+        warm up the current one. Removed modules are only stopped.
+        """
+
+        async def restart(file_path: pathlib.Path) -> None:
+            await self._stop_file(file_path)
+            if file_path in self.mcp_instances:
+                await self._start_file(file_path)
+                await self._warm_up_file(file_path)
+
+        await asyncio.gather(*(restart(path) for path in file_paths))
+
+    def wrap_lifespan(self, lifespan_context: Callable[[Any], Any]) -> Callable:
+        """
+        Wrap an application lifespan so modules are started before the server
+        accepts requests and stopped after it finished serving.
+
+        Args:
+            lifespan_context: The application's existing lifespan context factory.
+
+        Returns:
+            A lifespan context factory suitable for `router.lifespan_context`.
+        """
+
+        @asynccontextmanager
+        async def lifespan(app):
+            await self.startup()
+            try:
+                async with lifespan_context(app) as state:
+                    yield state
+            finally:
+                await self.shutdown()
+
+        return lifespan
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the startup outcome of every module with hooks and warm-up counters."""
+        return {
+            "started_modules": len(self._started),
+            "modules": {
+                name: dict(stats) for name, stats in self._module_stats.items()
+            },
+            "warmups": {key: dict(stats) for key, stats in self._warmup_stats.items()},
+        }
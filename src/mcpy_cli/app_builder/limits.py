@@ -0,0 +1,446 @@
+"""
+Per-tool concurrency limits and timeouts for MCP applications.
+
+A tool with `max_concurrency` (set with `tool_options` or in the `--tool-config` file)
+runs at most that many calls at once per server process. Further calls wait in a FIFO
+queue of at most `max_queue` calls for at most `max_wait` seconds; calls that do not
+fit or wait too long are rejected with a "server busy" JSON-RPC error, so one
+expensive tool cannot take all the capacity of a worker.
+
+A tool with a `timeout` (set per tool, or for all tools with `--tool-timeout`) is
+cancelled when a call runs longer than that and the client receives a timeout
+JSON-RPC error. Cancelling frees what the call holds: async tools are cancelled,
+calls in the process pool have their worker killed and replaced, and calls in the
+thread pool are abandoned (the thread finishes on its own, its result is dropped).
+Synchronous tools that run inline on the event loop cannot be interrupted, so the
+timeout is not applied to them.
+
+A tool with the `coalesce` option shares one execution between identical concurrent
+calls, see `coalescing`. A tool with the `batch_size` option takes single items that
+are run in batches, see `micro_batching`. Results of tools with the `pure` option are
+cached across sessions, see `result_cache`.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import pathlib
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from ..tool_options import (
+    DEFAULT_BATCH_WAIT,
+    DEFAULT_MAX_QUEUE,
+    DEFAULT_MAX_WAIT,
+    ToolOptionsConfig,
+    get_tool_options,
+    validate_tool_options,
+)
+from .coalescing import ToolCallCoalescer
+from .execution import is_async_callable
+from .micro_batching import MicroBatcher, create_batched_tool, item_signature
+from .result_cache import ToolResultCache, code_fingerprint
+from .tool_errors import ServerBusyError, ToolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class ToolConcurrencyLimiter:
+    """
+    Admission control for one tool.
+
+    At most `max_concurrency` calls hold a slot at once. Further calls wait in FIFO
+    order and a released slot is handed directly to the oldest waiting call. Must be
+    used from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        max_concurrency: int,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+    ):
+        """
+        Args:
+            tool_name: The tool name used in errors and logs.
+            max_concurrency: Maximum number of calls running at once.
+            max_queue: Maximum number of waiting calls.
+            max_wait: Maximum seconds a call waits for a slot. None waits forever.
+        """
+        self.tool_name = tool_name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_max_wait = 0
+        self.peak_queue_depth = 0
+        self.total_wait = 0.0
+        self.longest_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a slot."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def _admit(self, waited: float) -> None:
+        self.admitted += 1
+        self.total_wait += waited
+        self.longest_wait = max(self.longest_wait, waited)
+
+    async def acquire(self) -> None:
+        """
+        Wait for a slot.
+
+        Raises:
+            ServerBusyError: If the queue is full or no slot frees up within `max_wait`.
+        """
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            self._admit(0.0)
+            return
+
+        queue_depth = self.queue_depth
+        if queue_depth >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise ServerBusyError(self.tool_name, "queue_full", queue_depth=queue_depth)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.peak_queue_depth = max(self.peak_queue_depth, queue_depth + 1)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_wait)
+        except asyncio.TimeoutError:
+            # A slot may have been handed over just as the wait expired
+            if not waiter.done():
+                self._remove_waiter(waiter)
+                self.rejected_max_wait += 1
+                raise ServerBusyError(
+                    self.tool_name,
+                    "max_wait_exceeded",
+                    max_wait=self.max_wait,
+                    queue_depth=self.queue_depth,
+                )
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._remove_waiter(waiter)
+            raise
+        self._admit(time.perf_counter() - start)
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self) -> None:
+        """Release a slot, handing it to the oldest waiting call if there is one."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gauges and counters of this tool."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected_queue_full + self.rejected_max_wait,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_max_wait": self.rejected_max_wait,
+            "avg_wait_ms": (self.total_wait / self.admitted * 1000)
+            if self.admitted
+            else 0.0,
+            "max_wait_ms": self.longest_wait * 1000,
+        }
+
+
+def create_limited_tool(
+    func: Callable[..., Any], limiter: ToolConcurrencyLimiter
+) -> Callable[..., Any]:
+    """
+    Wrap a tool so that each call holds a slot of the limiter while it runs.
+
+    The wrapper keeps the wrapped function's name, docstring and signature, so
+    FastMCP derives the same schema as for the original function.
+
+    Args:
+        func: The tool callable, synchronous or async.
+        limiter: The limiter of the tool.
+
+    Returns:
+        An async callable suitable for FastMCP tool registration.
+    """
+
+    @functools.wraps(func)
+    async def limited_tool(*args, **kwargs):
+        await limiter.acquire()
+        try:
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        finally:
+            limiter.release()
+
+    return limited_tool
+
+
+class ToolTimeout:
+    """Timeout of one tool, with call and timeout counters."""
+
+    def __init__(self, tool_name: str, timeout: float):
+        """
+        Args:
+            tool_name: The tool name used in errors and logs.
+            timeout: Maximum seconds a call may run.
+        """
+        self.tool_name = tool_name
+        self.timeout = timeout
+        self.calls = 0
+        self.timeouts = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the timeout and counters of this tool."""
+        return {
+            "timeout": self.timeout,
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+        }
+
+
+def create_timeout_tool(
+    func: Callable[..., Any], tool_timeout: ToolTimeout
+) -> Callable[..., Any]:
+    """
+    Wrap an async tool so that calls running longer than the timeout are cancelled.
+
+    The wrapper keeps the wrapped function's name, docstring and signature, so
+    FastMCP derives the same schema as for the original function.
+
+    Args:
+        func: The async tool callable.
+        tool_timeout: The timeout of the tool.
+
+    Returns:
+        An async callable suitable for FastMCP tool registration.
+    """
+
+    @functools.wraps(func)
+    async def timeout_tool(*args, **kwargs):
+        tool_timeout.calls += 1
+        try:
+            return await asyncio.wait_for(func(*args, **kwargs), tool_timeout.timeout)
+        except asyncio.TimeoutError:
+            tool_timeout.timeouts += 1
+            logger.warning(
+                f"Tool '{tool_timeout.tool_name}' timed out after {tool_timeout.timeout}s"
+            )
+            raise ToolTimeoutError(tool_timeout.tool_name, tool_timeout.timeout)
+
+    return timeout_tool
+
+
+class ToolLimits:
+    """
+    Resolves per-tool options and applies micro-batching, concurrency limits,
+    timeouts, call coalescing and result caching to tools.
+
+    Limiters and timeouts are keyed by file and function name and reused when a file
+    is hot reloaded with unchanged settings, so calls in flight keep counting against
+    them.
+    """
+
+    def __init__(
+        self,
+        tool_config: Optional[ToolOptionsConfig] = None,
+        base_dir: Optional[pathlib.Path] = None,
+        default_timeout: Optional[float] = None,
+        result_cache: Optional[ToolResultCache] = None,
+    ):
+        """
+        Args:
+            tool_config: Options from the `--tool-config` file, if any.
+            base_dir: The source directory tool keys are relative to.
+            default_timeout: Timeout in seconds for tools that do not set one.
+            result_cache: The cache of pure tool results. Defaults to a cache with
+                the default bounds.
+
+        Raises:
+            ValueError: If `default_timeout` is not a positive number.
+        """
+        validate_tool_options({"timeout": default_timeout})
+        self.tool_config = tool_config
+        self.base_dir = base_dir
+        self.default_timeout = default_timeout
+        self._limiters: Dict[str, ToolConcurrencyLimiter] = {}
+        self._timeouts: Dict[str, ToolTimeout] = {}
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self.coalescer = ToolCallCoalescer()
+        self.result_cache = (
+            result_cache if result_cache is not None else ToolResultCache()
+        )
+
+    def tool_key(self, func_name: str, file_path: pathlib.Path) -> str:
+        """The key identifying a tool: "<relative file path>:<function name>"."""
+        try:
+            relative_path = (
+                file_path.relative_to(self.base_dir) if self.base_dir else file_path
+            )
+        except ValueError:
+            relative_path = file_path
+        return f"{relative_path.as_posix()}:{func_name}"
+
+    def options_for(
+        self,
+        func: Optional[Callable[..., Any]],
+        func_name: str,
+        file_path: pathlib.Path,
+    ) -> Dict[str, Any]:
+        """Return the effective options of a tool."""
+        if self.tool_config is None:
+            options = dict(get_tool_options(func))
+        else:
+            options = self.tool_config.resolve(
+                func, func_name, file_path, self.base_dir
+            )
+        if self.default_timeout is not None:
+            options.setdefault("timeout", self.default_timeout)
+        return options
+
+    def get_limiter(
+        self, func_name: str, file_path: pathlib.Path, options: Dict[str, Any]
+    ) -> Optional[ToolConcurrencyLimiter]:
+        """Return the limiter of a tool, or None if it has no concurrency limit."""
+        max_concurrency = options.get("max_concurrency")
+        if max_concurrency is None:
+            return None
+        key = self.tool_key(func_name, file_path)
+        max_queue = options.get("max_queue", DEFAULT_MAX_QUEUE)
+        max_wait = options.get("max_wait", DEFAULT_MAX_WAIT)
+        limiter = self._limiters.get(key)
+        if (
+            limiter is None
+            or limiter.max_concurrency != max_concurrency
+            or limiter.max_queue != max_queue
+            or limiter.max_wait != max_wait
+        ):
+            limiter = ToolConcurrencyLimiter(key, max_concurrency, max_queue, max_wait)
+            self._limiters[key] = limiter
+            logger.info(
+                f"Limiting tool '{key}' to {max_concurrency} concurrent call(s), "
+                f"queue {max_queue}, max wait {max_wait}s"
+            )
+        return limiter
+
+    def get_timeout(
+        self, func_name: str, file_path: pathlib.Path, options: Dict[str, Any]
+    ) -> Optional[ToolTimeout]:
+        """Return the timeout of a tool, or None if it has no timeout."""
+        timeout = options.get("timeout")
+        if timeout is None:
+            return None
+        key = self.tool_key(func_name, file_path)
+        tool_timeout = self._timeouts.get(key)
+        if tool_timeout is None or tool_timeout.timeout != timeout:
+            tool_timeout = ToolTimeout(key, timeout)
+            self._timeouts[key] = tool_timeout
+        return tool_timeout
+
+    def wrap_tool(
+        self,
+        func: Callable[..., Any],
+        func_name: str,
+        file_path: pathlib.Path,
+        options: Dict[str, Any],
+    ) -> Callable[..., Any]:
+        """
+        Apply the tool's micro-batching, timeout, concurrency limit, coalescing and
+        result caching, if it has them.
+        """
+        batch_size = options.get("batch_size")
+        if batch_size is not None:
+            func = self._batch_tool(func, func_name, file_path, options)
+        tool_timeout = self.get_timeout(func_name, file_path, options)
+        if tool_timeout is not None:
+            if is_async_callable(func):
+                # Inside the limiter, so time spent waiting for a slot does not count
+                func = create_timeout_tool(func, tool_timeout)
+            else:
+                logger.warning(
+                    f"Timeout of tool '{tool_timeout.tool_name}' is not applied: it runs "
+                    f"inline on the event loop and cannot be interrupted. Use the thread "
+                    f"or process executor to enforce it."
+                )
+        limiter = self.get_limiter(func_name, file_path, options)
+        if limiter is not None:
+            func = create_limited_tool(func, limiter)
+        coalesce = options.get("coalesce")
+        if coalesce is not None:
+            # Outside the limiter, so merged calls take neither a slot nor a worker
+            func = self.coalescer.wrap_tool(
+                func, self.tool_key(func_name, file_path), coalesce
+            )
+        if options.get("pure"):
+            # Outermost, so cache hits do not even join an in-flight call
+            func = self.result_cache.wrap_tool(
+                func,
+                self.tool_key(func_name, file_path),
+                options.get("cache_ttl"),
+                code_fingerprint(file_path),
+            )
+        return func
+
+    def _batch_tool(
+        self,
+        func: Callable[..., Any],
+        func_name: str,
+        file_path: pathlib.Path,
+        options: Dict[str, Any],
+    ) -> Callable[..., Any]:
+        key = self.tool_key(func_name, file_path)
+        signature = item_signature(func)
+        if signature is None:
+            logger.warning(
+                f"Tool '{key}' is not batched: every parameter must be annotated as a "
+                f"list (List[T]) and the function must be imported (not a lazy tool)"
+            )
+            return func
+        batcher = MicroBatcher(
+            key,
+            func,
+            signature,
+            options["batch_size"],
+            options.get("batch_wait", DEFAULT_BATCH_WAIT),
+        )
+        self._batchers[key] = batcher
+        logger.info(
+            f"Batching calls of tool '{key}' in batches of up to "
+            f"{batcher.max_batch_size}, waiting at most {batcher.max_wait}s"
+        )
+        return create_batched_tool(func, batcher)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the statistics of every tool with limits, a timeout or batching."""
+        stats: Dict[str, Dict[str, Any]] = {
+            key: limiter.get_stats() for key, limiter in self._limiters.items()
+        }
+        for key, tool_timeout in self._timeouts.items():
+            stats.setdefault(key, {}).update(tool_timeout.get_stats())
+        for key, batcher in self._batchers.items():
+            stats.setdefault(key, {})["batching"] = batcher.get_stats()
+        return stats
@@ -0,0 +1,225 @@
+"""
+Persistent discovery manifest for MCP applications.
+
+The manifest records, per source file, the file fingerprint (mtime, size and content
+hash) together with the tool metadata derived from it: module docstring, tool names,
+descriptions and JSON schemas. On restart, files whose fingerprint and `--functions`
+filter are unchanged reuse that metadata instead of re-running validation and schema
+generation.
+
+Note that only the file's own contents are fingerprinted. If a tool's schema depends
+on a type imported from another file, touch the tool file (or delete the manifest)
+after changing that type.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+
+
+def get_default_manifest_path(base_dir: pathlib.Path) -> pathlib.Path:
+    """
+    Returns the default manifest location for a source directory.
+
+    Manifests live in the XDG cache directory (``$XDG_CACHE_HOME`` or ``~/.cache``)
+    under ``mcpy-cli/manifests``, named after a hash of the source directory so the
+    user's source tree is never written to.
+
+    Args:
+        base_dir: The base directory of the discovered source files.
+
+    Returns:
+        Path to the manifest file.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(
+        pathlib.Path.home() / ".cache"
+    )
+    source_key = hashlib.sha256(str(base_dir.resolve()).encode()).hexdigest()[:16]
+    return pathlib.Path(cache_home) / "mcpy-cli" / "manifests" / f"{source_key}.json"
+
+
+def _hash_file(file_path: pathlib.Path) -> str:
+    """Returns the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiscoveryManifest:
+    """
+    On-disk cache of per-file tool metadata keyed by file fingerprint.
+    """
+
+    def __init__(
+        self,
+        base_dir: pathlib.Path,
+        target_function_names: Optional[List[str]] = None,
+        manifest_path: Optional[pathlib.Path] = None,
+    ):
+        """
+        Load the manifest for a source directory.
+
+        Args:
+            base_dir: Base directory of the discovered source files.
+            target_function_names: The active `--functions` filter. Entries recorded
+                under a different filter are treated as misses.
+            manifest_path: Optional explicit manifest location. Defaults to
+                `get_default_manifest_path(base_dir)`.
+        """
+        self.base_dir = base_dir
+        self.manifest_path = manifest_path or get_default_manifest_path(base_dir)
+        self.functions_filter = (
+            sorted(target_function_names) if target_function_names else None
+        )
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._current: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read manifest entries from disk, discarding incompatible manifests."""
+        if not self.manifest_path.exists():
+            logger.debug(f"No discovery manifest found at {self.manifest_path}")
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Ignoring unreadable discovery manifest {self.manifest_path}: {e}"
+            )
+            return {}
+
+        if data.get("version") != MANIFEST_FORMAT_VERSION:
+            logger.info("Discovery manifest format changed, rebuilding it")
+            return {}
+        if data.get("base_dir") != str(self.base_dir):
+            logger.info("Discovery manifest belongs to another source path, ignoring")
+            return {}
+        files: Dict[str, Dict[str, Any]] = data.get("files", {})
+        return files
+
+    def _key(self, file_path: pathlib.Path) -> str:
+        """Manifest key of a file: its path relative to the base directory."""
+        try:
+            return file_path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return str(file_path)
+
+    def lookup(self, file_path: pathlib.Path) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached entry for a file if it is still valid.
+
+        A file is unchanged when its mtime and size match, or, if only the mtime
+        differs, when its content hash matches. The entry must also have been recorded
+        under the same `--functions` filter.
+
+        Args:
+            file_path: Path to the Python file.
+
+        Returns:
+            The entry (with "docstring" and "tools" keys) or None on a miss.
+        """
+        key = self._key(file_path)
+        entry = self._entries.get(key)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            entry = None
+
+        if entry is not None and entry.get("functions_filter") != self.functions_filter:
+            logger.debug(f"Discovery manifest miss for {key}: --functions changed")
+            entry = None
+
+        if entry is not None and entry.get("size") == stat.st_size:
+            if entry.get("mtime_ns") != stat.st_mtime_ns:
+                if entry.get("sha256") != _hash_file(file_path):
+                    entry = None
+                else:
+                    # Content is unchanged, only refresh the recorded mtime
+                    entry = dict(entry, mtime_ns=stat.st_mtime_ns)
+        else:
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            logger.debug(f"Discovery manifest miss for {key}")
+            return None
+
+        self.hits += 1
+        self._current[key] = entry
+        logger.debug(f"Discovery manifest hit for {key}")
+        return entry
+
+    def record(
+        self,
+        file_path: pathlib.Path,
+        docstring: Optional[str],
+        tools: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """
+        Record the metadata derived from a file.
+
+        Args:
+            file_path: Path to the Python file.
+            docstring: The module docstring used as instance instructions.
+            tools: Mapping of tool name to {"description": ..., "parameters": ...}.
+        """
+        try:
+            stat = file_path.stat()
+            sha256 = _hash_file(file_path)
+        except OSError as e:
+            logger.warning(f"Could not fingerprint {file_path} for the manifest: {e}")
+            return
+
+        self._current[self._key(file_path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "functions_filter": self.functions_filter,
+            "docstring": docstring,
+            "tools": tools,
+        }
+
+    def save(self) -> None:
+        """
+        Write the manifest atomically. Only files seen in this run are kept, so
+        deleted files drop out of the manifest.
+        """
+        data = {
+            "version": MANIFEST_FORMAT_VERSION,
+            "base_dir": str(self.base_dir),
+            "files": self._current,
+        }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.manifest_path.parent), suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.manifest_path)
+            logger.debug(f"Saved discovery manifest to {self.manifest_path}")
+        except OSError as e:
+            logger.warning(
+                f"Failed to save discovery manifest {self.manifest_path}: {e}"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get manifest hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
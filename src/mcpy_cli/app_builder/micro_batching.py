@@ -0,0 +1,281 @@
+"""
+Micro-batching of tool calls for MCP applications.
+
+Tools that wrap vectorized code (NumPy, embedding models, ...) are much cheaper per
+item when called on many inputs at once. A function whose parameters are all lists,
+and that returns a list with one result per input, can be marked batchable with the
+`batch_size` option:
+
+    @tool_options(batch_size=32, batch_wait=0.005)
+    def embed(texts: List[str]) -> List[List[float]]:
+        ...
+
+Clients then see a tool that takes a single item (`texts: str`). Individual calls
+are buffered until `batch_size` items are waiting or the oldest has waited
+`batch_wait` seconds, the function is called once with the stacked inputs and each
+result is returned to its caller. An exception raised by the function fails every
+call of the batch.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+import typing
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..tool_options import DEFAULT_BATCH_WAIT
+
+logger = logging.getLogger(__name__)
+
+BATCHED_TOOL_ATTR = "__mcpy_batched__"
+
+# Upper bounds of the histogram buckets
+WAIT_MS_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+FILL_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+
+class Histogram:
+    """Counts of observed values per bucket, each bucket labelled by its upper bound."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value in the first bucket whose bound is not below it."""
+        index = len(self.bounds)
+        for position, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = position
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the bucket counts, the number of values and their sum."""
+        labels = [f"{bound:g}" for bound in self.bounds] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+def _batch_size_buckets(max_batch_size: int) -> List[int]:
+    """Powers of two up to the maximum batch size, used as batch size buckets."""
+    bounds = []
+    size = 1
+    while size < max_batch_size:
+        bounds.append(size)
+        size *= 2
+    bounds.append(max_batch_size)
+    return bounds
+
+
+def item_signature(func: Callable[..., Any]) -> Optional[inspect.Signature]:
+    """
+    Derive the per-item signature of a batch function.
+
+    Every parameter annotated `List[T]` becomes a parameter annotated `T`, and a
+    `List[R]` return annotation becomes `R`.
+
+    Returns:
+        The per-item signature, or None if a parameter is not annotated as a list.
+    """
+    try:
+        hints = typing.get_type_hints(func)
+        signature = inspect.signature(func)
+    except Exception:
+        return None
+
+    def item_type(hint: Any) -> Any:
+        if typing.get_origin(hint) is list:
+            args = typing.get_args(hint)
+            return args[0] if args else Any
+        return None
+
+    parameters = []
+    for name, parameter in signature.parameters.items():
+        annotation = item_type(hints.get(name))
+        if annotation is None or parameter.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            return None
+        parameters.append(
+            parameter.replace(
+                annotation=annotation,
+                default=None if parameter.default is None else inspect.Parameter.empty,
+            )
+        )
+    if not parameters:
+        return None
+    return_annotation = item_type(hints.get("return"))
+    return signature.replace(
+        parameters=parameters,
+        return_annotation=return_annotation
+        if return_annotation is not None
+        else inspect.Signature.empty,
+    )
+
+
+class MicroBatcher:
+    """
+    Buffers calls of one tool and runs them as batches.
+
+    Must be used from the event loop thread. A batch runs in its own task, so a
+    cancelled call leaves the rest of its batch running.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        func: Callable[..., Any],
+        signature: inspect.Signature,
+        max_batch_size: int,
+        max_wait: float = DEFAULT_BATCH_WAIT,
+    ):
+        """
+        Args:
+            tool_name: The tool name used in logs.
+            func: The batch function, synchronous or async; takes lists.
+            signature: The per-item signature of the tool.
+            max_batch_size: Number of waiting items that triggers a batch.
+            max_wait: Seconds the oldest item waits before a partial batch runs.
+        """
+        self.tool_name = tool_name
+        self.func = func
+        self.signature = signature
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: "set[asyncio.Task[None]]" = set()
+        self.batch_sizes = Histogram(_batch_size_buckets(max_batch_size))
+        self.wait_ms = Histogram(WAIT_MS_BUCKETS)
+        self.fill = Histogram(FILL_BUCKETS)
+        self.failed_batches = 0
+
+    async def submit(self, kwargs: Dict[str, Any]) -> Any:
+        """Add a call to the next batch and wait for its result."""
+        bound = self.signature.bind(**kwargs)
+        bound.apply_defaults()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((dict(bound.arguments), future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Calls cancelled while waiting (e.g. timed out) are left out of the batch
+        self._pending = [item for item in self._pending if not item[1].done()]
+        items = self._pending[: self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size :]
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_wait, self._flush
+            )
+        if not items:
+            return
+        task = asyncio.ensure_future(self._run_batch(items))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(
+        self, items: List[Tuple[Dict[str, Any], asyncio.Future, float]]
+    ) -> None:
+        now = time.perf_counter()
+        for _, _, submitted in items:
+            self.wait_ms.observe((now - submitted) * 1000)
+        self.batch_sizes.observe(len(items))
+        self.fill.observe(len(items) / self.max_batch_size)
+
+        stacked = {
+            name: [arguments[name] for arguments, _, _ in items]
+            for name in self.signature.parameters
+        }
+        try:
+            results = self.func(**stacked)
+            if inspect.isawaitable(results):
+                results = await results
+            results = list(results)
+            if len(results) != len(items):
+                raise ValueError(
+                    f"Batch tool '{self.tool_name}' returned {len(results)} results "
+                    f"for {len(items)} inputs"
+                )
+        except Exception as e:
+            self.failed_batches += 1
+            logger.error(
+                f"Batch of {len(items)} call(s) of '{self.tool_name}' failed: {e}"
+            )
+            for _, future, _ in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future, _), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batch settings, counters and histograms."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": self.batch_sizes.count,
+            "items": int(self.batch_sizes.sum),
+            "failed_batches": self.failed_batches,
+            "pending_items": len(self._pending),
+            "batch_size": self.batch_sizes.get_stats(),
+            "wait_ms": self.wait_ms.get_stats(),
+            "fill": self.fill.get_stats(),
+        }
+
+
+def create_batched_tool(
+    func: Callable[..., Any], batcher: MicroBatcher
+) -> Callable[..., Any]:
+    """
+    Wrap a batch function as a per-item tool that submits its calls to the batcher.
+
+    The wrapper keeps the wrapped function's name and docstring but carries the
+    per-item signature, so FastMCP derives a schema for a single item.
+
+    Args:
+        func: The batch function (or its executor wrapper).
+        batcher: The batcher of the tool.
+
+    Returns:
+        An async callable suitable for FastMCP tool registration.
+    """
+
+    @functools.wraps(func)
+    async def batched_tool(**kwargs):
+        return await batcher.submit(kwargs)
+
+    signature = batcher.signature
+    batched_tool.__signature__ = signature  # type: ignore[attr-defined]
+    annotations = {
+        name: parameter.annotation for name, parameter in signature.parameters.items()
+    }
+    if signature.return_annotation is not inspect.Signature.empty:
+        annotations["return"] = signature.return_annotation
+    batched_tool.__annotations__ = annotations
+    setattr(batched_tool, BATCHED_TOOL_ATTR, True)
+    return batched_tool
+
+
+def is_batched_tool(func: Callable[..., Any]) -> bool:
+    """Whether a tool callable (or a wrapper around it) takes single batch items."""
+    return bool(getattr(func, BATCHED_TOOL_ATTR, False))
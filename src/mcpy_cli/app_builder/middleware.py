@@ -2,9 +2,10 @@
 Middleware for session management in MCP applications.
 """
 
+import inspect
 import logging
 import threading
-from typing import Optional
+from typing import Any, Callable, Optional
 from contextvars import ContextVar
 import re
 import os
@@ -18,6 +19,29 @@ _session_context = threading.local()
 _async_session_context: ContextVar[Optional[str]] = ContextVar('session_id', default=None)
 
 
+class _SessionCell:
+    """
+    Holds the session ID of a request.
+
+    The MCP session manager runs the tools of a session in a task started while
+    handling the session's initialize request, which copies that request's context.
+    The session ID is only assigned in the initialize response, so the cell is filled
+    in then and the session's task sees it through its copy of the context variable.
+    """
+
+    __slots__ = ("session_id",)
+
+    def __init__(self, session_id: Optional[str] = None):
+        self.session_id = session_id
+
+
+# Context variable for the session of the current task, unlike thread-local storage
+# not shared by coroutines interleaving on one thread
+_session_cell: ContextVar[Optional[_SessionCell]] = ContextVar(
+    "session_cell", default=None
+)
+
+
 class SSEDebugMiddleware:
     """
     Debug middleware specifically for SSE connections to help diagnose cloud environment issues.
@@ -78,10 +102,16 @@ class SessionMiddleware:
     """
     Middleware to extract MCP session ID from request headers and store it in thread-local storage.
     This enables tools to access the current session ID during request processing.
+
+    `on_session_closed`, if given, is called with the session ID after a client ends
+    its session with a DELETE request, and awaited if it is a coroutine function.
     """
 
-    def __init__(self, app):
+    def __init__(
+        self, app, on_session_closed: Optional[Callable[[str], Any]] = None
+    ):
         self.app = app
+        self.on_session_closed = on_session_closed
 
     async def __call__(self, scope, receive, send):
         if scope["type"] == "http":
@@ -124,10 +154,32 @@ class SessionMiddleware:
                     f"Available headers: {header_names}, Query: {query_string}"
                 )
 
+            cell = _SessionCell(session_id)
+            cell_token = _session_cell.set(cell)
+            session_send = send
+            if not session_id:
+
+                async def session_send(message):
+                    # Capture the session ID assigned by an initialize response
+                    if message["type"] == "http.response.start":
+                        for name, value in message.get("headers", []):
+                            if name.lower() == b"mcp-session-id":
+                                cell.session_id = value.decode("utf-8")
+                    await send(message)
+
             try:
                 # Process the request
-                await self.app(scope, receive, send)
+                await self.app(scope, receive, session_send)
             finally:
+                _session_cell.reset(cell_token)
+                if (
+                    session_id
+                    and request_method == "DELETE"
+                    and self.on_session_closed is not None
+                ):
+                    closed = self.on_session_closed(session_id)
+                    if inspect.isawaitable(closed):
+                        await closed
                 # Clean up thread-local storage after request processing
                 if hasattr(_session_context, "session_id"):
                     delattr(_session_context, "session_id")
@@ -142,11 +194,18 @@ class SessionMiddleware:
 
 def get_current_session_id() -> Optional[str]:
     """
-    Get the current session ID from thread-local storage.
+    Get the current session ID.
+
+    The session of the current task, set by `SessionMiddleware` or
+    `set_current_session_id`, takes precedence over thread-local storage, which
+    concurrent requests handled on one thread overwrite.
 
     Returns:
         The session ID if available, None otherwise.
     """
+    cell = _session_cell.get()
+    if cell is not None:
+        return cell.session_id
     session_id = getattr(_session_context, "session_id", None)
     if session_id:
         logger.debug(f"Retrieved session ID from thread-local storage: {session_id}")
@@ -157,13 +216,21 @@ def get_current_session_id() -> Optional[str]:
 
 def set_current_session_id(session_id: str) -> None:
     """
-    Set the current session ID in thread-local storage.
+    Set the current session ID for the current task and in thread-local storage.
 
     Args:
         session_id: The session ID to store.
     """
     logger.debug(f"Setting session ID in thread-local storage: {session_id}")
     _session_context.session_id = session_id
+    _session_cell.set(_SessionCell(session_id))
+
+
+def clear_current_session_id() -> None:
+    """Remove the session ID of the current task and from thread-local storage."""
+    if hasattr(_session_context, "session_id"):
+        delattr(_session_context, "session_id")
+    _session_cell.set(None)
 
 
 def get_current_session_id_async() -> Optional[str]:
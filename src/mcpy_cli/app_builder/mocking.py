@@ -6,6 +6,8 @@ import sys
 from typing import Any, TYPE_CHECKING, Union
 from starlette.applications import Starlette
 
+from ..utils.profiling import profile_phase
+
 
 # Mock FastMCP class for testing when the library is not installed
 class MockFastMCP:
@@ -48,7 +50,8 @@ else:
 def get_fastmcp_class():
     """Get the FastMCP class, using mock if real one is not available."""
     try:
-        from fastmcp import FastMCP
+        with profile_phase("framework_import"):
+            from fastmcp import FastMCP
 
         return FastMCP
     except ImportError:
@@ -0,0 +1,198 @@
+"""
+Cross-session result cache of pure tools for MCP applications.
+
+A tool declared pure, with `tool_options(pure=True)` or `"pure": true` in the
+`--tool-config` file, returns the same result for the same arguments no matter who
+calls it. Its results are cached once for all sessions, in every transport mode, so
+identical calls from thousands of sessions run the tool once per TTL:
+
+    from mcpy_cli.tool_options import tool_options
+
+    @tool_options(pure=True, cache_ttl=3600)
+    def geocode(address: str) -> dict:
+        ...
+
+The cache is bounded in entries and approximate bytes, evicting the least recently
+used results first, and keeps per-tool hit ratios. It is cleared when the code is
+hot reloaded. With the SQLite backend, results are shared by the worker processes of
+the host and survive restarts. Keys include a fingerprint of the tool's source file,
+so results of an earlier version of the file are never served after a restart;
+changes to modules the file imports are not detected.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import pathlib
+from typing import Any, Callable, Dict, Optional
+
+from .call_keys import bind_arguments, call_key
+from .caching import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    BoundedResultStore,
+    ResultStore,
+    call_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def code_fingerprint(file_path: pathlib.Path) -> str:
+    """
+    A hash of the contents of a tool's source file, or an empty string if the file
+    cannot be read.
+    """
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+class ToolResultCache:
+    """Results of pure tools, shared by all sessions and keyed by tool and arguments."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        ttl: Optional[float] = None,
+        store: Optional[ResultStore] = None,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached results. None means unbounded.
+            max_bytes: Maximum approximate size in bytes of all cached results. None
+                means unbounded.
+            ttl: Seconds after which results expire, for tools that do not set their
+                own `cache_ttl`. None keeps results until they are evicted.
+            store: The backend holding the results, grouped by tool. When given, the
+                limits are those of the store and the other arguments are ignored.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        self._store = (
+            store
+            if store is not None
+            else BoundedResultStore(max_entries, None, max_bytes, ttl)
+        )
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def get_call_key(tool_args: Dict[str, Any], fingerprint: str = "") -> Optional[str]:
+        """
+        Generate a canonical key from tool arguments and the fingerprint of the tool's
+        code, or None if the arguments have none (see
+        `mcpy_cli.app_builder.call_keys`).
+        """
+        return call_key(tool_args, fingerprint)
+
+    def _tool_stats(self, tool_name: str) -> Dict[str, int]:
+        stats = self._stats.get(tool_name)
+        if stats is None:
+            stats = self._stats[tool_name] = {"calls": 0, "hits": 0}
+        return stats
+
+    async def call(
+        self,
+        tool_name: str,
+        func: Callable[..., Any],
+        args: Any,
+        kwargs: Dict[str, Any],
+        ttl: Optional[float] = None,
+        fingerprint: str = "",
+    ) -> Any:
+        """
+        Return the cached result of a call, or run the tool and cache its result.
+
+        Args:
+            tool_name: The tool key, used to tell tools apart and in statistics.
+            func: The tool callable, synchronous or async.
+            args: Positional arguments for the callable.
+            kwargs: Keyword arguments for the callable. Together with the positional
+                ones, bound to the signature, they identify the call.
+            ttl: Seconds the result stays valid, instead of the cache default.
+            fingerprint: Fingerprint of the tool's code, so results of other versions
+                of it are not returned.
+
+        Returns:
+            The result of the call.
+        """
+        stats = self._tool_stats(tool_name)
+        stats["calls"] += 1
+        arguments = bind_arguments(func, args, kwargs)
+        key = (
+            self.get_call_key(arguments, fingerprint)
+            if arguments is not None
+            else None
+        )
+        if key is not None:
+            cached = await call_store(self._store, self._store.get, tool_name, key)
+            if cached is not None:
+                stats["hits"] += 1
+                return cached
+
+        result = func(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        if key is not None:
+            await call_store(self._store, self._store.set, tool_name, key, result, ttl)
+        return result
+
+    def wrap_tool(
+        self,
+        func: Callable[..., Any],
+        tool_name: str,
+        ttl: Optional[float] = None,
+        fingerprint: str = "",
+    ) -> Callable[..., Any]:
+        """
+        Wrap a pure tool so its results are cached across sessions.
+
+        The wrapper keeps the wrapped function's name, docstring and signature, so
+        FastMCP derives the same schema as for the original function.
+
+        Args:
+            func: The tool callable, synchronous or async.
+            tool_name: The tool key.
+            ttl: Seconds the tool's results stay valid, instead of the cache default.
+            fingerprint: Fingerprint of the tool's code (see `code_fingerprint`).
+
+        Returns:
+            An async callable suitable for FastMCP tool registration.
+        """
+        logger.info(f"Caching results of pure tool '{tool_name}' across sessions")
+
+        @functools.wraps(func)
+        async def pure_tool(*args, **kwargs):
+            return await self.call(tool_name, func, args, kwargs, ttl, fingerprint)
+
+        return pure_tool
+
+    @property
+    def store(self) -> ResultStore:
+        """The backend holding the cached results."""
+        return self._store
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._store.clear()
+        logger.debug("Cleared the pure tool result cache")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the cache size and counters, and the hit ratio of every pure tool."""
+        stats = self._store.get_stats()
+        stats.pop("groups", None)
+        stats.pop("max_entries_per_group", None)
+        stats["tools"] = {
+            tool_name: {
+                **tool_stats,
+                "hit_ratio": tool_stats["hits"] / tool_stats["calls"]
+                if tool_stats["calls"]
+                else 0.0,
+            }
+            for tool_name, tool_stats in self._stats.items()
+        }
+        return stats
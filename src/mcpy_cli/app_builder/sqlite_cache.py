@@ -0,0 +1,420 @@
+"""
+SQLite cache backend for MCP applications.
+
+Results are stored in a SQLite database on local disk in WAL mode, so they survive
+restarts and are shared by all server processes on the host: every uvicorn worker
+opens the same file and sees the results the others cached. Readers never block
+writers, and concurrent writers wait for each other up to a busy timeout.
+
+Each cache (e.g. "session" and "pure") has its own table in the database. Triggers
+keep the entry count and total size of every table in a totals row, so checking the
+bounds does not scan the table. Least recently used entries are evicted first; the
+access time is refreshed at most once per second per entry, so cache hits rarely
+write. Results are stored pickled, which preserves their Python types; results that
+cannot be pickled are not cached.
+"""
+
+import logging
+import os
+import pathlib
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .caching import (
+    CACHE_BACKEND_SQLITE,
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    ResultStore,
+    validate_cache_limits,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for another process holding the write lock
+DEFAULT_BUSY_TIMEOUT = 5.0
+# Access times newer than this many seconds are not refreshed on a hit
+_TOUCH_INTERVAL = 1.0
+
+
+class SQLiteResultStore(ResultStore):
+    """
+    Store of results in a SQLite database, shared by the processes using the file.
+
+    Entries are evicted least recently used first when a group holds more than
+    `max_entries_per_group` entries, or when the table holds more than `max_entries`
+    entries or `max_bytes` bytes of pickled results. Expiry uses wall-clock time, so
+    TTLs hold across processes and restarts. The store is safe to use from several
+    threads: each thread of each process has its own connection.
+    """
+
+    backend = CACHE_BACKEND_SQLITE
+
+    def __init__(
+        self,
+        db_path: Union[str, pathlib.Path],
+        namespace: str = "results",
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_entries_per_group: Optional[int] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        ttl: Optional[float] = None,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+    ):
+        """
+        Args:
+            db_path: Path to the database file, created if it does not exist.
+            namespace: Name of the cache; caches sharing the database file with
+                another name are kept apart.
+            max_entries: Maximum number of entries. None means unbounded.
+            max_entries_per_group: Maximum number of entries of one group. None
+                means unbounded.
+            max_bytes: Maximum size in bytes of all pickled results. None means
+                unbounded.
+            ttl: Default seconds after which an entry expires. None keeps entries
+                until they are evicted.
+            busy_timeout: Seconds to wait for another process holding the write lock.
+
+        Raises:
+            ValueError: If a limit is not positive or the namespace is not a valid
+                identifier.
+            sqlite3.Error: If the database cannot be opened.
+        """
+        validate_cache_limits(
+            max_entries=max_entries,
+            max_entries_per_group=max_entries_per_group,
+            max_bytes=max_bytes,
+            ttl=ttl,
+        )
+        if not namespace.isidentifier():
+            raise ValueError(f"Invalid cache namespace '{namespace}'")
+        self.db_path = pathlib.Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.max_entries_per_group = max_entries_per_group
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.busy_timeout = busy_timeout
+        self._table = f"cache_{namespace}"
+        # Connections by thread; a process started by fork opens its own
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.oversized = 0
+        self.unpicklable = 0
+        self._initialize_db()
+        logger.info(f"Initialized SQLite '{namespace}' cache at {self.db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current thread and process."""
+        local = self._local
+        conn: Optional[sqlite3.Connection] = getattr(local, "conn", None)
+        if (
+            conn is not None
+            and local.pid == os.getpid()
+            and local.generation == self._generation
+        ):
+            return conn
+        # Autocommit mode; writes open their transactions explicitly
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode, NORMAL only syncs at checkpoints and stays crash-safe
+        conn.execute("PRAGMA synchronous=NORMAL")
+        local.conn = conn
+        local.pid = os.getpid()
+        local.generation = self._generation
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction, taking the write lock up front to avoid deadlocks."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _initialize_db(self) -> None:
+        """Create the cache table, its indexes and the triggers keeping its totals."""
+        table = self._table
+        conn = self._connect()
+        # Only takes effect in a new database; lets compaction return freed pages
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_totals (
+                    name TEXT PRIMARY KEY,
+                    entries INTEGER NOT NULL,
+                    bytes INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    grp TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (grp, key)
+                )
+                """
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table}(accessed_at)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_expires ON {table}(expires_at)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO cache_totals (name, entries, bytes) "
+                "VALUES (?, 0, 0)",
+                (table,),
+            )
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_insert AFTER INSERT ON {table}
+                BEGIN
+                    UPDATE cache_totals
+                    SET entries = entries + 1, bytes = bytes + NEW.size
+                    WHERE name = '{table}';
+                END
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_delete AFTER DELETE ON {table}
+                BEGIN
+                    UPDATE cache_totals
+                    SET entries = entries - 1, bytes = bytes - OLD.size
+                    WHERE name = '{table}';
+                END
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_update
+                AFTER UPDATE OF size ON {table}
+                BEGIN
+                    UPDATE cache_totals
+                    SET bytes = bytes + NEW.size - OLD.size
+                    WHERE name = '{table}';
+                END
+                """
+            )
+
+    def _totals(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        row = conn.execute(
+            "SELECT entries, bytes FROM cache_totals WHERE name = ?", (self._table,)
+        ).fetchone()
+        return {"entries": row[0], "bytes": row[1]}
+
+    def _delete_expired(self, conn: sqlite3.Connection, now: float) -> int:
+        cursor = conn.execute(
+            f"DELETE FROM {self._table} WHERE expires_at <= ?", (now,)
+        )
+        return max(cursor.rowcount, 0)
+
+    def _evict(self, conn: sqlite3.Connection, group: str) -> None:
+        """Enforce the bounds inside a write transaction."""
+        table = self._table
+        if self.max_entries_per_group is not None:
+            (count,) = conn.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE grp = ?", (group,)
+            ).fetchone()
+            if count > self.max_entries_per_group:
+                cursor = conn.execute(
+                    f"""
+                    DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table} WHERE grp = ?
+                        ORDER BY accessed_at, rowid LIMIT ?
+                    )
+                    """,
+                    (group, count - self.max_entries_per_group),
+                )
+                self.evictions += cursor.rowcount
+
+        totals = self._totals(conn)
+        over_entries = (
+            self.max_entries is not None and totals["entries"] > self.max_entries
+        )
+        over_bytes = self.max_bytes is not None and totals["bytes"] > self.max_bytes
+        if not (over_entries or over_bytes):
+            return
+        # Expired entries go first, before any live one is evicted
+        self.expirations += self._delete_expired(conn, time.time())
+        totals = self._totals(conn)
+
+        if self.max_entries is not None and totals["entries"] > self.max_entries:
+            cursor = conn.execute(
+                f"""
+                DELETE FROM {table} WHERE rowid IN (
+                    SELECT rowid FROM {table} ORDER BY accessed_at, rowid LIMIT ?
+                )
+                """,
+                (totals["entries"] - self.max_entries,),
+            )
+            self.evictions += cursor.rowcount
+            totals = self._totals(conn)
+
+        if self.max_bytes is not None and totals["bytes"] > self.max_bytes:
+            excess = totals["bytes"] - self.max_bytes
+            victims = []
+            for rowid, size in conn.execute(
+                f"SELECT rowid, size FROM {table} ORDER BY accessed_at, rowid"
+            ):
+                victims.append((rowid,))
+                excess -= size
+                if excess <= 0:
+                    break
+            conn.executemany(f"DELETE FROM {table} WHERE rowid = ?", victims)
+            self.evictions += len(victims)
+
+    def get(self, group: str, key: str) -> Optional[Any]:
+        conn = self._connect()
+        row = conn.execute(
+            f"SELECT value, expires_at, accessed_at FROM {self._table} "
+            f"WHERE grp = ? AND key = ?",
+            (group, key),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        value, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            conn.execute(
+                f"DELETE FROM {self._table} "
+                f"WHERE grp = ? AND key = ? AND expires_at <= ?",
+                (group, key, now),
+            )
+            self.expirations += 1
+            self.misses += 1
+            return None
+        try:
+            result = pickle.loads(value)
+        except Exception as e:
+            # E.g. the class of the result no longer exists after a code change
+            logger.debug(f"Dropping cached result that cannot be unpickled: {e}")
+            conn.execute(
+                f"DELETE FROM {self._table} WHERE grp = ? AND key = ?", (group, key)
+            )
+            self.misses += 1
+            return None
+        if now - accessed_at > _TOUCH_INTERVAL:
+            conn.execute(
+                f"UPDATE {self._table} SET accessed_at = ? WHERE grp = ? AND key = ?",
+                (now, group, key),
+            )
+        self.hits += 1
+        return result
+
+    def set(
+        self, group: str, key: str, result: Any, ttl: Optional[float] = None
+    ) -> bool:
+        if result is None:
+            return False
+        try:
+            value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.unpicklable += 1
+            logger.debug(f"Result cannot be pickled and is not cached: {e}")
+            return False
+        size = len(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.oversized += 1
+            return False
+
+        ttl = ttl if ttl is not None else self.ttl
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                f"""
+                INSERT INTO {self._table}
+                    (grp, key, value, size, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (grp, key) DO UPDATE SET
+                    value = excluded.value,
+                    size = excluded.size,
+                    expires_at = excluded.expires_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (group, key, value, size, now + ttl if ttl is not None else None, now),
+            )
+            self._evict(conn, group)
+        return True
+
+    def clear_group(self, group: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(f"DELETE FROM {self._table} WHERE grp = ?", (group,))
+
+    def clear(self) -> None:
+        with self._transaction() as conn:
+            conn.execute(f"DELETE FROM {self._table}")
+
+    def compact(self) -> None:
+        """
+        Remove expired entries, enforce the bounds, return free pages to the file
+        system and checkpoint the write-ahead log.
+        """
+        with self._transaction() as conn:
+            self.expirations += self._delete_expired(conn, time.time())
+            self._evict(conn, "")
+        conn = self._connect()
+        conn.execute("PRAGMA incremental_vacuum")
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        totals = self._totals(conn)
+        (groups,) = conn.execute(
+            f"SELECT COUNT(DISTINCT grp) FROM {self._table}"
+        ).fetchone()
+        return {
+            "backend": self.backend,
+            "path": str(self.db_path),
+            "groups": groups,
+            **totals,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "oversized": self.oversized,
+            "unpicklable": self.unpicklable,
+            "max_entries": self.max_entries,
+            "max_entries_per_group": self.max_entries_per_group,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
+
+    def close(self) -> None:
+        """Close the connections of all threads of this process."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to close cache connection: {e}")
@@ -0,0 +1,162 @@
+"""
+Streaming results of generator tools for MCP applications.
+
+Generator and async generator functions are served as tools whose yielded chunks are
+sent to the client as they are produced, instead of being collected into one result:
+
+    def export_rows(table: str) -> Iterator[str]:
+        for row in read_table(table):
+            yield row
+
+When the client asks for progress with a progress token (which streamable HTTP and
+SSE clients do to receive intermediate output), every chunk is sent as a progress
+notification on the request's stream, with the chunk as the notification message.
+The next chunk is only pulled from the generator once the previous one was sent, so
+server memory stays constant whatever the size of the output. The final tool result
+then only reports the number of chunks. Without a progress token the chunks cannot be
+streamed and are returned together as the tool result.
+
+Synchronous generators are advanced in the tool thread pool when the tool uses one.
+Generators cannot be sent back from worker processes, so streaming tools run in the
+server process even when they are routed to the process pool. Lazy tools are
+recognized as streaming from their source (`yield` in the function body), so with
+the process pool as default executor their module is imported by the server as well.
+"""
+
+import functools
+import inspect
+import logging
+from typing import Any, Callable, List, Optional
+
+from ..utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+def is_streaming_function(func: Callable[..., Any]) -> bool:
+    """Whether a tool function is a generator or async generator function."""
+    func = inspect.unwrap(func)
+    if not inspect.isroutine(func):
+        func = getattr(func, "__call__", func)
+    return inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+
+
+def is_stream(value: Any) -> bool:
+    """Whether a tool result is a generator or async generator to stream."""
+    return inspect.isgenerator(value) or inspect.isasyncgen(value)
+
+
+def _chunk_text(chunk: Any) -> str:
+    if isinstance(chunk, str):
+        return chunk
+    return dumps(chunk)
+
+
+def _progress_target() -> Optional[Any]:
+    """Return the FastMCP context of the current request if it has a progress token."""
+    try:
+        from fastmcp.server.dependencies import get_context
+
+        context = get_context()
+        meta = context.request_context.meta
+    except (ImportError, RuntimeError, ValueError, LookupError):
+        return None
+    if meta is None or meta.progressToken is None:
+        return None
+    return context
+
+
+async def _next_chunk(stream: Any, thread_pool: Optional[Any]) -> Any:
+    if inspect.isasyncgen(stream):
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return _END
+    if thread_pool is not None:
+        return await thread_pool.run(next, stream, _END)
+    return next(stream, _END)
+
+
+async def stream_result(
+    stream: Any, tool_name: str, thread_pool: Optional[Any] = None
+) -> Any:
+    """
+    Send the chunks of a generator to the client of the current request.
+
+    Args:
+        stream: The generator or async generator returned by the tool.
+        tool_name: The tool name used in logs.
+        thread_pool: Optional ToolThreadPool that advances synchronous generators.
+
+    Returns:
+        A summary of the streamed chunks, or the list of all chunks when the client
+        did not ask for progress notifications.
+    """
+    context = _progress_target()
+    collected: List[Any] = []
+    count = 0
+    try:
+        while True:
+            chunk = await _next_chunk(stream, thread_pool)
+            if chunk is _END:
+                break
+            count += 1
+            if context is None:
+                collected.append(chunk)
+                continue
+            await context.request_context.session.send_progress_notification(
+                progress_token=context.request_context.meta.progressToken,
+                progress=count,
+                message=_chunk_text(chunk),
+                related_request_id=context.request_id,
+            )
+    finally:
+        # Also runs when the call is cancelled, e.g. because it timed out
+        if inspect.isasyncgen(stream):
+            await stream.aclose()
+        else:
+            try:
+                stream.close()
+            except ValueError:
+                # Still running in an abandoned thread; it is closed when collected
+                pass
+
+    if context is None:
+        return collected
+    logger.debug(f"Streamed {count} chunk(s) of tool '{tool_name}'")
+    return {"streamed_chunks": count}
+
+
+def create_streaming_tool(
+    func: Callable[..., Any], tool_name: str, thread_pool: Optional[Any] = None
+) -> Callable[..., Any]:
+    """
+    Wrap a generator tool so its chunks are streamed to the client.
+
+    The wrapper keeps the wrapped function's name, docstring and signature, so
+    FastMCP derives the same schema as for the original function.
+
+    Args:
+        func: The generator or async generator function.
+        tool_name: The tool name used in logs.
+        thread_pool: Optional ToolThreadPool that creates and advances synchronous
+            generators off the event loop.
+
+    Returns:
+        An async callable suitable for FastMCP tool registration.
+    """
+    offload = thread_pool is not None and not inspect.isasyncgenfunction(
+        inspect.unwrap(func)
+    )
+
+    @functools.wraps(func)
+    async def streaming_tool(*args, **kwargs):
+        if offload:
+            stream = await thread_pool.run(func, *args, **kwargs)
+        else:
+            stream = func(*args, **kwargs)
+        return await stream_result(stream, tool_name, thread_pool if offload else None)
+
+    return streaming_tool
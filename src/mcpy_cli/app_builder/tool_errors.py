@@ -0,0 +1,116 @@
+"""
+Protocol-level errors raised while serving tool calls.
+
+FastMCP reports every exception raised by a tool as a tool result with `isError`
+set, which clients treat as a failed tool execution. Conditions caused by the server
+rather than the tool, such as overload or a call running out of time, are reported
+as JSON-RPC errors instead so clients can tell them apart and retry.
+`install_tool_error_passthrough` replaces the call-tool request handler of a FastMCP
+instance so that `ToolProtocolError`s reach the JSON-RPC layer.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from mcp import types
+from mcp.shared.exceptions import McpError
+
+logger = logging.getLogger(__name__)
+
+# Implementation-defined JSON-RPC server error (-32000 to -32099), mirrors HTTP 429
+SERVER_BUSY = -32029
+# Implementation-defined JSON-RPC server error, mirrors HTTP 408
+TOOL_TIMEOUT = -32008
+
+
+class ToolProtocolError(McpError):
+    """A tool call failure that is reported as a JSON-RPC error."""
+
+    def __init__(self, code: int, message: str, data: Optional[Dict[str, Any]] = None):
+        super().__init__(types.ErrorData(code=code, message=message, data=data))
+
+
+class ServerBusyError(ToolProtocolError):
+    """Raised when a tool call is rejected because the tool is at capacity."""
+
+    def __init__(self, tool_name: str, reason: str, **details: Any):
+        """
+        Args:
+            tool_name: The tool that rejected the call.
+            reason: "queue_full" or "max_wait_exceeded".
+            **details: Additional fields for the error data, e.g. the queue depth.
+        """
+        super().__init__(
+            SERVER_BUSY,
+            f"Server busy: tool '{tool_name}' is at capacity ({reason})",
+            {"tool": tool_name, "reason": reason, **details},
+        )
+
+
+class ToolTimeoutError(ToolProtocolError):
+    """Raised when a tool call is cancelled because it ran longer than its timeout."""
+
+    def __init__(self, tool_name: str, timeout: float):
+        """
+        Args:
+            tool_name: The tool whose call timed out.
+            timeout: The timeout of the tool in seconds.
+        """
+        super().__init__(
+            TOOL_TIMEOUT,
+            f"Tool '{tool_name}' timed out after {timeout}s",
+            {"tool": tool_name, "timeout": timeout},
+        )
+
+
+def find_tool_protocol_error(error: BaseException) -> Optional[ToolProtocolError]:
+    """Find a ToolProtocolError in an exception's chain of causes."""
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, ToolProtocolError):
+            return current
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def install_tool_error_passthrough(mcp_instance: Any) -> None:
+    """
+    Let ToolProtocolErrors raised by tools reach the client as JSON-RPC errors.
+
+    Other exceptions are still reported as tool results with `isError` set, exactly
+    like FastMCP's own handler does. Instances without a low-level MCP server (the
+    test mock) are left unchanged.
+
+    Args:
+        mcp_instance: The FastMCP instance that serves tool calls.
+    """
+    server = getattr(mcp_instance, "_mcp_server", None)
+    call_tool = getattr(mcp_instance, "_mcp_call_tool", None)
+    if server is None or call_tool is None:
+        return
+
+    async def handler(request: types.CallToolRequest) -> types.ServerResult:
+        try:
+            results = await call_tool(
+                request.params.name, request.params.arguments or {}
+            )
+        except Exception as e:
+            protocol_error = find_tool_protocol_error(e)
+            if protocol_error is not None:
+                logger.warning(
+                    f"Tool call '{request.params.name}' failed: {protocol_error}"
+                )
+                raise protocol_error
+            return types.ServerResult(
+                types.CallToolResult(
+                    content=[types.TextContent(type="text", text=str(e))],
+                    isError=True,
+                )
+            )
+        return types.ServerResult(
+            types.CallToolResult(content=list(results), isError=False)
+        )
+
+    server.request_handlers[types.CallToolRequest] = handler
@@ -7,9 +7,15 @@ import pathlib
 from logging import getLogger
 from typing import Any, Callable, Dict, Optional
 
-from ..discovery import _load_module_from_path
+from ..discovery import module_registry
+from ..static_discovery import get_module_docstring_static
 from .caching import SessionToolCallCache
+from .limits import ToolLimits
+from .micro_batching import is_batched_tool
+from .streaming import create_streaming_tool, is_streaming_function
+from ..tool_options import get_tool_options
 from ..utils.schema_utils import get_cached_typeadapter
+from ..utils.profiling import get_active_profiler, profile_phase
 
 logger = getLogger(__name__)
 
@@ -90,6 +96,20 @@ def validate_tool_meta(
     comments = inspect.getcomments(func)
 
     # 3. Append the comments to the docstring for additional info
+    return build_tool_description(docstring, comments)
+
+
+def build_tool_description(docstring: str, comments: Optional[str]) -> str:
+    """
+    Builds a tool description from a function docstring and its preceding comments.
+
+    Args:
+        docstring: The cleaned function docstring
+        comments: The comment block preceding the function, if any
+
+    Returns:
+        The description used when registering the tool
+    """
     if comments:
         docstring = (
             docstring
@@ -148,6 +168,9 @@ def wrap_tool_function(
     file_path: pathlib.Path,
     docstring: str,
     tool_call_cache: Optional[SessionToolCallCache] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+    tool_executor: Optional[Any] = None,
+    tool_limits: Optional[ToolLimits] = None,
 ) -> bool:
     """
     Wraps a function as an MCP tool with optional schema and caching.
@@ -158,8 +181,15 @@ def wrap_tool_function(
         func_name: The name of the function
         file_path: The path to the file containing the function
         docstring: The function's docstring to use as description
-        schema: Optional JSON schema for the function parameters
         tool_call_cache: Optional cache for tool call results
+        parameters: Optional precomputed JSON schema for the function parameters.
+            When given, FastMCP's own schema generation is skipped.
+        tool_executor: Optional executor (a ToolExecutors, ToolThreadPool or
+            ToolProcessPool) that picks where the tool runs. Tools it does not claim,
+            such as async tools by default, run on the event loop.
+        tool_limits: Optional per-tool options and concurrency limits. Options
+            declared with `tool_options` are honored even without it, except for
+            concurrency limits.
 
     Returns:
         True if wrapping was successful, False otherwise
@@ -175,12 +205,53 @@ def wrap_tool_function(
             if hasattr(func, "__call__"):
                 func = func.__call__
 
-        # Apply tool call caching if provided
         target_func = original_func if original_func != func else func
-        if tool_call_cache is not None:
-            target_func = tool_call_cache.create_cached_tool(target_func)
+        if tool_limits is not None:
+            options = tool_limits.options_for(original_func, func_name, file_path)
+        else:
+            options = dict(get_tool_options(original_func))
+        executor = (
+            tool_executor.for_tool(original_func, options)
+            if tool_executor is not None
+            else None
+        )
+
+        if is_streaming_function(original_func):
+            # Generators are consumed chunk by chunk, never cached as a whole
+            if tool_call_cache is not None:
+                logger.warning(
+                    f"Tool call caching is not applied to '{func_name}', which streams its results."
+                )
+            if executor is not None and executor.out_of_process:
+                logger.warning(
+                    f"Streaming tool '{func_name}' cannot run in the process pool, running it in this process."
+                )
+                executor = None
+            target_func = create_streaming_tool(target_func, func_name, executor)
+        else:
+            # Offload synchronous tools so they do not block the event loop
+            if executor is not None:
+                target_func = executor.wrap_tool(target_func, func_name, file_path)
+
+            # The cache wraps the executor, so hits never reach a pool and results
+            # of async and process pool tools are cached once awaited. Results of
+            # pure tools are cached across sessions by the tool limits instead.
+            if tool_call_cache is not None and not options.get("pure"):
+                target_func = tool_call_cache.create_cached_tool(
+                    target_func, f"{file_path.as_posix()}:{func_name}"
+                )
+
+        # Admission control is outermost, so queued calls do not hold pool workers
+        if tool_limits is not None:
+            target_func = tool_limits.wrap_tool(
+                target_func, func_name, file_path, options
+            )
+            if is_batched_tool(target_func):
+                # The precomputed schema describes the list parameters of the batch
+                # function; let FastMCP derive the per-item schema instead
+                parameters = None
 
-        mcp_instance.tool(name=func_name, description=docstring)(target_func)
+        register_tool(mcp_instance, target_func, func_name, docstring, parameters)
 
         logger.info(
             f"Successfully wrapped function '{func_name}' from '{file_path}' as an MCP tool."
@@ -195,12 +266,121 @@ def wrap_tool_function(
         return False
 
 
+def register_tool(
+    mcp_instance: Any,
+    func: Callable[..., Any],
+    func_name: str,
+    description: str,
+    parameters: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Registers a callable on a FastMCP instance.
+
+    Without `parameters`, the tool goes through `FastMCP.tool()`, which derives the
+    schema from the signature. With `parameters`, a `Tool` is built directly from the
+    given schema and added to the instance's tool manager.
+
+    FastMCP validates the arguments of every call with a TypeAdapter it already caches
+    per callable, but it inspects the callable's signature again on every call (to
+    find a `Context` parameter and the parameters to pre-parse from JSON). The
+    signature is therefore computed once here and pinned on the callable.
+
+    Args:
+        mcp_instance: The FastMCP instance to add the tool to
+        func: The callable invoked for tool calls
+        func_name: The tool name
+        description: The tool description
+        parameters: Optional precomputed JSON schema for the tool parameters
+    """
+    _pin_signature(func)
+    with profile_phase("registration"):
+        tool_manager = getattr(mcp_instance, "_tool_manager", None)
+        if parameters is None or tool_manager is None:
+            if get_active_profiler() is not None:
+                _warm_fastmcp_typeadapter(func)
+            mcp_instance.tool(name=func_name, description=description)(func)
+            return
+
+        from fastmcp.tools import Tool
+
+        tool_manager.add_tool(
+            Tool(
+                fn=func,
+                name=func_name,
+                description=description,
+                parameters=parameters,
+                tags=set(),
+                annotations=None,
+                serializer=getattr(tool_manager, "_serializer", None),
+            )
+        )
+        # FastMCP caches the aggregated tool listing; invalidate it like add_tool() does
+        cache = getattr(mcp_instance, "_cache", None)
+        if cache is not None:
+            cache.clear()
+
+
+def _pin_signature(func: Callable[..., Any]) -> None:
+    """
+    Store the signature of a tool callable as its `__signature__`, which
+    `inspect.signature` returns as is instead of computing it again.
+    """
+    if getattr(func, "__signature__", None) is not None:
+        # Already pinned, e.g. by micro-batching
+        return
+    try:
+        func.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
+    except (TypeError, ValueError, AttributeError):
+        # No signature (registration reports it), or an object that does not take
+        # attributes; the signature is then computed on every call
+        pass
+
+
+def _warm_fastmcp_typeadapter(func: Callable[..., Any]) -> None:
+    """
+    Build FastMCP's cached TypeAdapter for a function ahead of registration so that
+    startup profiles attribute its cost to the "schema" phase.
+    """
+    try:
+        from fastmcp.utilities.types import get_cached_typeadapter as fastmcp_adapter
+    except ImportError:
+        return
+    with profile_phase("schema"):
+        try:
+            fastmcp_adapter(func)
+        except Exception:
+            # Registration reports the error
+            pass
+
+
+def get_registered_tool_schema(
+    mcp_instance: Any, func_name: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Returns the parameter schema FastMCP generated for a registered tool.
+
+    Args:
+        mcp_instance: The FastMCP instance holding the tool
+        func_name: The tool name
+
+    Returns:
+        The JSON schema, or None if it is not available (e.g. with MockFastMCP)
+    """
+    tool_manager = getattr(mcp_instance, "_tool_manager", None)
+    if tool_manager is None or not tool_manager.has_tool(func_name):
+        return None
+    schema: Dict[str, Any] = tool_manager.get_tool(func_name).parameters
+    return schema
+
+
 def validate_and_wrap_tool(
     mcp_instance: Any,  # Use Any instead of FastMCP to avoid type errors
     func: Callable[..., Any],
     func_name: str,
     file_path: pathlib.Path,
     tool_call_cache: Optional[SessionToolCallCache] = None,
+    tool_executor: Optional[Any] = None,
+    tool_limits: Optional[ToolLimits] = None,
 ) -> bool:
     """
     Validates function signature and docstring, then wraps it as an MCP tool.
@@ -212,17 +392,20 @@ def validate_and_wrap_tool(
         func_name: The name of the function.
         file_path: The path to the file containing the function.
         tool_call_cache: Optional cache for tool call results.
+        tool_executor: Optional executor that picks where the tool runs.
+        tool_limits: Optional per-tool options and concurrency limits.
 
     Returns:
         True if validation and wrapping were successful, False otherwise
     """
     # Step 1: Validate the function
-    docstring = validate_tool_meta(func, func_name, file_path)
+    with profile_phase("validate_tool_meta"):
+        docstring = validate_tool_meta(func, func_name, file_path)
 
-    # Step 2: Generate schema for the function
-    # schema = generate_tool_schema(func, func_name)
-
-    # Step 3: Wrap the function as a tool (even if validation found issues)
+    # Step 2: Wrap the function as a tool (even if validation found issues). FastMCP
+    # derives the schema at registration, from the wrapped callable that is registered
+    # (micro-batching changes its signature), and caches the TypeAdapter it validates
+    # the arguments of every call with.
     return wrap_tool_function(
         mcp_instance=mcp_instance,
         func=func,
@@ -230,6 +413,8 @@ def validate_and_wrap_tool(
         file_path=file_path,
         docstring=docstring,
         tool_call_cache=tool_call_cache,
+        tool_executor=tool_executor,
+        tool_limits=tool_limits,
     )
 
 
@@ -237,6 +422,10 @@ def get_module_docstring(file_path: pathlib.Path) -> Optional[str]:
     """
     Extract the module docstring from a Python file.
 
+    The docstring is taken from the already loaded module when discovery imported
+    it, and read from the file's AST otherwise, so the module is never executed
+    again just to read its docstring.
+
     Args:
         file_path: Path to the Python file
 
@@ -244,10 +433,11 @@ def get_module_docstring(file_path: pathlib.Path) -> Optional[str]:
         The module docstring if found, None otherwise
     """
     try:
-        module = _load_module_from_path(file_path)
-        if module and module.__doc__:
-            # Clean up the docstring - remove leading/trailing whitespace and normalize newlines
-            docstring = inspect.cleandoc(module.__doc__)
+        if module_registry.get(file_path) is not None:
+            docstring = module_registry.get_docstring(file_path)
+        else:
+            docstring = get_module_docstring_static(file_path)
+        if docstring:
             logger.debug(f"Extracted docstring from {file_path}: {docstring[:100]}...")
             return docstring
         else:
@@ -5,5 +5,11 @@ CLI command modules.
 from .run import run_command
 from .package import package_command
 from .example import example_command
+from .profile import profile_startup_command
 
-__all__ = ["run_command", "package_command", "example_command"]
+__all__ = [
+    "run_command",
+    "package_command",
+    "example_command",
+    "profile_startup_command",
+]
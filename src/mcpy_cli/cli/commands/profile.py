@@ -0,0 +1,122 @@
+"""
+Profile-startup command implementation for the CLI.
+"""
+
+import typer
+import logging
+import pathlib
+import sys
+from typing_extensions import Annotated
+from typing import Optional
+
+from ...utils import validate_source_path
+from ..config import CommonOptions
+
+# Configure a logger for the CLI
+cli_logger = logging.getLogger("mcp_sdk_cli.profile")
+
+
+def profile_startup_command(
+    ctx: typer.Context,
+    json_output: Annotated[
+        Optional[str],
+        typer.Option(
+            "--json-output",
+            help="Write the profile as JSON to this file. Use '-' to print JSON instead of the table.",
+            rich_help_panel="Profile Configuration",
+        ),
+    ] = None,
+    top_files: Annotated[
+        int,
+        typer.Option(
+            help="Number of slowest file imports to list in the table.",
+            rich_help_panel="Profile Configuration",
+        ),
+    ] = 10,
+    discovery_cache: Annotated[
+        bool,
+        typer.Option(
+            help="Profile with the on-disk discovery manifest enabled.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    discovery_cache_path: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Custom path for the discovery manifest.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    lazy_tools: Annotated[
+        bool,
+        typer.Option(
+            help="Profile with lazy tool registration enabled.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    scan_max_depth: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Maximum directory depth to scan for Python files.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+):
+    """
+    Profile MCP application startup without starting a server.
+
+    Runs the same pipeline as 'run' (scan, import, validation, registration, schema
+    generation, mounting and HTTP app creation) and reports wall and CPU time per
+    phase, peak RSS and the modules imported by each file.
+    """
+    common_opts: CommonOptions = ctx.obj
+
+    if common_opts.source_path is None:
+        cli_logger.error("Source path is required but was not configured.")
+        sys.exit(1)
+
+    if not validate_source_path(common_opts.source_path, cli_logger):
+        cli_logger.error(
+            "Source path validation failed. Please check the path and ensure it contains valid Python files."
+        )
+        sys.exit(1)
+
+    from ...app_builder import create_mcp_application
+    from ...utils import TransformationError
+    from ...utils.profiling import StartupProfiler, activate_profiler
+
+    profiler = StartupProfiler()
+    try:
+        with activate_profiler(profiler):
+            create_mcp_application(
+                source_path_str=common_opts.source_path,
+                target_function_names=common_opts.functions,
+                mcp_server_name=common_opts.mcp_name,
+                mcp_server_root_path=common_opts.server_root,
+                mcp_service_base_path=common_opts.mcp_base,
+                cors_enabled=common_opts.cors_enabled,
+                cors_allow_origins=common_opts.cors_allow_origins,
+                mode=common_opts.mode.lower(),
+                enable_event_store=common_opts.enable_event_store,
+                event_store_path=common_opts.event_store_path,
+                stateless_http=common_opts.stateless_http,
+                json_response=common_opts.json_response,
+                legacy_sse=common_opts.legacy_sse,
+                discovery_cache=discovery_cache,
+                discovery_cache_path=discovery_cache_path,
+                lazy_tools=lazy_tools,
+                scan_max_depth=scan_max_depth,
+            )
+    except TransformationError as e:
+        cli_logger.error(f"Failed to create MCP application: {e}")
+        sys.exit(1)
+
+    if json_output == "-":
+        typer.echo(profiler.to_json())
+        return
+
+    typer.echo(profiler.format_table(top_files=top_files))
+    if json_output:
+        output_path = pathlib.Path(json_output)
+        output_path.write_text(profiler.to_json(), encoding="utf-8")
+        cli_logger.info(f"Wrote startup profile to {output_path.absolute()}")
@@ -36,7 +36,8 @@ def run_command(
     reload: Annotated[
         bool,
         typer.Option(
-            help="Enable auto-reload for development.", rich_help_panel="Development"
+            help="Enable incremental hot reload for development: changed files are rebuilt and swapped into the running server without a restart.",
+            rich_help_panel="Development",
         ),
     ] = False,
     workers: Annotated[
@@ -46,6 +47,174 @@ def run_command(
             rich_help_panel="Development",
         ),
     ] = None,
+    discovery_workers: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Number of threads used to import source files concurrently during discovery. Default imports sequentially.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    discovery_cache: Annotated[
+        bool,
+        typer.Option(
+            help="Cache tool descriptions and schemas in an on-disk manifest keyed by file hash, so unchanged files skip validation and schema generation on restart.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    discovery_cache_path: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Custom path for the discovery manifest. Defaults to a file under $XDG_CACHE_HOME/mcpy-cli/manifests.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    lazy_tools: Annotated[
+        bool,
+        typer.Option(
+            help="Register tools from static metadata and import each module only on the first call to one of its tools.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    lazy_idle_timeout: Annotated[
+        Optional[float],
+        typer.Option(
+            help="With --lazy-tools, evict modules whose tools have not been called for this many seconds.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    scan_max_depth: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Maximum directory depth to scan for Python files. Exclude paths with a .mcpyignore file in the source directory.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    executor: Annotated[
+        str,
+        typer.Option(
+            help="Where synchronous tools run: 'inline' (on the event loop), 'thread' (in a bounded thread pool) or 'process' (in a pool of worker processes, for CPU-bound tools). Async tools run on the event loop. Override per tool with mcpy_cli.tool_options.tool_options(executor=...).",
+            rich_help_panel="Performance",
+        ),
+    ] = "inline",
+    executor_workers: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Size of the tool executor pool. Defaults to min(32, CPU count + 4) threads or CPU count processes.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    stats_path: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Expose runtime statistics (executor gauges, cache counters) as JSON at this HTTP path, e.g. /stats.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    tool_config: Annotated[
+        Optional[str],
+        typer.Option(
+            help="JSON file with per-tool options such as max_concurrency, max_queue, max_wait, timeout, coalesce, batch_size, batch_wait, warmup, pure and cache_ttl. Overrides options declared with mcpy_cli.tool_options.tool_options.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    tool_timeout: Annotated[
+        Optional[float],
+        typer.Option(
+            help="Default timeout in seconds for tool calls. Timed-out calls are cancelled and reported as a JSON-RPC error; process pool workers running them are killed. Override per tool with the timeout option.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    batch_tool: Annotated[
+        bool,
+        typer.Option(
+            help="Expose a batch_call tool (composed mode) that runs a list of {tool, arguments} calls concurrently and returns the results in order.",
+            rich_help_panel="Performance",
+        ),
+    ] = False,
+    batch_concurrency: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of calls of one batch_call request running at once.",
+            rich_help_panel="Performance",
+        ),
+    ] = 8,
+    cache_max_entries: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of tool results the session tool call cache (stateful JSON response mode) holds across all sessions. Least recently used results are evicted first.",
+            rich_help_panel="Performance",
+        ),
+    ] = 10000,
+    cache_max_entries_per_session: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of tool results the session tool call cache holds for one session.",
+            rich_help_panel="Performance",
+        ),
+    ] = 1000,
+    cache_max_bytes: Annotated[
+        int,
+        typer.Option(
+            help="Maximum approximate size in bytes (JSON encoded) of all results in the session tool call cache. Larger results are not cached.",
+            rich_help_panel="Performance",
+        ),
+    ] = 256 * 1024 * 1024,
+    cache_ttl: Annotated[
+        Optional[float],
+        typer.Option(
+            help="Seconds after which results in the session tool call cache expire. By default they are kept until evicted or the session ends.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    pure_cache_max_entries: Annotated[
+        int,
+        typer.Option(
+            help="Maximum number of results of pure tools (tool option pure) cached across sessions. Least recently used results are evicted first.",
+            rich_help_panel="Performance",
+        ),
+    ] = 10000,
+    pure_cache_max_bytes: Annotated[
+        int,
+        typer.Option(
+            help="Maximum approximate size in bytes (JSON encoded) of all cached results of pure tools.",
+            rich_help_panel="Performance",
+        ),
+    ] = 256 * 1024 * 1024,
+    pure_cache_ttl: Annotated[
+        Optional[float],
+        typer.Option(
+            help="Seconds after which cached results of pure tools expire, unless the tool sets its own cache_ttl option. By default they are kept until evicted.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    cache_backend: Annotated[
+        str,
+        typer.Option(
+            help="Where the tool result caches are kept: 'memory' (in each process) or 'sqlite' (in a local SQLite database shared by all worker processes and kept across restarts).",
+            rich_help_panel="Performance",
+        ),
+    ] = "memory",
+    cache_path: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Database file of the sqlite cache backend. Defaults to a file named after the source directory in the user cache directory.",
+            rich_help_panel="Performance",
+        ),
+    ] = None,
+    cache_compact_interval: Annotated[
+        float,
+        typer.Option(
+            help="Seconds between background compactions of the tool result caches, which remove expired results.",
+            rich_help_panel="Performance",
+        ),
+    ] = 60.0,
+    serializer: Annotated[
+        str,
+        typer.Option(
+            help="JSON serializer of tool results, JSON responses and stored events: 'auto' (orjson when installed, pydantic-core otherwise), 'orjson', 'pydantic' or 'json' (the standard library).",
+            rich_help_panel="Performance",
+        ),
+    ] = "auto",
 ):
     """
     Run an MCP service locally using Uvicorn.
@@ -161,6 +330,31 @@ def run_command(
             stateless_http=common_opts.stateless_http,
             json_response=common_opts.json_response,
             legacy_sse=common_opts.legacy_sse,
+            discovery_workers=discovery_workers,
+            discovery_cache=discovery_cache,
+            discovery_cache_path=discovery_cache_path,
+            lazy_tools=lazy_tools,
+            lazy_idle_timeout=lazy_idle_timeout,
+            scan_max_depth=scan_max_depth,
+            hot_reload=reload,
+            executor=executor.lower(),
+            executor_workers=executor_workers,
+            stats_path=stats_path,
+            tool_config=tool_config,
+            tool_timeout=tool_timeout,
+            batch_tool=batch_tool,
+            batch_concurrency=batch_concurrency,
+            cache_max_entries=cache_max_entries,
+            cache_max_entries_per_session=cache_max_entries_per_session,
+            cache_max_bytes=cache_max_bytes,
+            cache_ttl=cache_ttl,
+            pure_cache_max_entries=pure_cache_max_entries,
+            pure_cache_max_bytes=pure_cache_max_bytes,
+            pure_cache_ttl=pure_cache_ttl,
+            cache_backend=cache_backend.lower(),
+            cache_path=cache_path,
+            cache_compact_interval=cache_compact_interval,
+            serializer=serializer.lower(),
         )
 
         if mcp_app is None and not has_fastmcp:
@@ -185,7 +379,6 @@ def run_command(
             host=host,
             port=port,
             log_level=uvicorn_log_level,
-            reload=reload,
             workers=workers if workers is not None and workers > 0 else None,
         )
     except TransformationError as e:
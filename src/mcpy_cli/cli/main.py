@@ -10,7 +10,12 @@ from typing import Optional, List
 
 from ..utils import setup_logging, validate_log_level
 from .config import CommonOptions, process_optional_list_str_option
-from .commands import run_command, package_command, example_command
+from .commands import (
+    run_command,
+    package_command,
+    example_command,
+    profile_startup_command,
+)
 
 app = typer.Typer(
     help="""MCP-CLI: Create, run, and package MCP services from your Python code using a lightweight CLI-based approach.
@@ -32,6 +37,7 @@ if not cli_logger.hasHandlers():
 app.command(name="run")(run_command)
 app.command(name="package")(package_command)
 app.command(name="example")(example_command)
+app.command(name="profile-startup")(profile_startup_command)
 
 
 @app.callback()
@@ -4,30 +4,53 @@ This module provides functionality to discover Python files from a source path a
 functions from those files, preserving file path information for routing purposes.
 """
 
+import hashlib
+import importlib
 import importlib.util
 import inspect  # Moved from bottom to top
+import keyword
 import logging
-import os
 import pathlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .utils.profiling import profile_import
 
 logger = logging.getLogger(__name__)
 
+# Module-level functions with these names are run when the application starts and
+# stops instead of being exposed as tools (see `app_builder.lifecycle`)
+STARTUP_HOOK = "mcp_startup"
+SHUTDOWN_HOOK = "mcp_shutdown"
+LIFECYCLE_HOOKS = (STARTUP_HOOK, SHUTDOWN_HOOK)
+
 
 class ValidFileTypes(Enum):
     PYTHON = ".py"
 
 
-def discover_py_files(source_path_str: str) -> List[pathlib.Path]:
+def discover_py_files(
+    source_path_str: str,
+    max_depth: Optional[int] = None,
+    ignore_file: Optional[pathlib.Path] = None,
+) -> List[pathlib.Path]:
     """
     Discovers Python files from a given file or directory path.
 
     This function scans a file or directory path and identifies all Python files.
     It preserves the full path information which is essential for directory-based routing.
+    Directories are scanned in a single pruned pass: virtualenvs, caches, hidden
+    directories and anything excluded by a `.mcpyignore` file are never descended into.
 
     Args:
         source_path_str: The path to a Python file or a directory.
+        max_depth: Maximum directory depth to scan. None means unlimited.
+        ignore_file: Optional ignore file. Defaults to `<source>/.mcpyignore` if present.
 
     Returns:
         A list of pathlib.Path objects for discovered .py files with full path information.
@@ -67,17 +90,13 @@ def discover_py_files(source_path_str: str) -> List[pathlib.Path]:
             logger.warning(f"Source file is not a Python file, skipping: {source_path}")
     elif source_path.is_dir():
         logger.info(f"Scanning directory for Python files: {source_path}")
-        for root, _, files in os.walk(source_path):
-            root_path = pathlib.Path(root)
-            for file_name in files:  # Renamed 'file' to 'file_name' to avoid conflict
-                if file_name.endswith(ValidFileTypes.PYTHON.value):
-                    file_path = root_path / file_name
-                    py_files.append(file_path)
-                    # Log the relative path for better debugging
-                    rel_path = file_path.relative_to(source_path)
-                    logger.debug(
-                        f"Discovered Python file: {rel_path} (full path: {file_path})"
-                    )
+        from .utils.path_utils import iter_python_files
+
+        for file_path in iter_python_files(source_path, max_depth, ignore_file):
+            py_files.append(file_path)
+            # Log the relative path for better debugging
+            rel_path = file_path.relative_to(source_path)
+            logger.debug(f"Discovered Python file: {rel_path} (full path: {file_path})")
     else:
         raise ValueError(f"Source path is not a file or directory: {source_path}")
 
@@ -92,7 +111,12 @@ def _load_module_from_path(
     file_path: pathlib.Path,
 ) -> Optional[Any]:  # Changed to Any from types.ModuleType for broader compatibility
     """
-    Loads a Python module dynamically from a file path.
+    Loads a Python module dynamically from a file path under an isolated name.
+
+    This is the fallback for files that cannot be imported under their package-aware
+    name. The module name is derived from the full path so files with the same stem
+    never collide, and the module is registered in `sys.modules` while it executes
+    (as the import system does) so dataclasses and pickling work.
 
     Args:
         file_path: The path to the Python file.
@@ -100,14 +124,17 @@ def _load_module_from_path(
     Returns:
         The loaded module object, or None if loading fails.
     """
-    module_name = file_path.stem
+    path_digest = hashlib.sha1(str(file_path).encode()).hexdigest()[:10]
+    module_name = f"_mcpy_tool_{path_digest}_{file_path.stem}"
     spec = importlib.util.spec_from_file_location(module_name, str(file_path))
     if spec and spec.loader:
         module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
         try:
             spec.loader.exec_module(module)
             return module
         except Exception as e:
+            sys.modules.pop(module_name, None)
             logger.error(
                 f"Failed to load module '{module_name}' from '{file_path}': {e}",
                 exc_info=True,
@@ -118,8 +145,306 @@ def _load_module_from_path(
         return None
 
 
+def resolve_module_name(
+    file_path: pathlib.Path, base_dir: Optional[pathlib.Path] = None
+) -> Optional[Tuple[str, pathlib.Path]]:
+    """
+    Derives the dotted module name of a file and the directory it is importable from.
+
+    The name is the file's path relative to `base_dir` (or to its own directory when
+    no base directory is given), e.g. `tools/text/utils.py` -> `text.utils` for the
+    base directory `tools`. If that directory is itself part of a regular package
+    (contains `__init__.py`), the enclosing packages are prepended, so relative
+    imports resolve exactly as they would for a normal import.
+
+    Args:
+        file_path: The path to the Python file.
+        base_dir: The base directory of the discovered source files.
+
+    Returns:
+        A tuple of (dotted module name, import root directory), or None if the path
+        does not map to a valid module name.
+    """
+    root = base_dir if base_dir is not None else file_path.parent
+    try:
+        parts = list(file_path.with_suffix("").relative_to(root).parts)
+    except ValueError:
+        root = file_path.parent
+        parts = [file_path.stem]
+
+    while (root / "__init__.py").is_file() and root.parent != root:
+        parts.insert(0, root.name)
+        root = root.parent
+
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    if not parts or not all(
+        part.isidentifier() and not keyword.iskeyword(part) for part in parts
+    ):
+        return None
+    return ".".join(parts), root
+
+
+# Import roots added to sys.path by this module, with the number of imports using them
+_import_roots: Dict[str, int] = {}
+_import_roots_lock = threading.Lock()
+
+
+@contextmanager
+def _import_root_on_path(root: pathlib.Path) -> Iterator[None]:
+    """
+    Makes an import root importable for the duration of an import. It is appended to
+    `sys.path`, so user modules never shadow the standard library or installed
+    packages, and removed again afterwards, so tool file names cannot shadow later
+    imports of unrelated top-level modules.
+    """
+    root_str = str(root)
+    with _import_roots_lock:
+        if root_str in _import_roots:
+            _import_roots[root_str] += 1
+            added = True
+        elif root_str not in sys.path:
+            sys.path.append(root_str)
+            _import_roots[root_str] = 1
+            added = True
+        else:
+            # Already importable, e.g. the current directory
+            added = False
+    try:
+        yield
+    finally:
+        if added:
+            with _import_roots_lock:
+                _import_roots[root_str] -= 1
+                if not _import_roots[root_str]:
+                    del _import_roots[root_str]
+                    if root_str in sys.path:
+                        sys.path.remove(root_str)
+
+
+def _import_module_from_path(
+    file_path: pathlib.Path, base_dir: Optional[pathlib.Path] = None
+) -> Optional[Any]:
+    """
+    Imports a Python file under its package-aware dotted name.
+
+    The module goes through the regular import system: it is registered in
+    `sys.modules` (so other tool files importing it share one instance), relative
+    imports work and `__pycache__` bytecode is used. If the name is invalid or is
+    already taken by a different module (for example a tool file named like a standard
+    library module), the file is loaded under an isolated name instead.
+
+    Args:
+        file_path: The path to the Python file.
+        base_dir: The base directory of the discovered source files.
+
+    Returns:
+        The loaded module object, or None if loading fails.
+    """
+    resolved = resolve_module_name(file_path, base_dir)
+    if resolved is None:
+        logger.debug(f"'{file_path}' has no valid module name, loading it in isolation")
+        return _load_module_from_path(file_path)
+
+    module_name, import_root = resolved
+    with _import_root_on_path(import_root):
+        try:
+            spec = importlib.util.find_spec(module_name)
+            if spec is None:
+                # The file may have been created after the import system cached its
+                # directory listing (e.g. during hot reload)
+                importlib.invalidate_caches()
+                spec = importlib.util.find_spec(module_name)
+        except ValueError:
+            # Registered in sys.modules without a spec
+            spec = None
+        except Exception as e:
+            logger.error(
+                f"Failed to load module '{module_name}' from '{file_path}': {e}",
+                exc_info=True,
+            )
+            return None
+
+        origin = spec.origin if spec is not None else None
+        if origin is None or pathlib.Path(origin).resolve() != file_path.resolve():
+            logger.warning(
+                f"Module name '{module_name}' of '{file_path}' is already used by "
+                f"{origin or 'another module'}; loading it under an isolated name"
+            )
+            return _load_module_from_path(file_path)
+
+        try:
+            return importlib.import_module(module_name)
+        except Exception as e:
+            sys.modules.pop(module_name, None)
+            logger.error(
+                f"Failed to load module '{module_name}' from '{file_path}': {e}",
+                exc_info=True,
+            )
+            return None
+
+
+class ModuleRegistry:
+    """
+    Process-wide registry of user modules loaded by discovery.
+
+    Every consumer that needs a user module (function discovery, module docstrings,
+    lazy tool loading) goes through this registry, so each file is executed exactly
+    once per process. A file is executed again only if its mtime or size changed
+    since it was loaded, or after it was explicitly discarded.
+
+    Modules are imported under package-aware names (see `resolve_module_name`) and
+    live in `sys.modules`, so a tool module imported by another tool file is shared.
+    """
+
+    def __init__(self):
+        self._modules: Dict[pathlib.Path, Tuple[Tuple[int, int], Any]] = {}
+        self._locks: Dict[pathlib.Path, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    @staticmethod
+    def _fingerprint(file_path: pathlib.Path) -> Tuple[int, int]:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _lock_for(self, file_path: pathlib.Path) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(file_path, threading.Lock())
+
+    def get(self, file_path: pathlib.Path) -> Optional[Any]:
+        """Return the loaded module for a file if it is current, without loading it."""
+        entry = self._modules.get(file_path)
+        if entry is None or entry[0] != self._fingerprint(file_path):
+            return None
+        return entry[1]
+
+    def load(
+        self, file_path: pathlib.Path, base_dir: Optional[pathlib.Path] = None
+    ) -> Optional[Any]:
+        """
+        Return the module for a file, executing it only if it is not loaded yet.
+
+        Args:
+            file_path: The path to the Python file.
+            base_dir: The base directory module names are derived from. Defaults to
+                the file's own directory.
+
+        Returns:
+            The loaded module object, or None if loading fails.
+        """
+        module = self.get(file_path)
+        if module is not None:
+            return module
+
+        with self._lock_for(file_path):
+            # Another thread may have loaded it while we waited for the lock
+            module = self.get(file_path)
+            if module is None:
+                fingerprint = self._fingerprint(file_path)
+                stale = self._modules.pop(file_path, None)
+                if stale is not None:
+                    _forget_module(stale[1])
+                module = _import_module_from_path(file_path, base_dir)
+                if module is not None:
+                    self._modules[file_path] = (fingerprint, module)
+        return module
+
+    def get_docstring(self, file_path: pathlib.Path) -> Optional[str]:
+        """Return the cleaned docstring of a loaded module, or None if not loaded."""
+        module = self.get(file_path)
+        if module is None or not module.__doc__:
+            return None
+        return inspect.cleandoc(module.__doc__)
+
+    def discard(self, file_path: pathlib.Path) -> None:
+        """Forget a loaded module so the next load executes the file again."""
+        with self._lock_for(file_path):
+            entry = self._modules.pop(file_path, None)
+            if entry is not None:
+                _forget_module(entry[1])
+
+
+def _forget_module(module: Any) -> None:
+    """Remove a module from `sys.modules` so the next import executes it again."""
+    module_name = getattr(module, "__name__", None)
+    if module_name and sys.modules.get(module_name) is module:
+        del sys.modules[module_name]
+
+
+module_registry = ModuleRegistry()
+
+
+def _discover_module_functions(
+    file_path: pathlib.Path,
+    function_name_set: Set[str],
+    base_dir: Optional[pathlib.Path] = None,
+) -> Tuple[List[Tuple[Callable[..., Any], str]], float]:
+    """
+    Loads a single Python file and collects the functions it defines.
+
+    Args:
+        file_path: The path to the Python file.
+        function_name_set: Names to restrict discovery to. Empty means all functions.
+        base_dir: The base directory module names are derived from.
+
+    Returns:
+        A tuple of ([(function_object, function_name), ...], import_seconds).
+    """
+    logger.info(f"Discovering functions in: {file_path}")
+    start = time.perf_counter()
+    with profile_import(file_path):
+        module = module_registry.load(file_path, base_dir)
+    elapsed = time.perf_counter() - start
+    logger.info(f"Imported {file_path} in {elapsed * 1000:.1f} ms")
+
+    module_functions: List[Tuple[Callable[..., Any], str]] = []
+    if not module:
+        logger.warning(f"Failed to load module from {file_path}")
+        return module_functions, elapsed
+
+    logger.debug(f"Module loaded successfully: {module.__name__}")
+    for name, member in inspect.getmembers(module):
+        logger.debug(f"Found member: {name}, type: {type(member).__name__}")
+        # Only include functions defined in this module (not imported)
+        if inspect.isfunction(member):
+            logger.debug(
+                f"Member {name} is a function. Module: {member.__module__}, Expected: {module.__name__}"
+            )
+            if member.__module__ == module.__name__:
+                # Skip private functions (starting with underscore)
+                if name.startswith("_") and not (
+                    name.startswith("__") and name.endswith("__")
+                ):
+                    logger.debug(f"Skipping private function: {name} in {file_path}")
+                    continue
+                if name in LIFECYCLE_HOOKS:
+                    logger.debug(f"Skipping lifecycle hook: {name} in {file_path}")
+                    continue
+
+                if not function_name_set or name in function_name_set:
+                    logger.debug(f"Adding function {name} to discovered functions")
+                    module_functions.append((member, name))
+            else:
+                logger.debug(
+                    f"Skipping function {name} because it's not defined in this module"
+                )
+
+    if module_functions:
+        logger.info(f"Found {len(module_functions)} function(s) in {file_path}")
+    else:
+        logger.warning(f"No suitable functions found in {file_path}")
+    return module_functions, elapsed
+
+
 def discover_functions(
-    file_paths: List[pathlib.Path], target_function_names: Optional[List[str]] = None
+    file_paths: List[pathlib.Path],
+    target_function_names: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    file_timings: Optional[Dict[pathlib.Path, float]] = None,
+    base_dir: Optional[pathlib.Path] = None,
 ) -> List[Tuple[Callable[..., Any], str, pathlib.Path]]:  # Made Callable more specific
     """
     Discovers functions from a list of Python files.
@@ -131,6 +456,13 @@ def discover_functions(
         file_paths: A list of paths to Python files.
         target_function_names: An optional list of specific function names to discover.
                                If None, all functions are discovered.
+        max_workers: Number of threads used to import files concurrently. None or 1
+                     imports sequentially. Results keep the order of file_paths either way.
+        file_timings: Optional dictionary populated with the import time in seconds
+                      of each file.
+        base_dir: The base directory dotted module names are derived from, so that
+                  files with the same name in different directories do not collide.
+                  Defaults to each file's own directory.
 
     Returns:
         A list of tuples, each containing (function_object, function_name, file_path).
@@ -139,53 +471,53 @@ def discover_functions(
     discovered_functions: List[Tuple[Callable[..., Any], str, pathlib.Path]] = []
     function_name_set = set(target_function_names) if target_function_names else set()
 
-    for file_path in file_paths:
-        logger.info(f"Discovering functions in: {file_path}")
-        module = _load_module_from_path(file_path)
-        if module:
-            logger.debug(f"Module loaded successfully: {module.__name__}")
-            module_functions = []
-            for name, member in inspect.getmembers(module):
-                logger.debug(f"Found member: {name}, type: {type(member).__name__}")
-                # Only include functions defined in this module (not imported)
-                if inspect.isfunction(member):
-                    logger.debug(
-                        f"Member {name} is a function. Module: {member.__module__}, Expected: {module.__name__}"
-                    )
-                    if member.__module__ == module.__name__:
-                        # Skip private functions (starting with underscore)
-                        if name.startswith("_") and not (
-                            name.startswith("__") and name.endswith("__")
-                        ):
-                            logger.debug(
-                                f"Skipping private function: {name} in {file_path}"
-                            )
-                            continue
-
-                        if not function_name_set or name in function_name_set:
-                            logger.debug(
-                                f"Adding function {name} to discovered functions"
-                            )
-                            module_functions.append((member, name))
-                            if function_name_set and name in function_name_set:
-                                function_name_set.remove(name)
-                    else:
-                        logger.debug(
-                            f"Skipping function {name} because it's not defined in this module"
-                        )
-
-            if module_functions:
-                logger.info(f"Found {len(module_functions)} function(s) in {file_path}")
-                for func, name in module_functions:
-                    discovered_functions.append((func, name, file_path))
-            else:
-                logger.warning(f"No suitable functions found in {file_path}")
-        else:
-            logger.warning(f"Failed to load module from {file_path}")
+    if max_workers and max_workers > 1 and len(file_paths) > 1:
+        logger.info(
+            f"Importing {len(file_paths)} file(s) with {max_workers} discovery workers"
+        )
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mcpy-discovery"
+        ) as executor:
+            # map() yields results in submission order, keeping output deterministic
+            results = list(
+                executor.map(
+                    lambda path: _discover_module_functions(
+                        path, function_name_set, base_dir
+                    ),
+                    file_paths,
+                )
+            )
+    else:
+        results = [
+            _discover_module_functions(file_path, function_name_set, base_dir)
+            for file_path in file_paths
+        ]
+
+    found_names: Set[str] = set()
+    for file_path, (module_functions, elapsed) in zip(file_paths, results):
+        if file_timings is not None:
+            file_timings[file_path] = elapsed
+        for func, name in module_functions:
+            discovered_functions.append((func, name, file_path))
+            found_names.add(name)
+
+    if results:
+        slowest = sorted(
+            zip(file_paths, (elapsed for _, elapsed in results)),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        total = sum(elapsed for _, elapsed in slowest)
+        logger.info(
+            f"Imported {len(file_paths)} file(s) in {total * 1000:.1f} ms of import time"
+        )
+        for file_path, elapsed in slowest[:5]:
+            logger.debug(f"Slowest import: {file_path} ({elapsed * 1000:.1f} ms)")
 
-    if function_name_set and len(function_name_set) > 0:
+    missing_names = function_name_set - found_names
+    if missing_names:
         logger.warning(
-            f"Could not find the following specified functions: {list(function_name_set)}"
+            f"Could not find the following specified functions: {list(missing_names)}"
         )
 
     return discovered_functions
@@ -3,7 +3,6 @@ SQLite implementation of the official MCP EventStore interface.
 This provides resumability support for FastMCP HTTP transport using SQLite persistence.
 """
 
-import json
 import logging
 import sqlite3
 import uuid
@@ -11,6 +10,8 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Union
 from abc import ABC, abstractmethod
 
+from .utils import serialization
+
 # Type aliases matching the official MCP interface
 StreamId = str
 EventId = str
@@ -186,24 +187,24 @@ class SQLiteEventStore(EventStore):
             try:
                 if hasattr(message, "model_dump"):
                     # Pydantic model (JSONRPCMessage) - use model_dump()
-                    message_data = json.dumps(message.model_dump())
+                    message_data = serialization.dumps(message.model_dump())
                 elif hasattr(message, "dict"):
                     # Pydantic model (older version) - use dict()
-                    message_data = json.dumps(message.dict())
+                    message_data = serialization.dumps(message.dict())
                 elif isinstance(message, dict):
                     # Already a dictionary
-                    message_data = json.dumps(message)
+                    message_data = serialization.dumps(message)
                 else:
                     # Try to convert to dict if it has __dict__
                     if hasattr(message, "__dict__"):
-                        message_data = json.dumps(message.__dict__)
+                        message_data = serialization.dumps(message.__dict__)
                     else:
                         # Last resort - convert to string representation
-                        message_data = json.dumps(str(message))
+                        message_data = serialization.dumps(str(message))
             except Exception as serialize_error:
                 logger.error(f"Failed to serialize message: {serialize_error}")
                 # Fallback to string representation
-                message_data = json.dumps(
+                message_data = serialization.dumps(
                     {"error": "serialization_failed", "message": str(message)}
                 )
 
@@ -293,7 +294,7 @@ class SQLiteEventStore(EventStore):
             replayed_count = 0
             for event_id, message_data in events_to_replay:
                 try:
-                    message = json.loads(message_data)
+                    message = serialization.loads(message_data)
                     event_message = EventMessage(message=message, event_id=event_id)
 
                     # Call the callback - handle both sync and async callbacks
@@ -2,13 +2,13 @@
 Utility functions for packaging MCP model services.
 """
 
-import inspect
 import logging
 import pathlib
 import shutil
 from typing import Dict, List, Optional
 
-from .discovery import discover_py_files, discover_functions
+from .discovery import discover_py_files
+from .static_discovery import discover_functions_static
 from .utils import TransformationError  # For _copy_source_code
 
 logger = logging.getLogger(__name__)
@@ -47,59 +47,29 @@ def _get_tool_documentation_details(
             )
             return []
 
-        functions_to_document = discover_functions(py_files, target_function_names)
+        # Static discovery reads metadata from the AST, so packaging never
+        # executes user modules or their heavy module-level imports.
+        functions_to_document = discover_functions_static(
+            py_files, target_function_names
+        )
         if not functions_to_document:
             logger_to_use.warning(
                 f"No functions found in {source_path_str} for documentation generation."
             )
             return []
 
-        for func, func_name, file_path in functions_to_document:
-            try:
-                sig = inspect.signature(func)
-                docstring = inspect.getdoc(func) or "No docstring provided."
-                if inspect.getcomments(func):
-                    docstring += f"""\n\nAdditional comments:\n{inspect.getcomments(func)}"""
-                params = []
-                for p_name, p in sig.parameters.items():
-                    param_str = p_name
-                    if p.annotation is not inspect.Parameter.empty:
-                        ann_str = (
-                            getattr(p.annotation, "__name__", None)
-                            or getattr(p.annotation, "_name", None)
-                            or str(p.annotation)
-                        )
-                        param_str += f": {ann_str}"
-                    if p.default is not inspect.Parameter.empty:
-                        param_str += f" = {p.default!r}"
-                    params.append(param_str)
-
-                return_annotation_str = ""
-                if sig.return_annotation is not inspect.Signature.empty:
-                    ret_ann_str = (
-                        getattr(sig.return_annotation, "__name__", None)
-                        or getattr(sig.return_annotation, "_name", None)
-                        or str(sig.return_annotation)
-                    )
-                    if ret_ann_str != "<class 'inspect._empty'>":
-                        return_annotation_str = f" -> {ret_ann_str}"
-
-                full_signature = (
-                    f"{func_name}({', '.join(params)}){return_annotation_str}"
-                )
-
-                tool_details.append(
-                    {
-                        "name": func_name,
-                        "signature": full_signature,
-                        "docstring": docstring,
-                        "file_path": str(file_path.name),
-                    }
-                )
-            except Exception as e:
-                logger_to_use.error(
-                    f"Error processing function {func_name} from {file_path} for documentation: {e}"
-                )
+        for function_info in functions_to_document:
+            docstring = function_info.docstring or "No docstring provided."
+            if function_info.comments:
+                docstring += f"\n\nAdditional comments:\n{function_info.comments}"
+            tool_details.append(
+                {
+                    "name": function_info.name,
+                    "signature": function_info.signature,
+                    "docstring": docstring,
+                    "file_path": str(function_info.file_path.name),
+                }
+            )
 
     except Exception as e:
         logger_to_use.error(
@@ -0,0 +1,600 @@
+"""
+Static, AST-based function discovery.
+
+This module extracts the same function metadata as `discovery.discover_functions`
+(name, signature, docstring, comments and file path) without importing or executing
+user modules. It is intended for code paths that only need metadata, such as
+packaging and documentation generation, where importing heavy dependencies
+(torch, pandas, ...) at module level would dominate the run time.
+"""
+
+import ast
+import inspect
+import json
+import logging
+import pathlib
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .discovery import LIFECYCLE_HOOKS
+from .tool_options import validate_tool_options
+
+logger = logging.getLogger(__name__)
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+class StaticFunctionInfo(NamedTuple):
+    """Metadata of a function discovered without executing its module."""
+
+    name: str
+    signature: str
+    docstring: str
+    comments: Optional[str]
+    file_path: pathlib.Path
+    # JSON schema of the parameters derived from annotations, or None when the
+    # signature cannot be exposed as a tool (*args/**kwargs)
+    parameters: Optional[Dict[str, Any]] = None
+    # Options declared with a `tool_options` decorator whose arguments are literals
+    options: Optional[Dict[str, Any]] = None
+    # Whether the function is a generator or async generator function
+    streaming: bool = False
+
+
+def _parse_module(
+    file_path: pathlib.Path,
+) -> Optional[Tuple[ast.Module, List[str]]]:
+    """
+    Parses a Python file into an AST without executing it.
+
+    Args:
+        file_path: The path to the Python file.
+
+    Returns:
+        A tuple of (module AST, source lines with line endings), or None if the file
+        cannot be read or parsed.
+    """
+    try:
+        source = file_path.read_text(encoding="utf-8")
+        tree = ast.parse(source, filename=str(file_path))
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError) as e:
+        logger.error(f"Failed to parse '{file_path}': {e}")
+        return None
+    return tree, source.splitlines(keepends=True)
+
+
+def _format_arguments(args: ast.arguments) -> List[str]:
+    """Renders an AST argument list the way `inspect.Signature` would."""
+
+    def render(arg: ast.arg, default: Optional[ast.expr] = None) -> str:
+        param_str = arg.arg
+        if arg.annotation is not None:
+            param_str += f": {ast.unparse(arg.annotation)}"
+        if default is not None:
+            # inspect puts spaces around "=" only after an annotation
+            separator = " = " if arg.annotation is not None else "="
+            param_str += f"{separator}{ast.unparse(default)}"
+        return param_str
+
+    params: List[str] = []
+    positional = args.posonlyargs + args.args
+    # Defaults align with the tail of the positional parameters
+    defaults: List[Optional[ast.expr]] = [None] * (
+        len(positional) - len(args.defaults)
+    ) + list(args.defaults)
+
+    for index, (arg, default) in enumerate(zip(positional, defaults)):
+        params.append(render(arg, default))
+        if args.posonlyargs and index == len(args.posonlyargs) - 1:
+            params.append("/")
+
+    if args.vararg is not None:
+        params.append("*" + render(args.vararg))
+    elif args.kwonlyargs:
+        params.append("*")
+
+    for arg, kw_default in zip(args.kwonlyargs, args.kw_defaults):
+        params.append(render(arg, kw_default))
+
+    if args.kwarg is not None:
+        params.append("**" + render(args.kwarg))
+
+    return params
+
+
+def format_signature(node: FunctionNode) -> str:
+    """
+    Builds a display signature such as `add(a: int, b: int = 1) -> int` from a
+    function definition node.
+
+    Args:
+        node: The function definition node.
+
+    Returns:
+        The rendered signature string.
+    """
+    params = _format_arguments(node.args)
+    return_annotation_str = ""
+    if node.returns is not None:
+        return_annotation_str = f" -> {ast.unparse(node.returns)}"
+    return f"{node.name}({', '.join(params)}){return_annotation_str}"
+
+
+_SIMPLE_TYPE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "int": {"type": "integer"},
+    "float": {"type": "number"},
+    "str": {"type": "string"},
+    "bool": {"type": "boolean"},
+    "bytes": {"type": "string"},
+    "None": {"type": "null"},
+    "NoneType": {"type": "null"},
+    "list": {"type": "array"},
+    "List": {"type": "array"},
+    "Sequence": {"type": "array"},
+    "Iterable": {"type": "array"},
+    "tuple": {"type": "array"},
+    "Tuple": {"type": "array"},
+    "set": {"type": "array", "uniqueItems": True},
+    "Set": {"type": "array", "uniqueItems": True},
+    "frozenset": {"type": "array", "uniqueItems": True},
+    "dict": {"type": "object"},
+    "Dict": {"type": "object"},
+    "Mapping": {"type": "object"},
+}
+
+_ARRAY_TYPES = {"list", "List", "Sequence", "Iterable", "set", "Set", "frozenset"}
+_TUPLE_TYPES = {"tuple", "Tuple"}
+_MAPPING_TYPES = {"dict", "Dict", "Mapping"}
+
+
+def _annotation_name(node: ast.expr) -> Optional[str]:
+    """Returns the bare name of `int`, `typing.List`, ... annotations."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Constant) and node.value is None:
+        return "None"
+    return None
+
+
+def _any_of(schemas: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combines alternatives, widening to `{}` if any alternative is unconstrained."""
+    if any(not schema for schema in schemas):
+        return {}
+    return {"anyOf": schemas}
+
+
+def annotation_to_schema(node: Optional[ast.expr]) -> Dict[str, Any]:
+    """
+    Derives a JSON schema from an annotation expression without evaluating it.
+
+    Builtin scalars, containers, Optional/Union and Literal are translated, also when
+    written as strings (`x: "int"`). Anything else (user classes, pydantic models)
+    maps to the unconstrained schema `{}`; the real function still validates its
+    arguments when it is called.
+
+    Args:
+        node: The annotation expression, or None for unannotated parameters.
+
+    Returns:
+        A JSON schema dictionary.
+    """
+    if node is None:
+        return {}
+
+    # String annotations: "int", List["Item"]
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        try:
+            parsed = ast.parse(node.value.strip(), mode="eval")
+        except SyntaxError:
+            return {}
+        return annotation_to_schema(parsed.body)
+
+    # PEP 604 unions: int | None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _any_of(
+            [annotation_to_schema(node.left), annotation_to_schema(node.right)]
+        )
+
+    name = _annotation_name(node)
+    if name is not None:
+        return dict(_SIMPLE_TYPE_SCHEMAS.get(name, {}))
+
+    if not isinstance(node, ast.Subscript):
+        return {}
+
+    outer = _annotation_name(node.value)
+    schema: Dict[str, Any]
+    args = list(node.slice.elts) if isinstance(node.slice, ast.Tuple) else [node.slice]
+
+    if outer == "Optional":
+        return _any_of([annotation_to_schema(args[0]), {"type": "null"}])
+    if outer == "Union":
+        return _any_of([annotation_to_schema(arg) for arg in args])
+    if outer == "Annotated":
+        return annotation_to_schema(args[0])
+    if outer == "Literal":
+        try:
+            return {"enum": [ast.literal_eval(arg) for arg in args]}
+        except ValueError:
+            return {}
+    if outer in _ARRAY_TYPES:
+        schema = dict(_SIMPLE_TYPE_SCHEMAS[outer])
+        items = annotation_to_schema(args[0])
+        if items:
+            schema["items"] = items
+        return schema
+    if outer in _TUPLE_TYPES:
+        schema = {"type": "array"}
+        if (
+            len(args) == 2
+            and isinstance(args[1], ast.Constant)
+            and args[1].value is Ellipsis
+        ):
+            items = annotation_to_schema(args[0])
+            if items:
+                schema["items"] = items
+        else:
+            schema["prefixItems"] = [annotation_to_schema(arg) for arg in args]
+            schema["minItems"] = schema["maxItems"] = len(args)
+        return schema
+    if outer in _MAPPING_TYPES:
+        schema = {"type": "object"}
+        if len(args) == 2:
+            values = annotation_to_schema(args[1])
+            if values:
+                schema["additionalProperties"] = values
+        return schema
+    return {}
+
+
+def build_parameters_schema(node: FunctionNode) -> Optional[Dict[str, Any]]:
+    """
+    Builds the tool input schema of a function definition from its annotations.
+
+    Args:
+        node: The function definition node.
+
+    Returns:
+        An object schema with properties and required names, or None if the function
+        takes *args or **kwargs and therefore cannot be exposed as a tool.
+    """
+    args = node.args
+    if args.vararg is not None or args.kwarg is not None:
+        return None
+
+    positional = args.posonlyargs + args.args
+    defaults: List[Optional[ast.expr]] = [None] * (
+        len(positional) - len(args.defaults)
+    ) + list(args.defaults)
+    params = list(zip(positional, defaults)) + list(
+        zip(args.kwonlyargs, args.kw_defaults)
+    )
+
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    for arg, default in params:
+        schema = annotation_to_schema(arg.annotation)
+        schema["title"] = arg.arg.replace("_", " ").title().replace(" ", "")
+        if default is None:
+            required.append(arg.arg)
+        else:
+            try:
+                default_value = ast.literal_eval(default)
+                json.dumps(default_value)
+                schema["default"] = default_value
+            except (ValueError, TypeError):
+                # Non-literal defaults are left for the real function to apply
+                pass
+        properties[arg.arg] = schema
+
+    parameters: Dict[str, Any] = {"properties": properties, "type": "object"}
+    if required:
+        parameters["required"] = required
+    return parameters
+
+
+def _get_comments(node: FunctionNode, lines: List[str]) -> Optional[str]:
+    """
+    Returns the block of comments immediately preceding a function definition,
+    mirroring `inspect.getcomments` for function objects.
+    """
+    # co_firstlineno points at the first decorator for decorated functions
+    first_line = min([node.lineno] + [d.lineno for d in node.decorator_list])
+    lnum = first_line - 1
+    if lnum <= 0 or lnum >= len(lines):
+        return None
+
+    indent = inspect.indentsize(lines[lnum])
+    end = lnum - 1
+    comments: List[str] = []
+    while (
+        end >= 0
+        and lines[end].lstrip()[:1] == "#"
+        and inspect.indentsize(lines[end]) == indent
+    ):
+        comments.insert(0, lines[end].expandtabs().lstrip())
+        end -= 1
+
+    if not comments:
+        return None
+    while comments and comments[0].strip() == "#":
+        comments.pop(0)
+    while comments and comments[-1].strip() == "#":
+        comments.pop()
+    return "".join(comments)
+
+
+def extract_tool_options(node: FunctionNode) -> Dict[str, Any]:
+    """
+    Reads the options of a `@tool_options(...)` decorator without executing it.
+
+    Only arguments written as literals are understood; others are skipped with a
+    warning, as are invalid option values.
+    """
+    options: Dict[str, Any] = {}
+    for decorator in node.decorator_list:
+        if not isinstance(decorator, ast.Call):
+            continue
+        target = decorator.func
+        name = target.attr if isinstance(target, ast.Attribute) else None
+        if isinstance(target, ast.Name):
+            name = target.id
+        if name != "tool_options":
+            continue
+        for keyword in decorator.keywords:
+            if keyword.arg is None:
+                continue
+            try:
+                options[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                logger.warning(
+                    f"Option '{keyword.arg}' of '{node.name}' is not a literal and "
+                    f"is ignored until the module is imported"
+                )
+    try:
+        return validate_tool_options(options)
+    except ValueError as e:
+        logger.warning(f"Ignoring the tool options of '{node.name}': {e}")
+        return {}
+
+
+def is_generator_node(node: FunctionNode) -> bool:
+    """
+    Whether a function definition is a generator or async generator function.
+
+    That is the case when `yield` appears in its body outside of nested functions,
+    lambdas and classes, which have their own scope.
+    """
+    pending: List[ast.AST] = list(node.body)
+    while pending:
+        child = pending.pop()
+        if isinstance(child, (ast.Yield, ast.YieldFrom)):
+            return True
+        if isinstance(
+            child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+        ):
+            continue
+        pending.extend(ast.iter_child_nodes(child))
+    return False
+
+
+# try/except and, from Python 3.11, try/except*
+_TRY_TYPES: Tuple[Any, ...] = (ast.Try, getattr(ast, "TryStar", ast.Try))
+
+
+def _is_main_guard(test: ast.expr) -> bool:
+    """Whether an `if` test is `__name__ == "__main__"`, false when imported."""
+    if not (
+        isinstance(test, ast.Compare)
+        and len(test.ops) == 1
+        and isinstance(test.ops[0], ast.Eq)
+    ):
+        return False
+    operands = {ast.unparse(test.left), ast.unparse(test.comparators[0])}
+    return operands == {"__name__", "'__main__'"}
+
+
+def _is_type_checking_guard(test: ast.expr) -> bool:
+    """Whether an `if` test is `TYPE_CHECKING`, false at run time."""
+    return _annotation_name(test) == "TYPE_CHECKING"
+
+
+def _lambda_function(
+    name: str, statement: ast.stmt, node: ast.Lambda
+) -> ast.FunctionDef:
+    """
+    Represents a lambda assigned to a module-level name as the equivalent function
+    definition, so it is described like a `def` (without a docstring).
+    """
+    function = ast.FunctionDef(
+        name=name,
+        args=node.args,
+        body=[ast.Return(value=node.body)],
+        decorator_list=[],
+        returns=None,
+        type_comment=None,
+    )
+    return ast.copy_location(function, statement)
+
+
+def _defined_functions(statements: List[ast.stmt]) -> Dict[str, FunctionNode]:
+    """
+    Collects the functions a block of statements binds to names when it runs.
+
+    Functions are `def`/`async def` statements and lambdas assigned to names. Blocks
+    of `if` and `try` statements are searched as well: the branches of an `if` and
+    the handlers of a `try` are alternatives, of which the first one that defines a
+    name is kept, so `try: def f()... except ImportError: def f()...` is described by
+    the first definition. The bodies of `if __name__ == "__main__":` and
+    `if TYPE_CHECKING:` do not run when the module is imported and are skipped. Later
+    definitions replace earlier ones with the same name, matching the module
+    namespace after execution.
+    """
+    functions: Dict[str, FunctionNode] = {}
+    for statement in statements:
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions[statement.name] = statement
+        elif isinstance(statement, (ast.Assign, ast.AnnAssign)):
+            targets = (
+                statement.targets
+                if isinstance(statement, ast.Assign)
+                else [statement.target]
+            )
+            if statement.value is None:
+                # A bare annotation binds nothing
+                continue
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    if isinstance(statement.value, ast.Lambda):
+                        functions[target.id] = _lambda_function(
+                            target.id, statement, statement.value
+                        )
+                    else:
+                        # Rebinding a name to something else hides the function
+                        functions.pop(target.id, None)
+        elif isinstance(statement, ast.If):
+            if _is_main_guard(statement.test) or _is_type_checking_guard(
+                statement.test
+            ):
+                functions.update(_defined_functions(statement.orelse))
+                continue
+            functions.update(
+                {
+                    **_defined_functions(statement.orelse),
+                    **_defined_functions(statement.body),
+                }
+            )
+        elif isinstance(statement, _TRY_TYPES):
+            handled: Dict[str, FunctionNode] = {}
+            for handler in reversed(statement.handlers):
+                handled.update(_defined_functions(handler.body))
+            functions.update(
+                {
+                    **handled,
+                    **_defined_functions(statement.body + statement.orelse),
+                    **_defined_functions(statement.finalbody),
+                }
+            )
+    return functions
+
+
+def _collect_module_functions(tree: ast.Module) -> Dict[str, FunctionNode]:
+    """
+    Collects the public module-level functions of a module (see
+    `_defined_functions`).
+
+    Names are returned sorted, matching the ordering of `inspect.getmembers` used by
+    the dynamic discovery.
+    """
+    functions: Dict[str, FunctionNode] = {}
+    for name, node in _defined_functions(tree.body).items():
+        # Skip private functions (starting with underscore), same as discover_functions
+        if name.startswith("_") and not (name.startswith("__") and name.endswith("__")):
+            continue
+        if name in LIFECYCLE_HOOKS:
+            continue
+        functions[name] = node
+    return dict(sorted(functions.items()))
+
+
+def discover_functions_static(
+    file_paths: List[pathlib.Path], target_function_names: Optional[List[str]] = None
+) -> List[StaticFunctionInfo]:
+    """
+    Discovers functions from a list of Python files without executing them.
+
+    Functions defined with `def`/`async def` at module level, also inside `if` and
+    `try` blocks, and lambdas assigned to module-level names are reported. Imported
+    names are never defined in the file and are therefore excluded, which matches the
+    filtering of `discovery.discover_functions`. Functions created by calling other
+    code (e.g. `f = functools.partial(...)` or `f = decorate(g)`) are not reported.
+
+    Args:
+        file_paths: A list of paths to Python files.
+        target_function_names: An optional list of specific function names to discover.
+                               If None, all functions are discovered.
+
+    Returns:
+        A list of StaticFunctionInfo records, in file order and name order within a file.
+    """
+    discovered: List[StaticFunctionInfo] = []
+    function_name_set = set(target_function_names) if target_function_names else set()
+    found_names = set()
+
+    for file_path in file_paths:
+        parsed = _parse_module(file_path)
+        if parsed is None:
+            logger.warning(f"Failed to parse module from {file_path}")
+            continue
+        tree, lines = parsed
+
+        module_functions = 0
+        for name, node in _collect_module_functions(tree).items():
+            if function_name_set and name not in function_name_set:
+                continue
+            discovered.append(
+                StaticFunctionInfo(
+                    name=name,
+                    signature=format_signature(node),
+                    docstring=ast.get_docstring(node) or "",
+                    comments=_get_comments(node, lines),
+                    file_path=file_path,
+                    parameters=build_parameters_schema(node),
+                    options=extract_tool_options(node),
+                    streaming=is_generator_node(node),
+                )
+            )
+            found_names.add(name)
+            module_functions += 1
+
+        if module_functions:
+            logger.debug(
+                f"Statically found {module_functions} function(s) in {file_path}"
+            )
+        else:
+            logger.debug(f"No suitable functions found in {file_path}")
+
+    missing_names = function_name_set - found_names
+    if missing_names:
+        logger.warning(
+            f"Could not find the following specified functions: {list(missing_names)}"
+        )
+
+    return discovered
+
+
+def find_lifecycle_hooks_static(file_path: pathlib.Path) -> List[str]:
+    """
+    Lists the lifecycle hooks (`mcp_startup`, `mcp_shutdown`) a Python file defines,
+    without executing it.
+
+    Args:
+        file_path: Path to the Python file
+
+    Returns:
+        The names of the hooks defined at module level, in LIFECYCLE_HOOKS order
+    """
+    parsed = _parse_module(file_path)
+    if parsed is None:
+        return []
+    tree, _ = parsed
+    defined = _defined_functions(tree.body)
+    return [name for name in LIFECYCLE_HOOKS if name in defined]
+
+
+def get_module_docstring_static(file_path: pathlib.Path) -> Optional[str]:
+    """
+    Extracts the module docstring of a Python file without executing it.
+
+    Args:
+        file_path: Path to the Python file
+
+    Returns:
+        The cleaned module docstring if found, None otherwise
+    """
+    parsed = _parse_module(file_path)
+    if parsed is None:
+        return None
+    tree, _ = parsed
+    return ast.get_docstring(tree) or None
@@ -0,0 +1,263 @@
+"""
+Per-tool execution options.
+
+Tool files can annotate individual functions with `tool_options` to override the
+application-wide settings for that tool, for example:
+
+    from mcpy_cli.tool_options import tool_options
+
+    @tool_options(executor="process", max_concurrency=2, timeout=60)
+    def simulate(steps: int) -> float:
+        ...
+
+The decorator only attaches metadata and returns the function itself, so the
+function is discovered, documented and called exactly as before. This module has no
+dependencies so that tool files can import it cheaply.
+
+Options can also be set without touching the code, in a JSON file passed with
+`--tool-config`:
+
+    {
+        "defaults": {"max_wait": 10, "timeout": 120},
+        "tools": {
+            "simulate": {"max_concurrency": 4},
+            "lookup_rates": {"coalesce": "global", "warmup": {"currency": "EUR"}},
+            "geocode": {"pure": true, "cache_ttl": 3600},
+            "reports/export.py:render": {"max_concurrency": 1, "max_queue": 5}
+        }
+    }
+
+Tools are matched by function name, or by "<path relative to the source>:<name>" to
+single out one of several functions with the same name. Options are merged in this
+order, later sources winning: file defaults, decorator, file entry by name, file
+entry by path and name.
+"""
+
+import json
+import pathlib
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TOOL_OPTIONS_ATTR = "__mcpy_tool_options__"
+
+EXECUTOR_INLINE = "inline"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTOR_CHOICES = (EXECUTOR_INLINE, EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+COALESCE_SESSION = "session"
+COALESCE_GLOBAL = "global"
+COALESCE_CHOICES = (COALESCE_SESSION, COALESCE_GLOBAL)
+
+# Queue bounds used when a tool sets max_concurrency without them
+DEFAULT_MAX_QUEUE = 100
+DEFAULT_MAX_WAIT = 30.0
+# Wait used when a tool sets batch_size without batch_wait
+DEFAULT_BATCH_WAIT = 0.01
+
+
+def validate_tool_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check tool option names and values.
+
+    Args:
+        options: Option names and values. None values are dropped.
+
+    Returns:
+        The options without None values.
+
+    Raises:
+        ValueError: If an option is unknown or has an invalid value.
+    """
+    validated = {key: value for key, value in options.items() if value is not None}
+    for key, value in validated.items():
+        if key == "executor":
+            if value not in EXECUTOR_CHOICES:
+                raise ValueError(
+                    f"Invalid executor '{value}', expected one of {', '.join(EXECUTOR_CHOICES)}"
+                )
+        elif key == "coalesce":
+            if value not in COALESCE_CHOICES:
+                raise ValueError(
+                    f"Invalid coalesce scope '{value}', expected one of {', '.join(COALESCE_CHOICES)}"
+                )
+        elif key in ("max_concurrency", "max_queue", "batch_size"):
+            minimum = 0 if key == "max_queue" else 1
+            if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+                raise ValueError(
+                    f"{key} must be an integer >= {minimum}, got {value!r}"
+                )
+        elif key in ("max_wait", "timeout", "batch_wait", "cache_ttl"):
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or value <= 0
+            ):
+                raise ValueError(f"{key} must be a positive number, got {value!r}")
+        elif key == "pure":
+            if not isinstance(value, bool):
+                raise ValueError(f"pure must be true or false, got {value!r}")
+        elif key == "warmup":
+            samples = value if isinstance(value, list) else [value]
+            if not samples or not all(isinstance(sample, dict) for sample in samples):
+                raise ValueError(
+                    f"warmup must be an arguments object or a list of them, got {value!r}"
+                )
+        else:
+            raise ValueError(f"Unknown tool option '{key}'")
+    return validated
+
+
+def tool_options(
+    *,
+    executor: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    max_queue: Optional[int] = None,
+    max_wait: Optional[float] = None,
+    timeout: Optional[float] = None,
+    coalesce: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    batch_wait: Optional[float] = None,
+    warmup: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    pure: Optional[bool] = None,
+    cache_ttl: Optional[float] = None,
+) -> Callable[[F], F]:
+    """
+    Declare execution options for a tool function.
+
+    Args:
+        executor: Where the tool runs: "inline" on the event loop, "thread" in the
+            tool thread pool or "process" in the tool process pool. None keeps the
+            application default (`--executor`).
+        max_concurrency: Maximum number of calls of this tool running at once per
+            server process. Further calls wait in a FIFO queue.
+        max_queue: Maximum number of waiting calls. Calls beyond it are rejected with
+            a "server busy" error. Defaults to DEFAULT_MAX_QUEUE.
+        max_wait: Maximum seconds a call waits in the queue before it is rejected
+            with a "server busy" error. Defaults to DEFAULT_MAX_WAIT.
+        timeout: Maximum seconds a call may run before it is cancelled and reported
+            to the client as a timeout error. None keeps the application default
+            (`--tool-timeout`).
+        coalesce: Let identical concurrent calls share one execution: "session"
+            merges calls within a session, "global" merges calls across sessions.
+            Only for tools whose result depends on nothing but their arguments.
+        batch_size: Mark the function as batchable: it takes a list per parameter
+            and returns a list with one result per input. Clients call it with single
+            items, which are buffered and passed to the function in batches of up to
+            this many items (see `mcpy_cli.app_builder.micro_batching`).
+        batch_wait: Maximum seconds an item waits for its batch to fill. Defaults to
+            DEFAULT_BATCH_WAIT.
+        warmup: Sample arguments, or a list of them, the tool is called with when the
+            application starts, so the first real call does not pay for cold caches
+            (see `mcpy_cli.app_builder.lifecycle`).
+        pure: Declare that the tool's result depends on nothing but its arguments.
+            Results of pure tools are cached and shared across sessions, in every
+            transport mode (see `mcpy_cli.app_builder.result_cache`).
+        cache_ttl: Seconds the cached results of a pure tool stay valid. None keeps
+            the application default (`--pure-cache-ttl`).
+
+    Returns:
+        A decorator that records the options on the function and returns it unchanged.
+
+    Raises:
+        ValueError: If an option value is invalid.
+    """
+    options = validate_tool_options(
+        {
+            "executor": executor,
+            "max_concurrency": max_concurrency,
+            "max_queue": max_queue,
+            "max_wait": max_wait,
+            "timeout": timeout,
+            "coalesce": coalesce,
+            "batch_size": batch_size,
+            "batch_wait": batch_wait,
+            "warmup": warmup,
+            "pure": pure,
+            "cache_ttl": cache_ttl,
+        }
+    )
+
+    def decorator(func: F) -> F:
+        merged = dict(get_tool_options(func))
+        merged.update(options)
+        setattr(func, TOOL_OPTIONS_ATTR, merged)
+        return func
+
+    return decorator
+
+
+def get_tool_options(func: Optional[Callable[..., Any]]) -> Dict[str, Any]:
+    """Return the options declared for a tool function with `tool_options`."""
+    if func is None:
+        return {}
+    return getattr(func, TOOL_OPTIONS_ATTR, None) or {}
+
+
+class ToolOptionsConfig:
+    """Tool options loaded from a `--tool-config` JSON file."""
+
+    def __init__(
+        self,
+        defaults: Optional[Dict[str, Any]] = None,
+        tools: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.defaults = validate_tool_options(defaults or {})
+        self.tools = {
+            key: validate_tool_options(options)
+            for key, options in (tools or {}).items()
+        }
+
+    @classmethod
+    def from_file(cls, config_path: pathlib.Path) -> "ToolOptionsConfig":
+        """
+        Load tool options from a JSON file.
+
+        Raises:
+            ValueError: If the file cannot be read or contains invalid options.
+        """
+        try:
+            data = json.loads(config_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read tool config {config_path}: {e}")
+        if not isinstance(data, dict):
+            raise ValueError(f"Tool config {config_path} must contain a JSON object")
+        try:
+            return cls(data.get("defaults"), data.get("tools"))
+        except ValueError as e:
+            raise ValueError(f"Invalid tool config {config_path}: {e}")
+
+    def resolve(
+        self,
+        func: Optional[Callable[..., Any]],
+        func_name: str,
+        file_path: Optional[pathlib.Path] = None,
+        base_dir: Optional[pathlib.Path] = None,
+    ) -> Dict[str, Any]:
+        """
+        Merge the file defaults, the decorator options and the file entries of a tool.
+
+        Args:
+            func: The tool function, or None if it is not loaded (lazy tools).
+            func_name: The tool function name.
+            file_path: The file that defines the function.
+            base_dir: The source directory entry paths are relative to.
+
+        Returns:
+            The effective options of the tool.
+        """
+        options = dict(self.defaults)
+        options.update(get_tool_options(func))
+        options.update(self.tools.get(func_name, {}))
+        if file_path is not None:
+            try:
+                relative_path = (
+                    file_path.relative_to(base_dir) if base_dir else file_path
+                )
+            except ValueError:
+                relative_path = file_path
+            options.update(
+                self.tools.get(f"{relative_path.as_posix()}:{func_name}", {})
+            )
+        return options
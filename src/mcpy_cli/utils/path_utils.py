@@ -5,10 +5,24 @@ Path utilities for the MCP-CLI.
 import os
 import pathlib
 import logging
-from typing import Optional
+import re
+from typing import Iterator, List, Optional, Pattern, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+IGNORE_FILE_NAME = ".mcpyignore"
+
+# Directories that never contain user tools. Hidden directories (".venv", ".git",
+# ".tox", ...) are pruned as well. A "!name/" rule in .mcpyignore re-includes them.
+DEFAULT_IGNORE_PATTERNS: List[str] = [
+    ".*/",
+    "__pycache__/",
+    "node_modules/",
+    "venv/",
+    "site-packages/",
+    "*.egg-info/",
+]
+
 
 def normalize_path(path_str: str) -> str:
     """
@@ -58,11 +72,211 @@ def validate_source_path(source_path: Optional[str], logger: logging.Logger) ->
         logger.error(f"Source path is not a Python file: {path_obj.absolute()}")
         return False
 
-    # If it's a directory, check if it contains any Python files
+    # If it's a directory, check if it contains any Python files. The scan stops at
+    # the first match and applies the same pruning rules as discovery.
     if path_obj.is_dir():
-        py_files = list(path_obj.glob("**/*.py"))
-        if not py_files:
+        first_py_file = next(iter_python_files(path_obj), None)
+        if first_py_file is None:
             logger.error(f"No Python files found in directory: {path_obj.absolute()}")
             return False
 
     return True
+
+
+class IgnoreRules:
+    """
+    Gitignore-style include/exclude rules evaluated against paths relative to the
+    scanned root.
+
+    Supported syntax: `#` comments, `!` negation (re-include), a trailing `/` to match
+    directories only, a leading or inner `/` to anchor the pattern to the root, and
+    the `*`, `?`, `[...]` and `**` wildcards. The last matching rule wins.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self._rules: List[Tuple[Pattern[str], bool, bool]] = []
+        for raw in patterns:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            regex = self._translate(line.lstrip("/"))
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+            self._rules.append((re.compile(regex + "$"), negate, dir_only))
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """Translate a gitignore glob into a regular expression."""
+        parts: List[str] = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith("**/", i):
+                parts.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                parts.append(".*")
+                i += 2
+                continue
+            if char == "*":
+                parts.append("[^/]*")
+            elif char == "?":
+                parts.append("[^/]")
+            elif char == "[":
+                end = pattern.find("]", i + 1)
+                if end == -1:
+                    parts.append(re.escape(char))
+                else:
+                    body = pattern[i + 1 : end].replace("\\", "\\\\")
+                    if body.startswith("!"):
+                        body = "^" + body[1:]
+                    parts.append(f"[{body}]")
+                    i = end
+            else:
+                parts.append(re.escape(char))
+            i += 1
+        return "".join(parts)
+
+    def is_ignored(self, relative_path: str, is_dir: bool) -> bool:
+        """
+        Check whether a path relative to the root is excluded.
+
+        Args:
+            relative_path: POSIX-style path relative to the scanned root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the last matching rule excludes the path
+        """
+        ignored = False
+        for regex, negate, dir_only in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relative_path):
+                ignored = not negate
+        return ignored
+
+    def is_path_excluded(self, relative_path: str) -> bool:
+        """
+        Check whether a file is excluded, either directly or through one of its
+        parent directories.
+
+        Args:
+            relative_path: POSIX-style file path relative to the scanned root
+
+        Returns:
+            True if the file or any of its parent directories is ignored
+        """
+        parts = relative_path.split("/")
+        for i in range(1, len(parts)):
+            if self.is_ignored("/".join(parts[:i]), True):
+                return True
+        return self.is_ignored(relative_path, False)
+
+
+def load_ignore_rules(
+    root: pathlib.Path, ignore_file: Optional[pathlib.Path] = None
+) -> IgnoreRules:
+    """
+    Build the ignore rules for a source root: the default pruned directories
+    followed by the rules of the ignore file.
+
+    Args:
+        root: The directory being scanned
+        ignore_file: Optional ignore file. Defaults to `<root>/.mcpyignore` if present.
+
+    Returns:
+        The combined IgnoreRules
+    """
+    patterns = list(DEFAULT_IGNORE_PATTERNS)
+    ignore_path = ignore_file or (root / IGNORE_FILE_NAME)
+    if ignore_path.is_file():
+        try:
+            patterns.extend(ignore_path.read_text(encoding="utf-8").splitlines())
+            logger.debug(f"Loaded ignore rules from {ignore_path}")
+        except OSError as e:
+            logger.warning(f"Could not read ignore file {ignore_path}: {e}")
+    elif ignore_file is not None:
+        logger.warning(f"Ignore file not found: {ignore_file}")
+    return IgnoreRules(patterns)
+
+
+def iter_python_files(
+    root: pathlib.Path,
+    max_depth: Optional[int] = None,
+    ignore_file: Optional[pathlib.Path] = None,
+) -> Iterator[pathlib.Path]:
+    """
+    Yield the Python files below a directory in a single pruned pass.
+
+    The walk uses `os.scandir`, skips ignored directories without descending into
+    them, follows directory symlinks at most once per target (so symlink loops
+    terminate), and yields files in a deterministic, sorted order.
+
+    Args:
+        root: The directory to scan
+        max_depth: Maximum directory depth to descend into. 0 scans only `root`
+            itself; None means unlimited.
+        ignore_file: Optional ignore file. Defaults to `<root>/.mcpyignore` if present.
+
+    Yields:
+        Paths of the discovered .py files
+    """
+    rules = load_ignore_rules(root, ignore_file)
+    visited: Set[Tuple[int, int]] = set()
+
+    def walk(
+        directory: pathlib.Path, relative: str, depth: int
+    ) -> Iterator[pathlib.Path]:
+        try:
+            stat = directory.stat()
+        except OSError as e:
+            logger.warning(f"Cannot access directory {directory}: {e}")
+            return
+        key = (stat.st_dev, stat.st_ino)
+        if key in visited:
+            logger.debug(
+                f"Skipping already visited directory (symlink loop?): {directory}"
+            )
+            return
+        visited.add(key)
+
+        try:
+            with os.scandir(directory) as entries:
+                sorted_entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+            return
+
+        subdirectories = []
+        for entry in sorted_entries:
+            entry_relative = f"{relative}{entry.name}"
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if not rules.is_ignored(entry_relative, True):
+                    subdirectories.append((entry, entry_relative))
+                else:
+                    logger.debug(f"Pruned directory: {entry_relative}")
+            elif entry.name.endswith(".py") and not rules.is_ignored(
+                entry_relative, False
+            ):
+                yield pathlib.Path(entry.path)
+
+        if max_depth is not None and depth >= max_depth:
+            return
+        for entry, entry_relative in subdirectories:
+            yield from walk(pathlib.Path(entry.path), entry_relative + "/", depth + 1)
+
+    yield from walk(root, "", 0)
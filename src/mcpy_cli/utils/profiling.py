@@ -0,0 +1,243 @@
+"""
+Startup profiling utilities for the MCP-CLI.
+
+Code on the startup path marks its phases with `profile_phase(...)`. The markers are
+no-ops unless a `StartupProfiler` is active, which is only the case while running the
+`profile-startup` command.
+
+Phase times are exclusive: time spent in a nested phase (for example schema
+generation during tool registration) is attributed to the nested phase only.
+"""
+
+import json
+import logging
+import pathlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_active_profiler: Optional["StartupProfiler"] = None
+
+
+class PhaseStats:
+    """Accumulated wall and CPU time of one startup phase."""
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.calls = 0
+
+
+class StartupProfiler:
+    """
+    Collects per-phase wall and CPU time, per-file import details and peak RSS.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseStats] = {}
+        self.file_imports: Dict[str, Dict[str, Any]] = {}
+        self.total_wall = 0.0
+        self.total_cpu = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[List[float]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase, excluding the time of phases nested inside it."""
+        stack = self._stack()
+        # [wall start, cpu start, nested wall, nested cpu]
+        frame = [time.perf_counter(), time.thread_time(), 0.0, 0.0]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            wall = time.perf_counter() - frame[0]
+            cpu = time.thread_time() - frame[1]
+            if stack:
+                stack[-1][2] += wall
+                stack[-1][3] += cpu
+            with self._lock:
+                stats = self.phases.setdefault(name, PhaseStats())
+                stats.wall += wall - frame[2]
+                stats.cpu += cpu - frame[3]
+                stats.calls += 1
+
+    @contextmanager
+    def total(self) -> Iterator[None]:
+        """Time the whole profiled run."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.total_wall = time.perf_counter() - wall_start
+            self.total_cpu = time.process_time() - cpu_start
+
+    def record_import(
+        self, file_path: pathlib.Path, seconds: float, modules: List[str]
+    ) -> None:
+        """Record the import time of a file and the modules its import pulled in."""
+        with self._lock:
+            self.file_imports[str(file_path)] = {
+                "seconds": seconds,
+                "modules_imported": len(modules),
+                "modules": sorted(modules),
+            }
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build a JSON-serializable report.
+
+        Returns:
+            A dict with totals, phases sorted by wall time, per-file imports sorted by
+            import time, and peak RSS in bytes (None where unavailable).
+        """
+        phases = [
+            {
+                "phase": name,
+                "wall_ms": stats.wall * 1000,
+                "cpu_ms": stats.cpu * 1000,
+                "calls": stats.calls,
+            }
+            for name, stats in self.phases.items()
+        ]
+        phases.sort(key=lambda phase: phase["wall_ms"], reverse=True)
+        files = [
+            {"file": file_path, **details}
+            for file_path, details in self.file_imports.items()
+        ]
+        files.sort(key=lambda entry: entry["seconds"], reverse=True)
+        return {
+            "total_wall_ms": self.total_wall * 1000,
+            "total_cpu_ms": self.total_cpu * 1000,
+            "unattributed_wall_ms": max(
+                0.0, (self.total_wall - sum(s.wall for s in self.phases.values()))
+            )
+            * 1000,
+            "peak_rss_bytes": get_peak_rss_bytes(),
+            "phases": phases,
+            "files": files,
+        }
+
+    def format_table(self, top_files: int = 10) -> str:
+        """Render the report as plain-text tables sorted by wall time."""
+        report = self.report()
+        total_wall = report["total_wall_ms"] or 1.0
+        lines = [
+            f"{'Phase':<22}{'Wall ms':>12}{'CPU ms':>12}{'Calls':>8}{'% wall':>9}",
+            "-" * 63,
+        ]
+        for phase in report["phases"]:
+            lines.append(
+                f"{phase['phase']:<22}{phase['wall_ms']:>12.2f}{phase['cpu_ms']:>12.2f}"
+                f"{phase['calls']:>8}{phase['wall_ms'] / total_wall:>9.1%}"
+            )
+        lines.append(
+            f"{'(other)':<22}{report['unattributed_wall_ms']:>12.2f}{'':>12}{'':>8}"
+            f"{report['unattributed_wall_ms'] / total_wall:>9.1%}"
+        )
+        lines.append("-" * 63)
+        lines.append(
+            f"{'total':<22}{report['total_wall_ms']:>12.2f}{report['total_cpu_ms']:>12.2f}"
+        )
+
+        peak_rss = report["peak_rss_bytes"]
+        lines.append("")
+        lines.append(
+            f"Peak RSS: {peak_rss / (1024 * 1024):.1f} MiB"
+            if peak_rss is not None
+            else "Peak RSS: unavailable on this platform"
+        )
+
+        if report["files"]:
+            lines.append("")
+            lines.append(f"{'Slowest imports':<50}{'ms':>10}{'Modules':>10}")
+            lines.append("-" * 70)
+            for entry in report["files"][:top_files]:
+                lines.append(
+                    f"{_shorten(entry['file'], 50):<50}{entry['seconds'] * 1000:>10.2f}"
+                    f"{entry['modules_imported']:>10}"
+                )
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        """Serialize the report as JSON."""
+        return json.dumps(self.report(), indent=2)
+
+
+def _shorten(text: str, width: int) -> str:
+    return text if len(text) <= width else "..." + text[-(width - 3) :]
+
+
+def get_peak_rss_bytes() -> Optional[int]:
+    """
+    Returns the peak resident set size of the current process in bytes, or None if
+    the platform does not provide it.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_active_profiler() -> Optional[StartupProfiler]:
+    """Returns the active startup profiler, if any."""
+    return _active_profiler
+
+
+@contextmanager
+def activate_profiler(profiler: StartupProfiler) -> Iterator[StartupProfiler]:
+    """Make a profiler active for the duration of the block."""
+    global _active_profiler
+    previous = _active_profiler
+    _active_profiler = profiler
+    try:
+        with profiler.total():
+            yield profiler
+    finally:
+        _active_profiler = previous
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """Mark a startup phase. Does nothing unless a profiler is active."""
+    profiler = _active_profiler
+    if profiler is None:
+        yield
+        return
+    with profiler.phase(name):
+        yield
+
+
+@contextmanager
+def profile_import(file_path: pathlib.Path) -> Iterator[None]:
+    """
+    Mark the import of a user module and record the modules it pulled into
+    `sys.modules`. Does nothing unless a profiler is active.
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield
+        return
+    modules_before = set(sys.modules)
+    start = time.perf_counter()
+    try:
+        with profiler.phase("import"):
+            yield
+    finally:
+        imported = [name for name in sys.modules if name not in modules_before]
+        profiler.record_import(file_path, time.perf_counter() - start, imported)
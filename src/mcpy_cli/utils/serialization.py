@@ -0,0 +1,201 @@
+"""
+Fast JSON serialization for MCP applications.
+
+Tool results, event store messages and the JSON responses of the application are
+encoded with orjson when it is installed (`pip install mcpy-cli[fast]`) and with
+pydantic-core, which pydantic always brings along, otherwise. Another serializer,
+including the standard library `json` module, can be selected with `set_serializer`
+(the `--serializer` run option). All of them produce compact JSON and accept
+the same values: besides the JSON types, pydantic models, dataclasses, dates, UUIDs,
+enums and sets are converted as FastMCP does, and anything else is encoded as its
+string representation.
+"""
+
+import json
+import logging
+from typing import Any, Optional, Union
+
+import pydantic_core
+from pydantic_core import to_jsonable_python
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+SERIALIZER_AUTO = "auto"
+SERIALIZER_ORJSON = "orjson"
+SERIALIZER_PYDANTIC = "pydantic"
+SERIALIZER_JSON = "json"
+SERIALIZER_CHOICES = (
+    SERIALIZER_AUTO,
+    SERIALIZER_ORJSON,
+    SERIALIZER_PYDANTIC,
+    SERIALIZER_JSON,
+)
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Convert a value the JSON encoders do not support natively."""
+    return to_jsonable_python(obj, fallback=str)
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(
+        obj, default=_to_jsonable, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+class JSONSerializer:
+    """Compact JSON serialization with the standard library `json` module."""
+
+    name = SERIALIZER_JSON
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize a value to a JSON string."""
+        return _stdlib_dumps(obj)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serialize a value to UTF-8 encoded JSON."""
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Deserialize a JSON string or UTF-8 encoded JSON."""
+        return json.loads(data)
+
+
+class PydanticSerializer(JSONSerializer):
+    """Compact JSON serialization with pydantic-core."""
+
+    name = SERIALIZER_PYDANTIC
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        try:
+            return pydantic_core.to_json(obj, fallback=str)
+        except (pydantic_core.PydanticSerializationError, ValueError):
+            return _stdlib_dumps(obj).encode("utf-8")
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return pydantic_core.from_json(data)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    Compact JSON serialization with orjson.
+
+    Values orjson rejects (e.g. integers beyond 64 bits) are serialized with the
+    standard library instead, so both serializers accept the same values.
+    """
+
+    name = SERIALIZER_ORJSON
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "orjson is not installed. Install it with: pip install orjson"
+            )
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=_to_jsonable, option=self._options)
+        except orjson.JSONEncodeError:
+            return _stdlib_dumps(obj).encode("utf-8")
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+def get_serializer(name: Optional[str] = None) -> JSONSerializer:
+    """
+    Get a JSON serializer by name.
+
+    Args:
+        name: "orjson", "pydantic", "json" (the standard library), or "auto" (the
+            default) for orjson when it is installed and pydantic-core otherwise.
+
+    Returns:
+        The serializer.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If "orjson" is requested but orjson is not installed.
+    """
+    name = name or SERIALIZER_AUTO
+    if name not in SERIALIZER_CHOICES:
+        raise ValueError(
+            f"Unknown serializer '{name}', expected one of {', '.join(SERIALIZER_CHOICES)}"
+        )
+    if name == SERIALIZER_ORJSON or (name == SERIALIZER_AUTO and orjson is not None):
+        return OrjsonSerializer()
+    if name == SERIALIZER_JSON:
+        return JSONSerializer()
+    return PydanticSerializer()
+
+
+_serializer = get_serializer()
+
+
+def set_serializer(name: Optional[str] = None) -> JSONSerializer:
+    """
+    Select the serializer used by `dumps`, `dumps_bytes` and `loads`, and so for tool
+    results, JSON responses and stored events. Applies to the whole process and is
+    meant to be called before the application is built.
+
+    Args:
+        name: The serializer name, see `get_serializer`.
+
+    Returns:
+        The selected serializer.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If "orjson" is requested but orjson is not installed.
+    """
+    global _serializer
+    _serializer = get_serializer(name)
+    logger.debug(f"Using the '{_serializer.name}' JSON serializer")
+    return _serializer
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a value to a JSON string with the selected serializer."""
+    return _serializer.dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize a value to UTF-8 encoded JSON with the selected serializer."""
+    return _serializer.dumps_bytes(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string or UTF-8 encoded JSON with the selected serializer."""
+    return _serializer.loads(data)
+
+
+def serialize_tool_result(result: Any) -> str:
+    """
+    Serialize a tool result that is not already MCP content to text.
+
+    Used as the FastMCP `tool_serializer` of the application's servers in place of
+    FastMCP's default, which pretty-prints the result with pydantic.
+    """
+    if isinstance(result, str):
+        return result
+    return dumps(result)
+
+
+class FastJSONResponse(JSONResponse):
+    """A Starlette JSON response rendered with the fast serializer."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
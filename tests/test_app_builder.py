@@ -1,10 +1,15 @@
 import unittest
+import asyncio
+import json
+import inspect
 import os
 import sys
 import pathlib
 import logging
 import tempfile
 import shutil
+import threading
+import time
 from unittest.mock import Mock, patch
 
 # Configure logging for tests
@@ -18,14 +23,31 @@ sys.path.append(os.path.join(project_root, "src"))
 # Import required modules
 try:
     from mcpy_cli.app_builder import (
+        create_mcp_application,
         create_mcp_instances,
         discover_and_group_functions,
         get_route_from_path,
         validate_resource_prefix,
         SessionToolCallCache,
+        ToolCallCoalescer,
+        DiscoveryManifest,
+        LazyModuleLoader,
+        create_lazy_mcp_instances,
+        discover_and_group_functions_static,
+        HotReloader,
+        set_current_session_id,
     )
     from mcpy_cli.app_builder.validation import validate_and_wrap_tool
+    from mcpy_cli.app_builder.execution import (
+        ToolExecutors,
+        ToolProcessPool,
+        ToolThreadPool,
+    )
+    from mcpy_cli.app_builder.limits import ToolConcurrencyLimiter, ToolLimits
+    from mcpy_cli.app_builder.tool_errors import SERVER_BUSY, TOOL_TIMEOUT
     from mcpy_cli.app_builder.mocking import get_fastmcp_class
+    from mcpy_cli.tool_options import ToolOptionsConfig
+    from mcpy_cli.utils import TransformationError
 
     imports_successful = True
 except ImportError as e:
@@ -162,6 +184,32 @@ class TestAppBuilderValidation(unittest.TestCase):
         log_output = " ".join(log.output)
         self.assertIn("missing a type hint", log_output)
 
+    def test_registered_tool_pins_signature(self):
+        """Test that a registered tool matches FastMCP's and keeps its signature."""
+        from fastmcp import FastMCP
+        from fastmcp.tools import Tool
+
+        def scale(values: list, factor: float = 2.0) -> list:
+            """Scale values."""
+            return [value * factor for value in values]
+
+        reference = Tool.from_function(scale)
+        mcp = FastMCP(name="TestMCP")
+        self.assertTrue(
+            validate_and_wrap_tool(mcp, scale, "scale", pathlib.Path("test.py"))
+        )
+        tool = asyncio.run(mcp.get_tools())["scale"]
+
+        self.assertEqual(
+            tool.model_dump(exclude={"fn", "serializer"}),
+            reference.model_dump(exclude={"fn", "serializer"}),
+        )
+        self.assertIs(inspect.signature(tool.fn), inspect.signature(tool.fn))
+        result = asyncio.run(tool.run({"values": [1, 2], "factor": "3"}))
+        self.assertEqual(json.loads(result[0].text), [3.0, 6.0])
+        with self.assertRaises(Exception):
+            asyncio.run(tool.run({"values": [1], "factor": "not a number"}))
+
 
 @unittest.skipIf(not imports_successful, "Required modules could not be imported")
 class TestAppBuilderCaching(unittest.TestCase):
@@ -214,6 +262,297 @@ class TestAppBuilderCaching(unittest.TestCase):
         self.assertIsNone(self.cache.get("session1", "tool1", {"x": 1}))
         self.assertEqual(self.cache.get("session2", "tool1", {"x": 1}), {"result": 2})
 
+    def test_cache_evicts_least_recently_used(self):
+        """Test per-session and global entry limits evict the least recently used."""
+        cache = SessionToolCallCache(max_entries=3, max_entries_per_session=2)
+        cache.set("s1", "tool", {"x": 1}, 1)
+        cache.set("s1", "tool", {"x": 2}, 2)
+        cache.get("s1", "tool", {"x": 1})
+        cache.set("s1", "tool", {"x": 3}, 3)
+        self.assertIsNone(cache.get("s1", "tool", {"x": 2}))
+        self.assertEqual(cache.get("s1", "tool", {"x": 1}), 1)
+
+        cache.set("s2", "tool", {"x": 1}, 4)
+        cache.set("s2", "tool", {"x": 2}, 5)
+        # Entry {"x": 3} of s1 is now the least recently used across sessions
+        self.assertIsNone(cache.get("s1", "tool", {"x": 3}))
+        self.assertEqual(cache.get("s1", "tool", {"x": 1}), 1)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["total_cached_entries"], 3)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 2)
+
+    def test_cache_byte_budget(self):
+        """Test the byte budget evicts old results and skips oversized ones."""
+        cache = SessionToolCallCache(max_bytes=250)
+        cache.set("s1", "tool", {"x": 1}, "a" * 100)
+        cache.set("s1", "tool", {"x": 2}, "b" * 100)
+        cache.set("s1", "tool", {"x": 3}, "c" * 100)
+        self.assertIsNone(cache.get("s1", "tool", {"x": 1}))
+        self.assertEqual(cache.get("s1", "tool", {"x": 3}), "c" * 100)
+
+        cache.set("s1", "tool", {"x": 4}, "d" * 1000)
+        self.assertIsNone(cache.get("s1", "tool", {"x": 4}))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["bytes"], 204)
+        self.assertEqual(stats["oversized"], 1)
+        cache.clear_session("s1")
+        self.assertEqual(cache.get_stats()["bytes"], 0)
+        self.assertEqual(cache.get_stats()["total_sessions"], 0)
+
+    def test_cache_ttl(self):
+        """Test results expire after the TTL."""
+        cache = SessionToolCallCache(ttl=60)
+        with patch("mcpy_cli.app_builder.caching.time.monotonic", return_value=0.0):
+            cache.set("s1", "tool", {"x": 1}, 1)
+        with patch("mcpy_cli.app_builder.caching.time.monotonic", return_value=30.0):
+            self.assertEqual(cache.get("s1", "tool", {"x": 1}), 1)
+        with patch("mcpy_cli.app_builder.caching.time.monotonic", return_value=61.0):
+            self.assertIsNone(cache.get("s1", "tool", {"x": 1}))
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+        self.assertEqual(cache.get_stats()["total_cached_entries"], 0)
+
+        with self.assertRaises(ValueError):
+            SessionToolCallCache(ttl=0)
+
+    def test_session_close_clears_cache(self):
+        """Test ending a session with DELETE drops its cached results."""
+        closed = []
+
+        async def endpoint(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        from starlette.testclient import TestClient
+        from mcpy_cli.app_builder.middleware import SessionMiddleware
+
+        client = TestClient(SessionMiddleware(endpoint, on_session_closed=closed.append))
+        client.post("/", headers={"mcp-session-id": "s1"})
+        self.assertEqual(closed, [])
+        client.delete("/", headers={"mcp-session-id": "s1"})
+        self.assertEqual(closed, ["s1"])
+
+    def test_cached_async_tool(self):
+        """Test async tools cache their result and keep their signature."""
+        import inspect
+
+        calls = []
+
+        async def lookup(key: str, limit: int = 3) -> str:
+            """Look a key up."""
+            calls.append(key)
+            await asyncio.sleep(0)
+            return f"value-{key}"
+
+        cached = self.cache.create_cached_tool(lookup)
+        self.assertTrue(inspect.iscoroutinefunction(cached))
+        self.assertEqual(inspect.signature(cached), inspect.signature(lookup))
+        self.assertEqual(cached.__doc__, "Look a key up.")
+
+        async def run():
+            set_current_session_id("s1")
+            return [await cached(key="a"), await cached(key="a")]
+
+        self.assertEqual(asyncio.run(run()), ["value-a", "value-a"])
+        self.assertEqual(calls, ["a"])
+
+    def test_positional_and_keyword_calls_share_key(self):
+        """Test calls are keyed on the arguments bound to the signature."""
+        calls = []
+
+        def lookup(key: str, limit: int = 3) -> str:
+            calls.append((key, limit))
+            return f"value-{key}-{limit}"
+
+        cached = self.cache.create_cached_tool(lookup)
+
+        async def run():
+            set_current_session_id("s1")
+            return [
+                await cached("a"),
+                await cached(key="a"),
+                await cached("a", limit=3),
+                await cached("a", 4),
+                await cached(key="a", limit=4),
+            ]
+
+        results = asyncio.run(run())
+        self.assertEqual(results, ["value-a-3"] * 3 + ["value-a-4"] * 2)
+        self.assertEqual(calls, [("a", 3), ("a", 4)])
+
+    def test_cache_keys_are_typed(self):
+        """Test non-JSON values are keyed by type and unknown types are not cached."""
+        import datetime
+        from mcpy_cli.app_builder.call_keys import call_key
+
+        class Opaque:
+            def __str__(self):
+                return "same"
+
+        for encoder in ("orjson", "json"):
+            with self.subTest(encoder=encoder):
+                if encoder == "json":
+                    patcher = patch("mcpy_cli.app_builder.call_keys.orjson", None)
+                    patcher.start()
+                    self.addCleanup(patcher.stop)
+                self.assertNotEqual(call_key({"x": b"ab"}), call_key({"x": "6162"}))
+                self.assertNotEqual(call_key({"x": {1, 2}}), call_key({"x": [1, 2]}))
+                self.assertEqual(call_key({"x": {2, "b"}}), call_key({"x": {"b", 2}}))
+                self.assertNotEqual(
+                    call_key({"x": datetime.date(2024, 1, 1)}),
+                    call_key({"x": "2024-01-01"}),
+                )
+                self.assertNotEqual(
+                    call_key({"x": float("nan")}), call_key({"x": None})
+                )
+                self.assertEqual(
+                    call_key({"x": {"b": 1, "a": [1.5, None]}}),
+                    call_key({"x": {"a": [1.5, None], "b": 1}}),
+                )
+                self.assertNotEqual(call_key({"x": 1}, "t1"), call_key({"x": 1}, "t2"))
+                self.assertEqual(call_key({"x": 2**70}), call_key({"x": 2**70}))
+                self.assertIsNone(call_key({"x": Opaque()}))
+
+        self.assertIsNone(self.cache.get("s1", "tool", {"x": Opaque()}))
+        self.cache.set("s1", "tool", {"x": Opaque()}, "result")
+        self.assertEqual(self.cache.get_stats()["total_cached_entries"], 0)
+
+    def test_non_finite_floats_fall_back_to_stdlib(self):
+        """Test only NaN and infinities, not nulls, bypass orjson."""
+        import dataclasses
+        from mcpy_cli.app_builder import call_keys
+
+        if call_keys.orjson is None:
+            self.skipTest("orjson is not installed")
+
+        @dataclasses.dataclass
+        class Point:
+            x: float
+
+        with patch.object(
+            call_keys, "_stdlib_encode", wraps=call_keys._stdlib_encode
+        ) as stdlib_encode:
+            call_keys.encode_canonical({"name": "nullable", "value": None})
+            stdlib_encode.assert_not_called()
+            call_keys.encode_canonical({"values": [1.0, float("inf")]})
+            call_keys.encode_canonical(Point(float("nan")))
+            self.assertEqual(stdlib_encode.call_count, 2)
+        self.assertNotEqual(
+            call_keys.call_key({"p": Point(float("nan"))}),
+            call_keys.call_key({"p": Point(None)}),  # type: ignore[arg-type]
+        )
+
+    def test_interleaved_sessions(self):
+        """Test hundreds of sessions interleaving on one thread stay isolated."""
+        executions = []
+
+        async def whoami(tag: str) -> str:
+            executions.append(tag)
+            await asyncio.sleep(0.001)
+            return f"{tag}-{len(executions)}"
+
+        cached = self.cache.create_cached_tool(whoami)
+
+        async def session(index):
+            set_current_session_id(f"session-{index}")
+            first = await cached(tag="same")
+            await asyncio.sleep(0)
+            return first, await cached(tag="same")
+
+        async def run():
+            return await asyncio.gather(*(session(index) for index in range(300)))
+
+        results = asyncio.run(run())
+        self.assertEqual(len(executions), 300)
+        self.assertTrue(all(first == second for first, second in results))
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["total_sessions"], 300)
+        self.assertEqual((stats["hits"], stats["misses"]), (300, 300))
+
+    def test_concurrent_sessions_through_application(self):
+        """Test concurrent MCP sessions each get their own cached async results."""
+        import httpx
+        from starlette.testclient import TestClient
+
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_cache_sessions_"))
+        self.addCleanup(shutil.rmtree, temp_dir)
+        tools_file = temp_dir / "tools.py"
+        tools_file.write_text(
+            '''"""Async tool counting its executions."""
+import asyncio
+
+CALLS = []
+
+async def whoami(tag: str) -> str:
+    """Return a tag with the execution number."""
+    CALLS.append(tag)
+    await asyncio.sleep(0.005)
+    return f"{tag}-{len(CALLS)}"
+'''
+        )
+        app = create_mcp_application(str(tools_file), json_response=True)
+        headers = {
+            "accept": "application/json, text/event-stream",
+            "content-type": "application/json",
+        }
+
+        async def session(client):
+            response = await client.post(
+                "/mcp-server/mcp/",
+                headers=headers,
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "initialize",
+                    "params": {
+                        "protocolVersion": "2025-03-26",
+                        "capabilities": {},
+                        "clientInfo": {"name": "test", "version": "1"},
+                    },
+                },
+            )
+            session_headers = {
+                **headers,
+                "mcp-session-id": response.headers["mcp-session-id"],
+            }
+            await client.post(
+                "/mcp-server/mcp/",
+                headers=session_headers,
+                json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            )
+            texts = []
+            for request_id in (2, 3):
+                response = await client.post(
+                    "/mcp-server/mcp/",
+                    headers=session_headers,
+                    json={
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "method": "tools/call",
+                        "params": {"name": "tools_whoami", "arguments": {"tag": "t"}},
+                    },
+                )
+                texts.append(response.json()["result"]["content"][0]["text"])
+            return texts
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                return await asyncio.gather(*(session(client) for _ in range(100)))
+
+        with TestClient(app) as client:
+            results = client.portal.call(run)
+
+        self.assertTrue(all(first == second for first, second in results))
+        stats = app.state.tool_call_cache.get_stats()
+        self.assertEqual(stats["total_sessions"], 100)
+        self.assertEqual((stats["hits"], stats["misses"]), (100, 100))
+
 
 @unittest.skipIf(not imports_successful, "Required modules could not be imported")
 class TestAppBuilderMocking(unittest.TestCase):
@@ -302,6 +641,1791 @@ def greet_user(name: str) -> str:
         self.assertIsInstance(instances, dict)
         self.assertGreater(len(instances), 0)
 
+    def test_module_executed_once_per_process(self):
+        """Test that building the application executes each user module once."""
+        marker = self.temp_dir / "executions.txt"
+        tool_file = self.temp_dir / "counted_tools.py"
+        tool_file.write_text(
+            f'''"""Counted tools."""
+with open({str(marker)!r}, "a") as marker:
+    marker.write("executed\\n")
+
+def echo(text: str) -> str:
+    """Echo the text back."""
+    return text
+'''
+        )
+
+        app = create_mcp_application(str(tool_file))
+
+        self.assertEqual(marker.read_text().count("executed"), 1)
+        main_mcp = app.state.fastmcp_instance
+        mounted = next(iter(main_mcp._mounted_servers.values())).server
+        self.assertEqual(mounted.instructions, "Counted tools.")
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestDiscoveryManifest(unittest.TestCase):
+    """Tests for the persistent discovery manifest."""
+
+    def setUp(self):
+        """Set up a source file and a manifest location."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_manifest_"))
+        self.sample_file = self.temp_dir / "sample_tools.py"
+        self.sample_file.write_text(
+            '''"""Sample tools."""
+
+def add_numbers(a: int, b: int) -> int:
+    """Add two numbers and return the result."""
+    return a + b
+'''
+        )
+        self.manifest_path = self.temp_dir / "cache" / "manifest.json"
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _build(self, target_function_names=None):
+        functions_by_file, base_dir = discover_and_group_functions(
+            str(self.sample_file), target_function_names
+        )
+        manifest = DiscoveryManifest(
+            base_dir, target_function_names, self.manifest_path
+        )
+        instances = create_mcp_instances(
+            functions_by_file, base_dir, "TestMCP", manifest=manifest
+        )
+        manifest.save()
+        return manifest, instances
+
+    def test_manifest_hit_on_unchanged_file(self):
+        """Test that an unchanged file is served from the manifest."""
+        first, _ = self._build()
+        self.assertEqual(first.get_stats()["misses"], 1)
+        self.assertTrue(self.manifest_path.exists())
+
+        second, instances = self._build()
+        self.assertEqual(second.get_stats()["hits"], 1)
+        self.assertEqual(second.get_stats()["misses"], 0)
+        file_mcp, _, tools_registered = instances[self.sample_file]
+        self.assertEqual(tools_registered, 1)
+        self.assertEqual(file_mcp.instructions, "Sample tools.")
+
+    def test_manifest_invalidated_by_file_change(self):
+        """Test that editing a file invalidates its manifest entry."""
+        self._build()
+        self.sample_file.write_text(
+            self.sample_file.read_text() + "\n\ndef extra(x: int) -> int:\n    return x\n"
+        )
+        manifest, instances = self._build()
+        self.assertEqual(manifest.get_stats()["misses"], 1)
+        self.assertEqual(instances[self.sample_file][2], 2)
+
+    def test_manifest_invalidated_by_function_filter(self):
+        """Test that changing --functions invalidates manifest entries."""
+        self._build()
+        manifest, _ = self._build(["add_numbers"])
+        self.assertEqual(manifest.get_stats()["misses"], 1)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestLazyToolRegistration(unittest.TestCase):
+    """Tests for lazily imported tool modules."""
+
+    def setUp(self):
+        """Create a tool module that records when it is imported."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_lazy_"))
+        self.marker = self.temp_dir / "imported.txt"
+        self.sample_file = self.temp_dir / "lazy_tools.py"
+        self.sample_file.write_text(
+            f'''"""Lazy tools."""
+with open({str(self.marker)!r}, "a") as marker:
+    marker.write("imported\\n")
+
+def add_numbers(a: int, b: int = 1) -> int:
+    """Add two numbers and return the result."""
+    return a + b
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _call(self, file_mcp, name, arguments):
+        from fastmcp import Client
+
+        async def call():
+            async with Client(file_mcp) as client:
+                tools = await client.list_tools()
+                result = await client.call_tool(name, arguments)
+                return tools, result
+
+        return asyncio.run(call())
+
+    def test_module_imported_on_first_call(self):
+        """Test that registration does not import and the first call does."""
+        functions_by_file, base_dir = discover_and_group_functions_static(
+            str(self.sample_file)
+        )
+        loader = LazyModuleLoader()
+        instances = create_lazy_mcp_instances(
+            functions_by_file, base_dir, "TestMCP", loader
+        )
+        self.assertFalse(self.marker.exists())
+
+        file_mcp = instances[self.sample_file][0]
+        tools, result = self._call(file_mcp, "add_numbers", {"a": "2"})
+        self.assertEqual(tools[0].inputSchema["required"], ["a"])
+        self.assertEqual(result[0].text, "3")
+        self._call(file_mcp, "add_numbers", {"a": 5, "b": 5})
+        self.assertEqual(self.marker.read_text().count("imported"), 1)
+        self.assertEqual(loader.get_stats()["loads"], 1)
+
+    def test_idle_module_evicted(self):
+        """Test that idle modules are evicted and re-imported on demand."""
+        functions_by_file, base_dir = discover_and_group_functions_static(
+            str(self.sample_file)
+        )
+        loader = LazyModuleLoader(idle_timeout=0)
+        instances = create_lazy_mcp_instances(
+            functions_by_file, base_dir, "TestMCP", loader
+        )
+        file_mcp = instances[self.sample_file][0]
+        self._call(file_mcp, "add_numbers", {"a": 1})
+        loader.evict_idle()
+        self.assertFalse(loader.is_loaded(self.sample_file))
+        self._call(file_mcp, "add_numbers", {"a": 1})
+        self.assertEqual(loader.get_stats()["loads"], 2)
+
+    def test_module_in_use_not_evicted(self):
+        """Test that a module with a call in flight is kept until the call ends."""
+        loader = LazyModuleLoader(idle_timeout=0)
+        loaded = loader.acquire(self.sample_file)
+        self.assertEqual(loader.evict_idle(), 0)
+        self.assertTrue(loader.is_loaded(self.sample_file))
+        loader.release(loaded)
+        self.assertEqual(loader.evict_idle(), 1)
+        self.assertFalse(loader.is_loaded(self.sample_file))
+
+    def test_idle_modules_evicted_in_background(self):
+        """Test that a started loader evicts idle modules without any calls."""
+        loader = LazyModuleLoader(idle_timeout=0, eviction_interval=0.01)
+        loader.load(self.sample_file)
+        loader.start()
+        try:
+            deadline = time.monotonic() + 5
+            while loader.is_loaded(self.sample_file) and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            loader.shutdown()
+        self.assertFalse(loader.is_loaded(self.sample_file))
+
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestHotReload(unittest.TestCase):
+    """Tests for incremental hot reload."""
+
+    def setUp(self):
+        """Create a source tree with two tool files."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_reload_"))
+        self.alpha_file = self.temp_dir / "alpha.py"
+        self.beta_file = self.temp_dir / "beta.py"
+        self.alpha_file.write_text("def first(x: int) -> int:\n    return x\n")
+        self.beta_file.write_text("def second(x: int) -> int:\n    return x\n")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _tool_names(self, main_mcp):
+        return sorted(asyncio.run(main_mcp.get_tools()))
+
+    def test_composed_reload_swaps_only_changed_file(self):
+        """Test that a change rebuilds one instance and leaves the others mounted."""
+        app = create_mcp_application(str(self.temp_dir), hot_reload=True)
+        reloader = app.state.hot_reloader
+        self.assertIsInstance(reloader, HotReloader)
+        main_mcp = app.state.fastmcp_instance
+        beta_instance = main_mcp._mounted_servers["beta"].server
+        reloader.poll_changes()
+
+        self.alpha_file.write_text(
+            "def first(x: int) -> int:\n    return x\n\n"
+            "def third(x: int) -> int:\n    return x * 3\n"
+        )
+        changed = reloader.poll_changes()
+        self.assertEqual(changed, {self.alpha_file})
+        counts = asyncio.run(reloader.apply_changes(changed))
+
+        self.assertEqual(counts["updated"], 1)
+        self.assertEqual(
+            self._tool_names(main_mcp), ["alpha_first", "alpha_third", "beta_second"]
+        )
+        self.assertIs(main_mcp._mounted_servers["beta"].server, beta_instance)
+
+    def test_failed_reload_keeps_previous_instance(self):
+        """Test that a file with a syntax error keeps serving its old tools."""
+        app = create_mcp_application(str(self.temp_dir), hot_reload=True)
+        reloader = app.state.hot_reloader
+        main_mcp = app.state.fastmcp_instance
+
+        self.alpha_file.write_text("def first(x: int) -> int\n")
+        counts = asyncio.run(reloader.apply_changes({self.alpha_file}))
+        self.assertEqual(counts["failed"], 1)
+        self.assertIn("alpha_first", self._tool_names(main_mcp))
+
+    def test_deleted_file_is_unmounted(self):
+        """Test that deleting a file removes its tools."""
+        app = create_mcp_application(str(self.temp_dir), hot_reload=True)
+        reloader = app.state.hot_reloader
+        self.beta_file.unlink()
+        counts = asyncio.run(reloader.apply_changes({self.beta_file}))
+        self.assertEqual(counts["removed"], 1)
+        self.assertEqual(
+            self._tool_names(app.state.fastmcp_instance), ["alpha_first"]
+        )
+
+    def test_routed_reload_replaces_mount(self):
+        """Test that routed mode swaps the changed file's route only."""
+        app = create_mcp_application(str(self.temp_dir), mode="routed", hot_reload=True)
+        reloader = app.state.hot_reloader
+        mounts = {route.path: route for route in app.router.routes}
+
+        async def reload_and_close():
+            self.alpha_file.write_text("def first(y: str) -> str:\n    return y\n")
+            await reloader.apply_changes({self.alpha_file})
+            routes = {route.path: route for route in app.router.routes}
+            await reloader.target.aclose()
+            return routes
+
+        routes = asyncio.run(reload_and_close())
+        self.assertIsNot(routes["/alpha"], mounts["/alpha"])
+        self.assertIs(routes["/beta"], mounts["/beta"])
+        self.assertEqual(len(app.state.mcp_instances), 2)
+
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestToolExecution(unittest.TestCase):
+    """Tests for offloading synchronous tools to an executor."""
+
+    def setUp(self):
+        """Create a module with a blocking and an async tool."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_executor_"))
+        self.sample_file = self.temp_dir / "slow_tools.py"
+        self.sample_file.write_text(
+            '''"""Slow tools."""
+import time
+
+def slow_echo(text: str, delay: float = 0.2) -> str:
+    """Sleep, then echo the text."""
+    time.sleep(delay)
+    return text
+
+async def fast_echo(text: str) -> str:
+    """Echo the text."""
+    return text
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _create_instance(self, tool_executor=None):
+        functions_by_file, base_dir = discover_and_group_functions(
+            str(self.sample_file)
+        )
+        instances = create_mcp_instances(
+            functions_by_file, base_dir, "TestMCP", tool_executor=tool_executor
+        )
+        return instances[self.sample_file][0]
+
+    def test_sync_tools_run_concurrently_in_thread_pool(self):
+        """Test that blocking tools no longer serialize on the event loop."""
+        from fastmcp import Client
+
+        pool = ToolThreadPool(max_workers=4)
+        file_mcp = self._create_instance(pool)
+
+        async def call_concurrently():
+            async with Client(file_mcp) as client:
+                start = asyncio.get_running_loop().time()
+                results = await asyncio.gather(
+                    *[client.call_tool("slow_echo", {"text": str(i)}) for i in range(4)]
+                )
+                return results, asyncio.get_running_loop().time() - start
+
+        try:
+            results, elapsed = asyncio.run(call_concurrently())
+        finally:
+            pool.shutdown()
+
+        self.assertEqual([r[0].text for r in results], ["0", "1", "2", "3"])
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(
+            pool.get_stats(),
+            {
+                "max_workers": 4,
+                "queue_depth": 0,
+                "active_threads": 0,
+                "completed": 4,
+                "abandoned": 0,
+            },
+        )
+
+    def test_schema_unchanged_and_async_tools_not_offloaded(self):
+        """Test that offloading keeps schemas and leaves async tools alone."""
+        pool = ToolThreadPool(max_workers=1)
+        try:
+            offloaded = self._create_instance(pool)
+            inline = self._create_instance()
+            offloaded_tools = asyncio.run(offloaded.get_tools())
+            inline_tools = asyncio.run(inline.get_tools())
+        finally:
+            pool.shutdown()
+
+        self.assertEqual(
+            offloaded_tools["slow_echo"].parameters,
+            inline_tools["slow_echo"].parameters,
+        )
+        self.assertIs(offloaded_tools["fast_echo"].fn, inline_tools["fast_echo"].fn)
+
+    def test_stats_endpoint(self):
+        """Test that executor gauges are exposed at the stats path."""
+        from starlette.testclient import TestClient
+
+        app = create_mcp_application(
+            str(self.sample_file), executor="thread", stats_path="/stats"
+        )
+        response = TestClient(app).get("/stats")
+        app.state.tool_executor.shutdown()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["tool_executor"]["thread"]["queue_depth"], 0)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestProcessExecution(unittest.TestCase):
+    """Tests for running tools in the tool process pool."""
+
+    def setUp(self):
+        """Create a module with a process-bound tool and a default tool."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_process_"))
+        self.sample_file = self.temp_dir / "cpu_tools.py"
+        self.sample_file.write_text(
+            '''"""CPU tools."""
+import os
+
+from mcpy_cli.tool_options import tool_options
+
+@tool_options(executor="process")
+def count_primes(limit: int) -> dict:
+    """Count primes below the limit and report the worker pid."""
+    count = sum(
+        1 for n in range(2, limit) if all(n % d for d in range(2, int(n**0.5) + 1))
+    )
+    return {"count": count, "pid": os.getpid()}
+
+def whoami() -> int:
+    """Return the pid of the process running the tool."""
+    return os.getpid()
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _create_instance(self, tool_executor):
+        functions_by_file, base_dir = discover_and_group_functions(
+            str(self.sample_file)
+        )
+        instances = create_mcp_instances(
+            functions_by_file, base_dir, "TestMCP", tool_executor=tool_executor
+        )
+        return instances[self.sample_file][0]
+
+    def _call(self, file_mcp, name, arguments):
+        from fastmcp import Client
+
+        async def call():
+            async with Client(file_mcp) as client:
+                return await client.call_tool(name, arguments)
+
+        return asyncio.run(call())
+
+    def test_tool_options_route_tool_to_process_pool(self):
+        """Test that only the decorated tool runs in a worker process."""
+        executors = ToolExecutors(default="inline", max_workers=1)
+        try:
+            file_mcp = self._create_instance(executors)
+            executors.start()
+            primes = json.loads(
+                self._call(file_mcp, "count_primes", {"limit": 100})[0].text
+            )
+            whoami = int(self._call(file_mcp, "whoami", {})[0].text)
+            stats = executors.get_stats()
+        finally:
+            executors.shutdown(wait=True)
+
+        self.assertEqual(primes["count"], 25)
+        self.assertNotEqual(primes["pid"], os.getpid())
+        self.assertEqual(whoami, os.getpid())
+        self.assertNotIn("thread", stats)
+        self.assertEqual(stats["process"]["completed"], 1)
+        self.assertEqual(stats["process"]["tool_files"], 1)
+
+    def test_global_process_executor_keeps_schema(self):
+        """Test that the global process executor keeps schemas and runs tools remotely."""
+        pool = ToolProcessPool(max_workers=1)
+        try:
+            remote = self._create_instance(pool)
+            inline = self._create_instance(None)
+            remote_tools = asyncio.run(remote.get_tools())
+            inline_tools = asyncio.run(inline.get_tools())
+            whoami = int(self._call(remote, "whoami", {})[0].text)
+        finally:
+            pool.shutdown(wait=True)
+
+        self.assertEqual(
+            remote_tools["count_primes"].parameters,
+            inline_tools["count_primes"].parameters,
+        )
+        self.assertNotEqual(whoami, os.getpid())
+
+    def test_lazy_tools_are_imported_only_by_workers(self):
+        """Test that lazy tools in the process pool are never imported by the server."""
+        functions_by_file, base_dir = discover_and_group_functions_static(
+            str(self.sample_file)
+        )
+        loader = LazyModuleLoader(base_dir=base_dir)
+        executors = ToolExecutors(default="process", max_workers=1, base_dir=base_dir)
+        try:
+            instances = create_lazy_mcp_instances(
+                functions_by_file,
+                base_dir,
+                "TestMCP",
+                loader,
+                tool_executor=executors,
+            )
+            file_mcp = instances[self.sample_file][0]
+            whoami = int(self._call(file_mcp, "whoami", {})[0].text)
+        finally:
+            executors.shutdown(wait=True)
+
+        self.assertNotEqual(whoami, os.getpid())
+        self.assertFalse(loader.is_loaded(self.sample_file))
+
+    def test_call_cancelled_before_it_is_sent_never_runs(self):
+        """Test that a call cancelled while being handed to a worker is not sent."""
+        from mcpy_cli.app_builder.execution import ToolCallKilledError, _ProcessCall
+
+        pool = ToolProcessPool(max_workers=1)
+        call = _ProcessCall((str(self.sample_file), "whoami", (), {}, False))
+        self.assertTrue(call.future.set_running_or_notify_cancel())
+        pool._kill(call)
+        conn = Mock()
+
+        self.assertTrue(pool._run_call(Mock(), conn, call))
+        conn.send.assert_not_called()
+        with self.assertRaises(ToolCallKilledError):
+            call.future.result(timeout=0)
+        self.assertEqual(pool.get_stats()["busy_workers"], 0)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestConcurrencyLimits(unittest.TestCase):
+    """Tests for per-tool concurrency limits and server busy errors."""
+
+    def setUp(self):
+        """Create a module with a limited tool and an unlimited tool."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_limits_"))
+        self.sample_file = self.temp_dir / "limited_tools.py"
+        self.sample_file.write_text(
+            '''"""Limited tools."""
+import asyncio
+
+from mcpy_cli.tool_options import tool_options
+
+@tool_options(max_concurrency=1, max_queue=1)
+async def render(delay: float) -> str:
+    """Render slowly."""
+    await asyncio.sleep(delay)
+    return "done"
+
+async def ping() -> str:
+    """Reply immediately."""
+    return "pong"
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _create_instance(self, tool_limits):
+        functions_by_file, base_dir = discover_and_group_functions(
+            str(self.sample_file)
+        )
+        instances = create_mcp_instances(
+            functions_by_file, base_dir, "TestMCP", tool_limits=tool_limits
+        )
+        return instances[self.sample_file][0]
+
+    def _call_concurrently(self, file_mcp, calls):
+        from fastmcp import Client
+
+        async def run():
+            async with Client(file_mcp) as client:
+
+                async def call(name, arguments):
+                    try:
+                        return (await client.call_tool(name, arguments))[0].text
+                    except Exception as e:
+                        return e
+
+                return await asyncio.gather(
+                    *[call(name, arguments) for name, arguments in calls]
+                )
+
+        return asyncio.run(run())
+
+    def test_overflow_is_rejected_with_server_busy_error(self):
+        """Test that calls beyond the queue get a JSON-RPC server busy error."""
+        from mcp.shared.exceptions import McpError
+
+        tool_limits = ToolLimits(base_dir=self.temp_dir)
+        file_mcp = self._create_instance(tool_limits)
+        results = self._call_concurrently(
+            file_mcp,
+            [("render", {"delay": 0.2})] * 3 + [("ping", {})],
+        )
+
+        self.assertEqual(results[:2], ["done", "done"])
+        self.assertIsInstance(results[2], McpError)
+        self.assertEqual(results[2].error.code, SERVER_BUSY)
+        self.assertEqual(results[2].error.data["reason"], "queue_full")
+        self.assertEqual(results[3], "pong")
+
+        stats = tool_limits.get_stats()
+        self.assertEqual(list(stats), ["limited_tools.py:render"])
+        self.assertEqual(stats["limited_tools.py:render"]["admitted"], 2)
+        self.assertEqual(stats["limited_tools.py:render"]["rejected_queue_full"], 1)
+        self.assertEqual(stats["limited_tools.py:render"]["peak_queue_depth"], 1)
+        self.assertGreater(stats["limited_tools.py:render"]["max_wait_ms"], 100)
+
+    def test_config_file_overrides_decorator(self):
+        """Test that the tool config file overrides the decorator options."""
+        from mcp.shared.exceptions import McpError
+
+        config_path = self.temp_dir / "tools.json"
+        config_path.write_text(
+            '{"defaults": {"max_wait": 0.05}, "tools": {"limited_tools.py:render": {"max_queue": 5}}}'
+        )
+        tool_limits = ToolLimits(ToolOptionsConfig.from_file(config_path), self.temp_dir)
+        file_mcp = self._create_instance(tool_limits)
+        results = self._call_concurrently(file_mcp, [("render", {"delay": 0.3})] * 3)
+
+        self.assertEqual(results[0], "done")
+        for result in results[1:]:
+            self.assertIsInstance(result, McpError)
+            self.assertEqual(result.error.data["reason"], "max_wait_exceeded")
+        stats = tool_limits.get_stats()["limited_tools.py:render"]
+        self.assertEqual(stats["rejected_max_wait"], 2)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["active"], 0)
+
+    def test_limiter_hands_slots_over_in_fifo_order(self):
+        """Test that waiting calls are admitted in arrival order."""
+        limiter = ToolConcurrencyLimiter("tool", max_concurrency=1, max_queue=10)
+        order = []
+
+        async def call(index):
+            await limiter.acquire()
+            order.append(index)
+            await asyncio.sleep(0.01)
+            limiter.release()
+
+        async def run():
+            await asyncio.gather(*[call(index) for index in range(5)])
+
+        asyncio.run(run())
+        self.assertEqual(order, [0, 1, 2, 3, 4])
+        self.assertEqual(limiter.get_stats()["active"], 0)
+
+    def test_invalid_tool_config_is_rejected(self):
+        """Test that invalid options in the tool config file are reported."""
+        config_path = self.temp_dir / "tools.json"
+        config_path.write_text('{"tools": {"render": {"max_concurrency": 0}}}')
+        with self.assertRaises(ValueError):
+            ToolOptionsConfig.from_file(config_path)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestToolTimeouts(unittest.TestCase):
+    """Tests for per-tool timeouts and the release of timed-out calls."""
+
+    def setUp(self):
+        """Create a module with an async, a thread and a process tool."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_timeouts_"))
+        self.sample_file = self.temp_dir / "slow_tools.py"
+        self.sample_file.write_text(
+            '''"""Slow tools."""
+import asyncio
+import os
+import time
+
+from mcpy_cli.tool_options import tool_options
+
+async def wait(delay: float) -> str:
+    """Wait on the event loop."""
+    await asyncio.sleep(delay)
+    return "waited"
+
+@tool_options(executor="thread")
+def block(delay: float) -> str:
+    """Block a thread."""
+    time.sleep(delay)
+    return "blocked"
+
+@tool_options(executor="process", timeout=3.0)
+def crunch(delay: float) -> int:
+    """Occupy a worker process and return its pid."""
+    time.sleep(delay)
+    return os.getpid()
+'''
+        )
+        self.tool_executor = ToolExecutors(base_dir=self.temp_dir)
+
+    def tearDown(self):
+        """Stop the pools and clean up temporary files."""
+        self.tool_executor.shutdown(wait=True)
+        shutil.rmtree(self.temp_dir)
+
+    def _call(self, tool_limits, calls):
+        from fastmcp import Client
+
+        functions_by_file, base_dir = discover_and_group_functions(
+            str(self.sample_file)
+        )
+        file_mcp = create_mcp_instances(
+            functions_by_file,
+            base_dir,
+            "TestMCP",
+            tool_executor=self.tool_executor,
+            tool_limits=tool_limits,
+        )[self.sample_file][0]
+
+        async def run():
+            results = []
+            async with Client(file_mcp) as client:
+                for name, arguments in calls:
+                    try:
+                        results.append(
+                            (await client.call_tool(name, arguments))[0].text
+                        )
+                    except Exception as e:
+                        results.append(e)
+            return results
+
+        return asyncio.run(run())
+
+    def test_async_and_thread_tools_time_out(self):
+        """Test that the global timeout cancels async calls and abandons threads."""
+        from mcp.shared.exceptions import McpError
+
+        tool_limits = ToolLimits(base_dir=self.temp_dir, default_timeout=0.1)
+        results = self._call(
+            tool_limits,
+            [
+                ("wait", {"delay": 5}),
+                ("wait", {"delay": 0}),
+                ("block", {"delay": 0.5}),
+            ],
+        )
+
+        self.assertIsInstance(results[0], McpError)
+        self.assertEqual(results[0].error.code, TOOL_TIMEOUT)
+        self.assertEqual(
+            results[0].error.data, {"tool": "slow_tools.py:wait", "timeout": 0.1}
+        )
+        self.assertEqual(results[1], "waited")
+        self.assertIsInstance(results[2], McpError)
+        self.assertEqual(results[2].error.code, TOOL_TIMEOUT)
+
+        stats = tool_limits.get_stats()
+        self.assertEqual(stats["slow_tools.py:wait"]["calls"], 2)
+        self.assertEqual(stats["slow_tools.py:wait"]["timeouts"], 1)
+        self.assertEqual(stats["slow_tools.py:block"]["timeouts"], 1)
+        self.assertEqual(self.tool_executor.get_stats()["thread"]["abandoned"], 1)
+        # The per-tool timeout wins over the global default
+        self.assertEqual(stats["slow_tools.py:crunch"]["timeout"], 3.0)
+
+    def test_timed_out_process_call_kills_its_worker(self):
+        """Test that a timed-out process call is killed and the pool recovers."""
+        from mcp.shared.exceptions import McpError
+
+        tool_limits = ToolLimits(base_dir=self.temp_dir)
+        results = self._call(
+            tool_limits,
+            [("crunch", {"delay": 0}), ("crunch", {"delay": 30}), ("crunch", {"delay": 0})],
+        )
+
+        # The first call is not cut short by the worker's cold start
+        self.assertIsInstance(results[0], str)
+        self.assertIsInstance(results[1], McpError)
+        self.assertEqual(results[1].error.code, TOOL_TIMEOUT)
+        # The next call runs in a freshly started worker
+        self.assertNotEqual(results[0], results[2])
+        stats = self.tool_executor.get_stats()["process"]
+        self.assertEqual(stats["killed"], 1)
+        self.assertEqual(stats["busy_workers"], 0)
+        self.assertEqual(tool_limits.get_stats()["slow_tools.py:crunch"]["timeouts"], 1)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestBatchCall(unittest.TestCase):
+    """Tests for the batch_call tool of composed applications."""
+
+    def setUp(self):
+        """Create a module with slow and failing tools."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_batch_"))
+        (self.temp_dir / "ops.py").write_text(
+            '''"""Batch test tools."""
+import asyncio
+
+async def slow_double(x: int, delay: float = 0.2) -> int:
+    """Double a number slowly."""
+    await asyncio.sleep(delay)
+    return x * 2
+
+def fail(message: str) -> str:
+    """Always fail."""
+    raise ValueError(message)
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _batch(self, app, calls):
+        from fastmcp import Client
+
+        async def run():
+            async with Client(app.state.fastmcp_instance) as client:
+                start = asyncio.get_running_loop().time()
+                result = await client.call_tool("batch_call", {"calls": calls})
+                return json.loads(result[0].text), (
+                    asyncio.get_running_loop().time() - start
+                )
+
+        return asyncio.run(run())
+
+    def test_batch_runs_calls_concurrently_in_order(self):
+        """Test that items run concurrently and results keep the request order."""
+        app = create_mcp_application(str(self.temp_dir), batch_tool=True)
+        calls = [{"tool": "ops_slow_double", "arguments": {"x": x}} for x in range(8)]
+        calls.insert(3, {"tool": "ops_fail", "arguments": {"message": "boom"}})
+        calls.append({"tool": "missing", "arguments": {}})
+
+        results, elapsed = self._batch(app, calls)
+
+        self.assertEqual(len(results), 10)
+        doubled = [r["content"][0]["text"] for r in results if r["ok"]]
+        self.assertEqual(doubled, [str(x * 2) for x in range(8)])
+        self.assertFalse(results[3]["ok"])
+        self.assertIn("Error calling tool", results[3]["error"]["message"])
+        self.assertFalse(results[9]["ok"])
+        # 8 calls of 0.2s with the default fan-out of 8 take one round
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(
+            app.state.batch_caller.get_stats(),
+            {
+                "max_concurrency": 8,
+                "max_batch_size": 100,
+                "batches": 1,
+                "calls": 10,
+                "errors": 2,
+            },
+        )
+
+    def test_fan_out_limit_and_protocol_errors(self):
+        """Test the fan-out limit and that timeouts keep their JSON-RPC code."""
+        app = create_mcp_application(
+            str(self.temp_dir), batch_tool=True, batch_concurrency=2, tool_timeout=0.5
+        )
+        calls = [
+            {"tool": "ops_slow_double", "arguments": {"x": x, "delay": 0.2}}
+            for x in range(4)
+        ]
+        calls.append({"tool": "ops_slow_double", "arguments": {"x": 0, "delay": 5}})
+
+        results, elapsed = self._batch(app, calls)
+
+        self.assertTrue(all(r["ok"] for r in results[:4]))
+        self.assertGreater(elapsed, 0.4)
+        self.assertEqual(results[4]["error"]["code"], TOOL_TIMEOUT)
+
+    def test_batch_tool_is_opt_in(self):
+        """Test that the batch_call tool is only registered when enabled."""
+        app = create_mcp_application(str(self.temp_dir))
+        tools = asyncio.run(app.state.fastmcp_instance.get_tools())
+        self.assertNotIn("batch_call", tools)
+        self.assertIsNone(getattr(app.state, "batch_caller", None))
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestCallCoalescing(unittest.TestCase):
+    """Tests for coalescing identical concurrent tool calls."""
+
+    def setUp(self):
+        self.executions = 0
+
+    async def _lookup(self, key: str) -> str:
+        self.executions += 1
+        execution = self.executions
+        await asyncio.sleep(0.05)
+        if key == "bad":
+            raise KeyError(key)
+        return f"value-{key}-{execution}"
+
+    def _run_calls(self, coalescer, scope, calls):
+        """Run (session id, key) calls concurrently, returning results or exceptions."""
+
+        async def call(session_id, key):
+            set_current_session_id(session_id)
+            try:
+                return await coalescer.call(
+                    "tools.py:lookup", scope, self._lookup, (), {"key": key}
+                )
+            except Exception as e:
+                return e
+
+        async def run():
+            return await asyncio.gather(*[call(*c) for c in calls])
+
+        return asyncio.run(run())
+
+    def test_global_scope_shares_result_and_exception(self):
+        """Test that identical calls across sessions share one execution."""
+        coalescer = ToolCallCoalescer()
+        results = self._run_calls(
+            coalescer,
+            "global",
+            [(f"s{i}", "a") for i in range(10)] + [("s0", "bad"), ("s1", "bad")],
+        )
+
+        self.assertEqual(set(results[:10]), {"value-a-1"})
+        self.assertIsInstance(results[10], KeyError)
+        self.assertIs(results[10], results[11])
+        self.assertEqual(self.executions, 2)
+        stats = coalescer.get_stats()
+        self.assertEqual(stats["calls"], 12)
+        self.assertEqual(stats["executions"], 2)
+        self.assertEqual(stats["hits"], 10)
+        self.assertEqual(stats["merged_executions"], 2)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_session_scope_keeps_sessions_apart(self):
+        """Test that session-scoped coalescing only merges calls of one session."""
+        coalescer = ToolCallCoalescer()
+        results = self._run_calls(
+            coalescer, "session", [("s1", "a")] * 3 + [("s2", "a")] * 3
+        )
+
+        self.assertEqual(len(set(results[:3])), 1)
+        self.assertEqual(len(set(results[3:])), 1)
+        self.assertNotEqual(results[0], results[3])
+        self.assertEqual(coalescer.get_stats()["executions"], 2)
+
+        # Calls after the execution finished run the tool again
+        self._run_calls(coalescer, "session", [("s1", "a")])
+        self.assertEqual(self.executions, 3)
+
+    def test_cancelled_waiter_does_not_cancel_execution(self):
+        """Test that the shared execution survives until every waiter is cancelled."""
+        coalescer = ToolCallCoalescer()
+
+        async def run():
+            first = asyncio.ensure_future(
+                coalescer.call("t", "global", self._lookup, (), {"key": "a"})
+            )
+            second = asyncio.ensure_future(
+                coalescer.call("t", "global", self._lookup, (), {"key": "a"})
+            )
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(run()), "value-a-1")
+        self.assertEqual(coalescer.get_stats()["in_flight"], 0)
+
+    def test_call_after_last_waiter_cancelled_runs_again(self):
+        """Test that a call arriving as the execution is cancelled does not join it."""
+        coalescer = ToolCallCoalescer()
+
+        async def run():
+            first = asyncio.ensure_future(
+                coalescer.call("t", "global", self._lookup, (), {"key": "a"})
+            )
+            await asyncio.sleep(0.01)
+            first.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            return await coalescer.call("t", "global", self._lookup, (), {"key": "a"})
+
+        self.assertEqual(asyncio.run(run()), "value-a-2")
+        self.assertEqual(coalescer.get_stats()["executions"], 2)
+
+    def test_tool_option_enables_coalescing(self):
+        """Test that the coalesce option wraps the tool through ToolLimits."""
+        tool_limits = ToolLimits()
+        wrapped = tool_limits.wrap_tool(
+            self._lookup, "lookup", pathlib.Path("tools.py"), {"coalesce": "global"}
+        )
+
+        async def run():
+            return await asyncio.gather(*[wrapped(key="a") for _ in range(5)])
+
+        self.assertEqual(asyncio.run(run()), ["value-a-1"] * 5)
+        stats = tool_limits.coalescer.get_stats()
+        self.assertEqual(stats["tools"]["tools.py:lookup"]["hits"], 4)
+        with self.assertRaises(ValueError):
+            ToolOptionsConfig(tools={"lookup": {"coalesce": "always"}})
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestPureToolCache(unittest.TestCase):
+    """Tests for caching results of pure tools across sessions."""
+
+    def setUp(self):
+        self.executions = 0
+
+    def _lookup(self, key: str) -> str:
+        self.executions += 1
+        return f"value-{key}-{self.executions}"
+
+    def test_results_shared_across_sessions(self):
+        """Test that a pure tool from the tool config runs once for all sessions."""
+        from mcpy_cli.app_builder.result_cache import ToolResultCache
+
+        tool_limits = ToolLimits(
+            ToolOptionsConfig(tools={"lookup": {"pure": True}}),
+            result_cache=ToolResultCache(),
+        )
+        file_path = pathlib.Path("tools.py")
+        options = tool_limits.options_for(self._lookup, "lookup", file_path)
+        wrapped = tool_limits.wrap_tool(self._lookup, "lookup", file_path, options)
+
+        async def call(session_id, key):
+            set_current_session_id(session_id)
+            return await wrapped(key=key)
+
+        async def run():
+            first = await call("s0", "a")
+            rest = await asyncio.gather(*(call(f"s{i}", "a") for i in range(1, 200)))
+            return [first, *rest, await call("s0", "b")]
+
+        results = asyncio.run(run())
+        self.assertEqual(set(results[:200]), {"value-a-1"})
+        self.assertEqual(results[200], "value-b-2")
+        self.assertEqual(self.executions, 2)
+        stats = tool_limits.result_cache.get_stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["tools"]["tools.py:lookup"]["calls"], 201)
+        self.assertAlmostEqual(
+            stats["tools"]["tools.py:lookup"]["hit_ratio"], 199 / 201
+        )
+
+    def test_ttl_and_bounds(self):
+        """Test per-tool TTLs override the default and entries stay bounded."""
+        from mcpy_cli.app_builder.result_cache import ToolResultCache
+
+        cache = ToolResultCache(max_entries=2, ttl=100)
+        short = cache.wrap_tool(self._lookup, "tools.py:short", ttl=10)
+        default = cache.wrap_tool(self._lookup, "tools.py:default")
+
+        async def run(now, tool, key):
+            with patch("mcpy_cli.app_builder.caching.time.monotonic", return_value=now):
+                return await tool(key=key)
+
+        self.assertEqual(asyncio.run(run(0, short, "a")), "value-a-1")
+        self.assertEqual(asyncio.run(run(0, default, "a")), "value-a-2")
+        self.assertEqual(asyncio.run(run(50, default, "a")), "value-a-2")
+        self.assertEqual(asyncio.run(run(50, short, "a")), "value-a-3")
+        asyncio.run(run(60, default, "b"))
+        stats = cache.get_stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual((stats["evictions"], stats["expirations"]), (1, 1))
+
+        with self.assertRaises(ValueError):
+            ToolOptionsConfig(tools={"lookup": {"pure": "yes"}})
+
+    def test_lazy_tool_decorator_read_from_source(self):
+        """Test that a literal pure decorator applies to lazy tools before import."""
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_pure_"))
+        self.addCleanup(shutil.rmtree, temp_dir)
+        tool_file = temp_dir / "rates.py"
+        tool_file.write_text(
+            '''"""Pure lazy tool."""
+from mcpy_cli.tool_options import tool_options
+
+CALLS = []
+
+@tool_options(pure=True, cache_ttl=60)
+def rate(currency: str) -> float:
+    """Look up an exchange rate."""
+    CALLS.append(currency)
+    return 1.5
+'''
+        )
+        functions_by_file, base_dir = discover_and_group_functions_static(
+            str(tool_file)
+        )
+        self.assertEqual(
+            functions_by_file[tool_file][0].options, {"pure": True, "cache_ttl": 60}
+        )
+        tool_limits = ToolLimits(base_dir=base_dir)
+        loader = LazyModuleLoader()
+        instances = create_lazy_mcp_instances(
+            functions_by_file, base_dir, "TestMCP", loader, tool_limits=tool_limits
+        )
+
+        from fastmcp import Client
+
+        async def call():
+            async with Client(instances[tool_file][0]) as client:
+                for _ in range(3):
+                    await client.call_tool("rate", {"currency": "EUR"})
+
+        asyncio.run(call())
+        self.assertEqual(loader.load(tool_file).module.CALLS, ["EUR"])
+        stats = tool_limits.result_cache.get_stats()
+        self.assertEqual(stats["tools"]["rates.py:rate"]["hits"], 2)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestMicroBatching(unittest.TestCase):
+    """Tests for micro-batching of batchable tools."""
+
+    def setUp(self):
+        """Create a module with a batchable tool."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_batching_"))
+        self.sample_file = self.temp_dir / "vector_tools.py"
+        self.sample_file.write_text(
+            '''"""Vectorized tools."""
+from typing import List
+
+from mcpy_cli.tool_options import tool_options
+
+@tool_options(batch_size=4, batch_wait=0.05)
+def scale(x: List[int], factor: List[int]) -> List[str]:
+    """Scale numbers, reporting the size of the batch they ran in."""
+    if 13 in x:
+        raise ValueError("unlucky")
+    return [f"{value * f}/{len(x)}" for value, f in zip(x, factor)]
+
+@tool_options(batch_size=4)
+def not_batchable(x: int) -> int:
+    """Has no list parameters."""
+    return x
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _create_instance(self, tool_limits, tool_executor=None):
+        functions_by_file, base_dir = discover_and_group_functions(
+            str(self.sample_file)
+        )
+        return create_mcp_instances(
+            functions_by_file,
+            base_dir,
+            "TestMCP",
+            tool_executor=tool_executor,
+            tool_limits=tool_limits,
+        )[self.sample_file][0]
+
+    def _call_concurrently(self, file_mcp, calls):
+        from fastmcp import Client
+
+        async def run():
+            async with Client(file_mcp) as client:
+
+                async def call(name, arguments):
+                    try:
+                        return (await client.call_tool(name, arguments))[0].text
+                    except Exception as e:
+                        return e
+
+                return await asyncio.gather(
+                    *[call(name, arguments) for name, arguments in calls]
+                )
+
+        return asyncio.run(run())
+
+    def test_calls_are_batched_and_scattered(self):
+        """Test that concurrent calls run in batches and get their own results."""
+        tool_limits = ToolLimits(base_dir=self.temp_dir)
+        file_mcp = self._create_instance(tool_limits)
+        tools = asyncio.run(file_mcp.get_tools())
+        self.assertEqual(tools["scale"].parameters["properties"]["x"]["type"], "integer")
+
+        results = self._call_concurrently(
+            file_mcp, [("scale", {"x": x, "factor": 10}) for x in range(10)]
+        )
+
+        self.assertEqual(
+            results, [f"{x * 10}/{4 if x < 8 else 2}" for x in range(10)]
+        )
+        stats = tool_limits.get_stats()["vector_tools.py:scale"]["batching"]
+        self.assertEqual(stats["batches"], 3)
+        self.assertEqual(stats["items"], 10)
+        self.assertEqual(
+            stats["batch_size"]["buckets"], {"1": 0, "2": 1, "4": 2, "+Inf": 0}
+        )
+        self.assertEqual(stats["fill"]["buckets"]["1"], 2)
+        self.assertEqual(stats["wait_ms"]["count"], 10)
+        self.assertNotIn("vector_tools.py:not_batchable", tool_limits.get_stats())
+
+    def test_batch_failure_fails_every_call_of_the_batch(self):
+        """Test that an exception in a batch is reported to all of its callers."""
+        tool_limits = ToolLimits(base_dir=self.temp_dir)
+        tool_executor = ToolExecutors("thread")
+        file_mcp = self._create_instance(tool_limits, tool_executor)
+        try:
+            results = self._call_concurrently(
+                file_mcp,
+                [("scale", {"x": x, "factor": 1}) for x in (1, 13, 2)],
+            )
+        finally:
+            tool_executor.shutdown()
+
+        self.assertTrue(all(isinstance(result, Exception) for result in results))
+        stats = tool_limits.get_stats()["vector_tools.py:scale"]["batching"]
+        self.assertEqual(stats["failed_batches"], 1)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestStreamingTools(unittest.TestCase):
+    """Tests for generator tools that stream their chunks."""
+
+    def setUp(self):
+        """Create a module with generator and async generator tools."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_streaming_"))
+        self.sample_file = self.temp_dir / "stream_tools.py"
+        self.sample_file.write_text(
+            '''"""Streaming tools."""
+import asyncio
+from typing import AsyncIterator, Dict, Iterator
+
+def count_up(n: int) -> Iterator[str]:
+    """Yield the numbers up to n."""
+    for i in range(n):
+        yield f"line {i}"
+
+async def ticks(n: int) -> AsyncIterator[Dict[str, int]]:
+    """Yield n ticks."""
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield {"tick": i}
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _create_instance(self, tool_executor=None, lazy=False):
+        if lazy:
+            functions_by_file, base_dir = discover_and_group_functions_static(
+                str(self.sample_file)
+            )
+            instances = create_lazy_mcp_instances(
+                functions_by_file,
+                base_dir,
+                "TestMCP",
+                LazyModuleLoader(),
+                tool_executor=tool_executor,
+            )
+        else:
+            functions_by_file, base_dir = discover_and_group_functions(
+                str(self.sample_file)
+            )
+            instances = create_mcp_instances(
+                functions_by_file, base_dir, "TestMCP", tool_executor=tool_executor
+            )
+        return instances[self.sample_file][0]
+
+    def _call_with_progress(self, file_mcp, name, arguments):
+        from fastmcp import Client
+
+        messages = []
+
+        async def on_progress(progress, total, message):
+            messages.append((progress, message))
+
+        async def run():
+            async with Client(file_mcp) as client:
+                result = await client.call_tool(
+                    name, arguments, progress_handler=on_progress
+                )
+                return result[0].text
+
+        return asyncio.run(run()), messages
+
+    def test_generator_chunks_are_sent_as_progress(self):
+        """Test that sync and async generator chunks arrive as progress messages."""
+        tool_executor = ToolExecutors("thread")
+        file_mcp = self._create_instance(tool_executor)
+        try:
+            result, messages = self._call_with_progress(file_mcp, "count_up", {"n": 3})
+            self.assertEqual(messages, [(1, "line 0"), (2, "line 1"), (3, "line 2")])
+            self.assertEqual(json.loads(result), {"streamed_chunks": 3})
+
+            result, messages = self._call_with_progress(file_mcp, "ticks", {"n": 2})
+            self.assertEqual(messages, [(1, '{"tick":0}'), (2, '{"tick":1}')])
+        finally:
+            tool_executor.shutdown()
+
+    def test_chunks_are_collected_without_progress_token(self):
+        """Test that chunks are returned together when they cannot be streamed."""
+        file_mcp = self._create_instance()
+        contents = asyncio.run(file_mcp._mcp_call_tool("count_up", {"n": 2}))
+        self.assertEqual(json.loads(contents[0].text), ["line 0", "line 1"])
+
+    def test_lazy_generator_tool_streams(self):
+        """Test that lazily loaded generator tools stream as well."""
+        file_mcp = self._create_instance(lazy=True)
+        result, messages = self._call_with_progress(file_mcp, "count_up", {"n": 2})
+        self.assertEqual([message for _, message in messages], ["line 0", "line 1"])
+
+    def test_lazy_generator_tool_with_process_pool(self):
+        """Test that lazy generator tools stay in-process with a process pool."""
+        functions_by_file, _ = discover_and_group_functions_static(
+            str(self.sample_file)
+        )
+        self.assertEqual(
+            [info.streaming for info in functions_by_file[self.sample_file]],
+            [True, True],
+        )
+        tool_executor = ToolExecutors(
+            default="process", max_workers=1, base_dir=self.temp_dir
+        )
+        try:
+            file_mcp = self._create_instance(tool_executor, lazy=True)
+            result, messages = self._call_with_progress(file_mcp, "count_up", {"n": 2})
+            self.assertEqual([message for _, message in messages], ["line 0", "line 1"])
+            result, messages = self._call_with_progress(file_mcp, "ticks", {"n": 2})
+            self.assertEqual(len(messages), 2)
+        finally:
+            tool_executor.shutdown(wait=True)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestSerialization(unittest.TestCase):
+    """Tests for the JSON serializers of tool results and stored events."""
+
+    def test_serializers_agree(self):
+        """Test that every serializer produces the same compact JSON."""
+        import datetime
+        import uuid
+
+        from pydantic import BaseModel
+
+        from mcpy_cli.utils.serialization import SERIALIZER_CHOICES, get_serializer
+
+        class Point(BaseModel):
+            x: int
+            y: int
+
+        value = {
+            "points": [Point(x=1, y=2)],
+            "when": datetime.date(2024, 1, 2),
+            "id": uuid.UUID(int=1),
+            "tags": {"a"},
+            "big": 2**70,
+            3: "int key",
+        }
+        expected = (
+            '{"points":[{"x":1,"y":2}],"when":"2024-01-02",'
+            '"id":"00000000-0000-0000-0000-000000000001","tags":["a"],'
+            '"big":1180591620717411303424,"3":"int key"}'
+        )
+        for name in SERIALIZER_CHOICES:
+            try:
+                serializer = get_serializer(name)
+            except ImportError:
+                continue
+            self.assertEqual(serializer.dumps(value), expected, name)
+            self.assertEqual(serializer.loads(expected)["big"], 2**70, name)
+        with self.assertRaises(ValueError):
+            get_serializer("yaml")
+
+    def test_serializer_option_selects_serializer(self):
+        """Test that the serializer option of the application selects the encoder."""
+        from mcpy_cli.utils import serialization
+
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_serialization_"))
+        previous = serialization._serializer
+        try:
+            tool_file = temp_dir / "tools.py"
+            tool_file.write_text(
+                'def ping() -> str:\n    """Ping."""\n    return "pong"\n'
+            )
+            create_mcp_application(str(tool_file), serializer="json")
+            self.assertEqual(serialization._serializer.name, "json")
+            self.assertEqual(serialization.dumps({"a": [1, "ü"]}), '{"a":[1,"ü"]}')
+            with self.assertRaises(TransformationError):
+                create_mcp_application(str(tool_file), serializer="yaml")
+        finally:
+            serialization._serializer = previous
+            shutil.rmtree(temp_dir)
+
+    def test_tool_results_are_compact(self):
+        """Test that tool results of created instances are serialized compactly."""
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_serialization_"))
+        try:
+            sample_file = temp_dir / "result_tools.py"
+            sample_file.write_text(
+                '''"""Tools with structured results."""
+from typing import Dict, List
+
+def rows(n: int) -> List[Dict[str, int]]:
+    """Return n rows."""
+    return [{"id": i, "value": i * i} for i in range(n)]
+'''
+            )
+            functions_by_file, base_dir = discover_and_group_functions(
+                str(sample_file)
+            )
+            instances = create_mcp_instances(functions_by_file, base_dir, "TestMCP")
+            file_mcp = instances[sample_file][0]
+            contents = asyncio.run(file_mcp._mcp_call_tool("rows", {"n": 2}))
+            self.assertEqual(
+                contents[0].text, '[{"id":0,"value":0},{"id":1,"value":1}]'
+            )
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_event_store_round_trip(self):
+        """Test that stored JSON-RPC messages are replayed unchanged."""
+        from mcp.types import JSONRPCMessage, JSONRPCResponse
+
+        from mcpy_cli.mcp_event_store import SQLiteEventStore
+
+        temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_serialization_"))
+        try:
+            store = SQLiteEventStore(temp_dir / "events.db")
+            message = JSONRPCMessage(
+                JSONRPCResponse(jsonrpc="2.0", id=1, result={"content": ["ü", 1.5]})
+            )
+            replayed = []
+
+            async def run():
+                first = await store.store_event("stream", message)
+                await store.store_event("stream", message)
+                return await store.replay_events_after(first, replayed.append)
+
+            self.assertEqual(asyncio.run(run()), "stream")
+            self.assertEqual(len(replayed), 1)
+            self.assertEqual(replayed[0].message, message.model_dump())
+            store.close()
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestModuleLifecycle(unittest.TestCase):
+    """Tests for module startup/shutdown hooks and tool warm-up."""
+
+    def setUp(self):
+        """Create modules with sync and async lifecycle hooks."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_lifecycle_"))
+        self.alpha_file = self.temp_dir / "alpha.py"
+        self.alpha_file.write_text(
+            '''"""Module with sync startup and async shutdown hooks."""
+import time
+from mcpy_cli.tool_options import tool_options
+
+EVENTS = []
+
+def mcp_startup():
+    time.sleep(0.3)
+    EVENTS.append("started")
+
+async def mcp_shutdown():
+    EVENTS.append("stopped")
+
+@tool_options(warmup={"x": 2})
+def double(x: int) -> int:
+    """Double a number."""
+    EVENTS.append(f"double {x}")
+    return x * 2
+'''
+        )
+        self.beta_file = self.temp_dir / "beta.py"
+        self.beta_file.write_text(
+            '''"""Module with an async startup hook."""
+import asyncio
+
+EVENTS = []
+
+async def mcp_startup():
+    await asyncio.sleep(0.3)
+    EVENTS.append("started")
+
+def mcp_shutdown():
+    EVENTS.append("stopped")
+
+def echo(text: str) -> str:
+    """Echo a text."""
+    return text
+'''
+        )
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir)
+
+    def _events(self, file_path):
+        from mcpy_cli.discovery import module_registry
+
+        return module_registry.get(file_path).EVENTS
+
+    def test_hooks_run_concurrently_in_lifespan(self):
+        """Test that hooks run once per module, concurrently, with warm-up calls."""
+        import time
+
+        from starlette.testclient import TestClient
+
+        app = create_mcp_application(str(self.temp_dir))
+        tools = asyncio.run(app.state.fastmcp_instance.get_tools())
+        self.assertEqual(sorted(tools), ["alpha_double", "beta_echo"])
+
+        start = time.perf_counter()
+        with TestClient(app):
+            elapsed = time.perf_counter() - start
+            self.assertEqual(self._events(self.alpha_file), ["started", "double 2"])
+            self.assertEqual(self._events(self.beta_file), ["started"])
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(self._events(self.alpha_file)[-1], "stopped")
+        self.assertEqual(self._events(self.beta_file)[-1], "stopped")
+
+        stats = app.state.module_lifecycle.get_stats()
+        self.assertEqual(stats["started_modules"], 0)
+        self.assertTrue(stats["modules"]["alpha.py"]["started"])
+        self.assertEqual(stats["warmups"]["alpha.py:double"]["calls"], 1)
+        self.assertEqual(stats["warmups"]["alpha.py:double"]["failures"], 0)
+
+    def test_failed_startup_and_lazy_modules(self):
+        """Test that a failing hook is isolated and lazy modules with hooks load early."""
+        self.beta_file.write_text(
+            '''"""Module whose startup fails."""
+EVENTS = []
+
+def mcp_startup():
+    raise RuntimeError("no model")
+
+def mcp_shutdown():
+    EVENTS.append("stopped")
+
+def echo(text: str) -> str:
+    return text
+'''
+        )
+        (self.temp_dir / "gamma.py").write_text(
+            "def plain(x: int) -> int:\n    return x\n"
+        )
+        app = create_mcp_application(str(self.temp_dir), lazy_tools=True)
+        lifecycle = app.state.module_lifecycle
+        loader = app.state.lazy_loader
+
+        async def run():
+            await lifecycle.startup()
+            loaded = {
+                path.name: loader.is_loaded(path)
+                for path in (self.alpha_file, self.beta_file, self.temp_dir / "gamma.py")
+            }
+            await lifecycle.shutdown()
+            return loaded
+
+        loaded = asyncio.run(run())
+        self.assertEqual(loaded, {"alpha.py": True, "beta.py": True, "gamma.py": False})
+        self.assertEqual(
+            self._events(self.alpha_file), ["started", "double 2", "stopped"]
+        )
+        self.assertEqual(self._events(self.beta_file), [])
+        modules = lifecycle.get_stats()["modules"]
+        self.assertFalse(modules["beta.py"]["started"])
+        self.assertIn("no model", modules["beta.py"]["error"])
+
+    def test_hot_reload_restarts_module(self):
+        """Test that a reloaded module stops its old version and starts the new one."""
+        app = create_mcp_application(str(self.temp_dir), hot_reload=True)
+        lifecycle = app.state.module_lifecycle
+        reloader = app.state.hot_reloader
+
+        async def run():
+            await lifecycle.startup()
+            old_events = self._events(self.beta_file)
+            self.beta_file.write_text(
+                self.beta_file.read_text().replace("await asyncio.sleep(0.3)", "pass")
+            )
+            await reloader.apply_changes({self.beta_file})
+            new_events = self._events(self.beta_file)
+            await lifecycle.shutdown()
+            return old_events, new_events
+
+        old_events, new_events = asyncio.run(run())
+        self.assertEqual(old_events, ["started", "stopped"])
+        self.assertEqual(new_events, ["started", "stopped"])
+
+    def test_process_pool_workers_run_hooks(self):
+        """Test that worker processes start the modules whose tools they run."""
+        self.alpha_file.write_text(
+            '''"""Module served by the process pool."""
+import os
+from mcpy_cli.tool_options import tool_options
+
+STARTED_IN = None
+
+def mcp_startup():
+    global STARTED_IN
+    STARTED_IN = os.getpid()
+
+@tool_options(executor="process")
+def started_in() -> int:
+    """Return the process that ran the startup hook."""
+    return STARTED_IN
+'''
+        )
+        self.beta_file.unlink()
+        app = create_mcp_application(str(self.temp_dir), executor_workers=1)
+        lifecycle = app.state.module_lifecycle
+        executor = app.state.tool_executor
+
+        async def run():
+            executor.start()
+            try:
+                await lifecycle.startup()
+                tools = await app.state.fastmcp_instance.get_tools()
+                contents = await tools["alpha_started_in"].run({})
+                await lifecycle.shutdown()
+                return int(contents[0].text)
+            finally:
+                executor.shutdown()
+
+        started_in = asyncio.run(run())
+        self.assertNotEqual(started_in, os.getpid())
+        from mcpy_cli.discovery import module_registry
+
+        self.assertIsNone(module_registry.get(self.alpha_file).STARTED_IN)
+        self.assertEqual(lifecycle.get_stats()["modules"], {})
+
+
+
+def _fill_sqlite_cache(db_path: str, worker: int) -> int:
+    """Cache results from another process and return its pid."""
+    from mcpy_cli.app_builder.sqlite_cache import SQLiteResultStore
+
+    store = SQLiteResultStore(db_path, "shared")
+    for i in range(50):
+        store.set(f"worker-{worker}", str(i), {"worker": worker, "i": i})
+    store.close()
+    return os.getpid()
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestSQLiteCacheBackend(unittest.TestCase):
+    """Tests for the SQLite cache backend shared by worker processes."""
+
+    def setUp(self):
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_sqlite_cache_"))
+        self.db_path = self.temp_dir / "cache.db"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _store(self, **kwargs):
+        from mcpy_cli.app_builder.caching import create_result_store
+
+        store = create_result_store("sqlite", "pure", self.db_path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_bounds_ttl_and_persistence(self):
+        """Test eviction, wall-clock expiry and results surviving a restart."""
+        store = self._store(max_entries=3, max_entries_per_group=2, max_bytes=None)
+        with patch("mcpy_cli.app_builder.sqlite_cache.time.time", return_value=0):
+            store.set("a", "1", {"value": 1})
+            store.set("a", "2", 2)
+            store.set("a", "3", (3, b"bytes"))
+            store.set("b", "1", "one", ttl=10)
+            store.set("b", "2", "two")
+        self.assertIsNone(store.get("a", "1"))
+        self.assertIsNone(store.get("a", "2"))
+        self.assertEqual(store.get("a", "3"), (3, b"bytes"))
+        stats = store.get_stats()
+        self.assertEqual((stats["entries"], stats["groups"]), (3, 2))
+        self.assertEqual(stats["evictions"], 2)
+
+        reopened = self._store(max_entries=3, max_entries_per_group=2, max_bytes=None)
+        self.assertEqual(reopened.get("b", "2"), "two")
+        with patch("mcpy_cli.app_builder.sqlite_cache.time.time", return_value=20):
+            reopened.compact()
+        self.assertEqual(reopened.expirations, 1)
+        self.assertEqual(reopened.get_stats()["entries"], 2)
+
+        reopened.clear_group("a")
+        self.assertEqual(reopened.get_stats()["entries"], 1)
+        self.assertFalse(reopened.set("a", "lock", threading.Lock()))
+
+    def test_byte_budget(self):
+        """Test that the byte budget evicts least recently used results."""
+        store = self._store(max_entries=None, max_bytes=2000)
+        for i in range(5):
+            self.assertTrue(store.set("g", str(i), "x" * 600))
+        self.assertFalse(store.set("g", "big", "x" * 3000))
+        stats = store.get_stats()
+        self.assertLessEqual(stats["bytes"], 2000)
+        self.assertEqual(stats["entries"], 3)
+        self.assertEqual(stats["oversized"], 1)
+        self.assertIsNotNone(store.get("g", "4"))
+
+    def test_shared_across_processes(self):
+        """Test that worker processes write to and read from one database."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            pids = list(
+                pool.map(_fill_sqlite_cache, [str(self.db_path)] * 4, range(4))
+            )
+        self.assertNotIn(os.getpid(), pids)
+
+        from mcpy_cli.app_builder.sqlite_cache import SQLiteResultStore
+
+        store = SQLiteResultStore(self.db_path, "shared")
+        self.addCleanup(store.close)
+        self.assertEqual(store.get_stats()["entries"], 200)
+        self.assertEqual(store.get("worker-3", "49"), {"worker": 3, "i": 49})
+        # Namespaces sharing the file are kept apart
+        self.assertEqual(self._store().get_stats()["entries"], 0)
+
+    def test_compactor_and_session_cache(self):
+        """Test the background compactor and a session cache on SQLite."""
+        from mcpy_cli.app_builder.caching import ResultStoreCompactor
+
+        store = self._store(ttl=0.05)
+        session_cache = SessionToolCallCache(store=store)
+        session_cache.set("s1", "tool", {"x": 1}, {"when": {1, 2}})
+        self.assertEqual(session_cache.get("s1", "tool", {"x": 1}), {"when": {1, 2}})
+
+        compactor = ResultStoreCompactor([store], interval=0.05)
+        compactor.start()
+        try:
+            deadline = time.monotonic() + 5
+            while store.get_stats()["entries"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            compactor.shutdown()
+        self.assertEqual(store.get_stats()["entries"], 0)
+        self.assertGreater(compactor.compactions, 0)
+
+    def test_store_calls_run_off_the_event_loop(self):
+        """Test blocking stores are used from worker threads, in-memory ones inline."""
+        from mcpy_cli.app_builder.result_cache import ToolResultCache
+
+        for store, blocking in ((self._store(), True), (None, False)):
+            cache = ToolResultCache(store=store)
+            threads = []
+            get, set_ = cache.store.get, cache.store.set
+
+            def record_get(*args, get=get):
+                threads.append(threading.current_thread())
+                return get(*args)
+
+            def record_set(*args, set_=set_):
+                threads.append(threading.current_thread())
+                return set_(*args)
+
+            with patch.object(cache.store, "get", record_get), patch.object(
+                cache.store, "set", record_set
+            ):
+                wrapped = cache.wrap_tool(lambda key: f"value-{key}", "tools.py:tool")
+
+                async def run():
+                    return [await wrapped(key="a"), await wrapped(key="a")], (
+                        threading.current_thread()
+                    )
+
+                results, loop_thread = asyncio.run(run())
+            self.assertEqual(results, ["value-a", "value-a"])
+            self.assertEqual(len(threads), 3)
+            with self.subTest(blocking=blocking):
+                for thread in threads:
+                    if blocking:
+                        self.assertIsNot(thread, loop_thread)
+                    else:
+                        self.assertIs(thread, loop_thread)
+
+    def test_results_of_changed_code_not_served_after_restart(self):
+        """Test that a pure tool's persistent results are keyed by its source."""
+        from mcpy_cli.app_builder.result_cache import ToolResultCache
+
+        tool_file = self.temp_dir / "rates.py"
+        calls = []
+
+        def start_server(rate: float):
+            tool_file.write_text(f"def rate(currency: str) -> float:\n    return {rate}\n")
+
+            def rate_tool(currency: str) -> float:
+                calls.append(currency)
+                return rate
+
+            tool_limits = ToolLimits(
+                ToolOptionsConfig(tools={"rate": {"pure": True}}),
+                base_dir=self.temp_dir,
+                result_cache=ToolResultCache(store=self._store()),
+            )
+            options = tool_limits.options_for(rate_tool, "rate", tool_file)
+            return tool_limits.wrap_tool(rate_tool, "rate", tool_file, options)
+
+        self.assertEqual(asyncio.run(start_server(1.5)(currency="EUR")), 1.5)
+        self.assertEqual(asyncio.run(start_server(1.5)(currency="EUR")), 1.5)
+        self.assertEqual(calls, ["EUR"])
+        self.assertEqual(asyncio.run(start_server(2.5)(currency="EUR")), 2.5)
+        self.assertEqual(calls, ["EUR", "EUR"])
+
+    def test_application_uses_backend(self):
+        """Test that the application creates SQLite caches and rejects bad backends."""
+        tool_file = self.temp_dir / "tools.py"
+        tool_file.write_text(
+            '''def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+'''
+        )
+        app = create_mcp_application(
+            str(tool_file),
+            json_response=True,
+            cache_backend="sqlite",
+            cache_path=str(self.db_path),
+        )
+        self.addCleanup(app.state.cache_compactor.shutdown)
+        self.assertEqual(app.state.tool_result_cache.store.backend, "sqlite")
+        self.assertEqual(app.state.tool_call_cache.store.backend, "sqlite")
+        self.assertTrue(self.db_path.exists())
+
+        with self.assertRaises(TransformationError):
+            create_mcp_application(str(tool_file), cache_backend="redis")
+
 
 if __name__ == "__main__":
     unittest.main()
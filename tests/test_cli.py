@@ -4,6 +4,7 @@ import sys
 import tempfile
 import pathlib
 import shutil
+import json
 from typer.testing import CliRunner
 
 # Ensure the src directory is discoverable for imports
@@ -52,6 +53,29 @@ def greet_user(name: str) -> str:
         self.assertEqual(result.exit_code, 0)
         self.assertIn("Usage:", result.output)
 
+    def test_profile_startup_json(self):
+        """Test that profile-startup reports phases, RSS and per-file imports."""
+        result = self.runner.invoke(
+            cli_app,
+            [
+                "--source-path",
+                str(self.temp_dir),
+                "profile-startup",
+                "--json-output",
+                "-",
+            ],
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        report = json.loads(result.output[result.output.index("{") :])
+        phases = {phase["phase"] for phase in report["phases"]}
+        self.assertTrue(
+            {"scan", "import", "validate_tool_meta", "registration", "mount"} <= phases
+        )
+        wall_times = [phase["wall_ms"] for phase in report["phases"]]
+        self.assertEqual(wall_times, sorted(wall_times, reverse=True))
+        self.assertEqual(report["files"][0]["file"], str(self.sample_file.resolve()))
+        self.assertIn("modules_imported", report["files"][0])
+
 
 if __name__ == "__main__":
     unittest.main()
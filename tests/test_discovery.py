@@ -15,7 +15,16 @@ sys.path.append(project_root)
 sys.path.append(os.path.join(project_root, "src"))
 
 try:
-    from mcpy_cli.discovery import discover_py_files, discover_functions
+    from mcpy_cli.discovery import (
+        discover_py_files,
+        discover_functions,
+        resolve_module_name,
+    )
+    from mcpy_cli.static_discovery import (
+        discover_functions_static,
+        get_module_docstring_static,
+    )
+    from mcpy_cli.utils.path_utils import IgnoreRules, validate_source_path
 
     imports_successful = True
 except ImportError:
@@ -182,11 +191,330 @@ os_func = os.path.join
         with self.assertRaises(FileNotFoundError):
             discover_py_files("/non/existent/path")
 
+    def test_discover_functions_parallel_keeps_order(self):
+        """Test that threaded discovery returns the same ordered result as sequential."""
+        files = [self.py_file, self.nested_py_file, self.import_file]
+        sequential = discover_functions(files)
+        timings = {}
+        parallel = discover_functions(files, max_workers=3, file_timings=timings)
+
+        self.assertEqual(
+            [(name, path) for _, name, path in sequential],
+            [(name, path) for _, name, path in parallel],
+        )
+        self.assertEqual(set(timings), set(files))
+        self.assertTrue(all(elapsed >= 0 for elapsed in timings.values()))
+
     def test_path_not_file_or_directory(self):
         """Test handling of paths that are neither files nor directories."""
         # This test might be platform-specific, so we'll skip it for now
         pass
 
 
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestStaticDiscovery(unittest.TestCase):
+    """Tests for AST-based discovery that does not execute user modules."""
+
+    def setUp(self):
+        """Create temporary files for static discovery."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_static_"))
+        self.py_file = self.temp_dir / "static_module.py"
+        with open(self.py_file, "w") as f:
+            f.write('''"""Module level docstring."""
+import os
+from typing import List, Optional
+
+raise RuntimeError("module must not be executed")
+
+# Doubles a value.
+def double(x: int, scale: int = 2) -> int:
+    """Double a value."""
+    return x * scale
+
+async def fetch(items: List[str], *, limit: Optional[int] = None) -> List[str]:
+    """Fetch items."""
+    return items[:limit]
+
+def _private_helper() -> None:
+    pass
+
+join = os.path.join
+''')
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_discover_functions_static(self):
+        """Test that functions are found without running the module."""
+        result = discover_functions_static([self.py_file])
+        self.assertEqual([info.name for info in result], ["double", "fetch"])
+
+        double = result[0]
+        self.assertEqual(double.signature, "double(x: int, scale: int = 2) -> int")
+        self.assertEqual(double.docstring, "Double a value.")
+        self.assertEqual(double.comments, "# Doubles a value.\n")
+        self.assertEqual(double.file_path, self.py_file)
+        self.assertEqual(
+            result[1].signature,
+            "fetch(items: List[str], *, limit: Optional[int] = None) -> List[str]",
+        )
+
+    def test_discover_functions_static_specific(self):
+        """Test filtering static discovery by function name."""
+        result = discover_functions_static([self.py_file], ["fetch"])
+        self.assertEqual([info.name for info in result], ["fetch"])
+
+    def test_static_matches_dynamic_discovery(self):
+        """Test that static records match the dynamic discovery records."""
+        sample_tools_path = pathlib.Path(__file__).parent.resolve() / "sample_tools.py"
+        dynamic = discover_functions([sample_tools_path])
+        static = discover_functions_static([sample_tools_path])
+        self.assertEqual(
+            [(name, path) for _, name, path in dynamic],
+            [(info.name, info.file_path) for info in static],
+        )
+
+    def test_conditional_definitions_and_lambdas_match_dynamic(self):
+        """Test that defs in if/try blocks and module-level lambdas are found."""
+        conditional_file = self.temp_dir / "conditional_module.py"
+        conditional_file.write_text(
+            '''import sys
+from typing import List
+
+try:
+    import mcpy_missing_dependency
+except ImportError:
+    def fallback(x: "int") -> int:
+        """Defined when the dependency is missing."""
+        return x
+
+if sys.version_info >= (3,):
+    def cond(items: "List[str]") -> int:
+        """Defined conditionally."""
+        return len(items)
+else:
+    def cond(items: list) -> int:
+        return 0
+
+lam = lambda x, y=2: x * y
+
+if __name__ == "__main__":
+    def main_only() -> None:
+        pass
+'''
+        )
+        dynamic = discover_functions([conditional_file])
+        static = discover_functions_static([conditional_file])
+        self.assertEqual(
+            [name for _, name, _ in dynamic], [info.name for info in static]
+        )
+        self.assertEqual([info.name for info in static], ["cond", "fallback", "lam"])
+
+        cond, fallback, lam = static
+        self.assertEqual(cond.docstring, "Defined conditionally.")
+        self.assertEqual(
+            cond.parameters["properties"]["items"],
+            {"type": "array", "items": {"type": "string"}, "title": "Items"},
+        )
+        self.assertEqual(
+            fallback.parameters["properties"]["x"], {"type": "integer", "title": "X"}
+        )
+        self.assertEqual(lam.signature, "lam(x, y=2)")
+        self.assertEqual(lam.parameters["required"], ["x"])
+        self.assertEqual(lam.docstring, "")
+
+    def test_get_module_docstring_static(self):
+        """Test reading a module docstring without running the module."""
+        self.assertEqual(
+            get_module_docstring_static(self.py_file), "Module level docstring."
+        )
+
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestPrunedScanner(unittest.TestCase):
+    """Tests for the pruned directory scanner shared by validation and discovery."""
+
+    def setUp(self):
+        """Create a source tree with directories that should be pruned."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_scan_"))
+        for relative in [
+            "tool.py",
+            "pkg/nested.py",
+            "pkg/deep/deeper.py",
+            ".venv/lib/site.py",
+            "node_modules/pkg/script.py",
+            "pkg/__pycache__/cached.py",
+            "data/dump.py",
+            "data/keep.py",
+        ]:
+            path = self.temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("def f():\n    return 1\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _relative(self, files):
+        return [f.relative_to(self.temp_dir).as_posix() for f in files]
+
+    def test_default_pruning(self):
+        """Test that virtualenvs, caches and node_modules are never scanned."""
+        files = self._relative(discover_py_files(str(self.temp_dir)))
+        self.assertEqual(
+            files,
+            ["tool.py", "data/dump.py", "data/keep.py", "pkg/nested.py", "pkg/deep/deeper.py"],
+        )
+
+    def test_mcpyignore_with_negation(self):
+        """Test gitignore-style excludes and re-includes from .mcpyignore."""
+        (self.temp_dir / ".mcpyignore").write_text(
+            "# data files\ndata/*\n!data/keep.py\n**/deep/\n"
+        )
+        files = self._relative(discover_py_files(str(self.temp_dir)))
+        self.assertEqual(files, ["tool.py", "data/keep.py", "pkg/nested.py"])
+
+    def test_max_depth(self):
+        """Test limiting the scan depth."""
+        self.assertEqual(
+            self._relative(discover_py_files(str(self.temp_dir), max_depth=0)),
+            ["tool.py"],
+        )
+        self.assertNotIn(
+            "pkg/deep/deeper.py",
+            self._relative(discover_py_files(str(self.temp_dir), max_depth=1)),
+        )
+
+    @unittest.skipIf(not hasattr(os, "symlink"), "Symlinks not supported")
+    def test_symlink_loop_terminates(self):
+        """Test that a directory symlink pointing back up is visited only once."""
+        try:
+            os.symlink(self.temp_dir, self.temp_dir / "pkg" / "loop")
+        except OSError:
+            self.skipTest("Cannot create symlinks")
+        files = self._relative(discover_py_files(str(self.temp_dir)))
+        self.assertEqual(files.count("tool.py"), 1)
+
+    def test_validate_source_path_uses_pruning(self):
+        """Test that validation ignores Python files inside pruned directories."""
+        only_venv = pathlib.Path(tempfile.mkdtemp(prefix="test_scan_venv_"))
+        try:
+            (only_venv / ".venv").mkdir()
+            (only_venv / ".venv" / "site.py").write_text("x = 1\n")
+            self.assertFalse(
+                validate_source_path(str(only_venv), logging.getLogger(__name__))
+            )
+            self.assertTrue(
+                validate_source_path(str(self.temp_dir), logging.getLogger(__name__))
+            )
+        finally:
+            shutil.rmtree(only_venv)
+
+    def test_anchored_and_dir_only_rules(self):
+        """Test anchored patterns and directory-only rules."""
+        rules = IgnoreRules(["/build/", "*.gen.py"])
+        self.assertTrue(rules.is_ignored("build", True))
+        self.assertFalse(rules.is_ignored("src/build", True))
+        self.assertFalse(rules.is_ignored("build", False))
+        self.assertTrue(rules.is_ignored("src/models.gen.py", False))
+
+
+
+@unittest.skipIf(not imports_successful, "Required modules could not be imported")
+class TestPackageAwareImport(unittest.TestCase):
+    """Tests for importing tool files under collision-safe dotted module names."""
+
+    def setUp(self):
+        """Create a source tree with same-named files and a package."""
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp(prefix="test_import_"))
+        self.modules_before = set(sys.modules)
+        self.sys_path_before = list(sys.path)
+        files = {
+            "mcpy_alpha/utils.py": "def alpha_util() -> str:\n    return 'alpha'\n",
+            "mcpy_beta/utils.py": "def beta_util() -> str:\n    return 'beta'\n",
+            "mcpy_pkg/__init__.py": "",
+            "mcpy_pkg/helpers.py": (
+                "LOADS = []\nLOADS.append(1)\n\n"
+                "def _scale(x: int) -> int:\n    return x * 10\n"
+            ),
+            "mcpy_pkg/first.py": (
+                "from .helpers import _scale, LOADS\n\n"
+                "def first(x: int) -> int:\n    return _scale(x) + len(LOADS)\n"
+            ),
+            "mcpy_pkg/second.py": (
+                "from mcpy_pkg.helpers import _scale\n\n"
+                "def second(x: int) -> int:\n    return _scale(x)\n"
+            ),
+            "json.py": "def not_stdlib() -> str:\n    return 'user json'\n",
+        }
+        for relative, source in files.items():
+            path = self.temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source)
+
+    def tearDown(self):
+        """Clean up temporary files, modules and import paths."""
+        for name in set(sys.modules) - self.modules_before:
+            if name.startswith(("mcpy_alpha", "mcpy_beta", "mcpy_pkg", "_mcpy_tool_")):
+                del sys.modules[name]
+        sys.path[:] = self.sys_path_before
+        shutil.rmtree(self.temp_dir)
+
+    def _discover(self, *relative_paths):
+        return discover_functions(
+            [self.temp_dir / relative for relative in relative_paths],
+            base_dir=self.temp_dir,
+        )
+
+    def test_resolve_module_name(self):
+        """Test deriving dotted names relative to the base directory."""
+        self.assertEqual(
+            resolve_module_name(self.temp_dir / "mcpy_alpha" / "utils.py", self.temp_dir),
+            ("mcpy_alpha.utils", self.temp_dir),
+        )
+        # Without a base directory, enclosing packages are still honoured
+        self.assertEqual(
+            resolve_module_name(self.temp_dir / "mcpy_pkg" / "first.py"),
+            ("mcpy_pkg.first", self.temp_dir),
+        )
+        self.assertIsNone(
+            resolve_module_name(self.temp_dir / "my-tools.py", self.temp_dir)
+        )
+
+    def test_same_file_names_do_not_collide(self):
+        """Test that utils.py files in different directories are both discovered."""
+        result = self._discover("mcpy_alpha/utils.py", "mcpy_beta/utils.py")
+        self.assertEqual([name for _, name, _ in result], ["alpha_util", "beta_util"])
+        self.assertEqual(result[0][0].__module__, "mcpy_alpha.utils")
+        self.assertEqual(result[1][0].__module__, "mcpy_beta.utils")
+
+    def test_relative_imports_and_shared_helpers(self):
+        """Test that relative imports work and shared helpers are executed once."""
+        result = self._discover(
+            "mcpy_pkg/first.py", "mcpy_pkg/helpers.py", "mcpy_pkg/second.py"
+        )
+        functions = {name: func for func, name, _ in result}
+        self.assertEqual(functions["first"](2), 21)
+        self.assertEqual(functions["second"](2), 20)
+        self.assertEqual(sys.modules["mcpy_pkg.helpers"].LOADS, [1])
+
+    def test_stdlib_name_is_isolated(self):
+        """Test that a tool file named like a stdlib module does not shadow it."""
+        import json as stdlib_json
+
+        result = self._discover("json.py")
+        self.assertEqual([name for _, name, _ in result], ["not_stdlib"])
+        self.assertIs(sys.modules["json"], stdlib_json)
+        self.assertNotEqual(result[0][0].__module__, "json")
+
+    def test_import_roots_are_removed_from_sys_path(self):
+        """Test that import roots are only on sys.path while a file is imported."""
+        result = self._discover("mcpy_alpha/utils.py", "mcpy_pkg/first.py")
+        self.assertEqual(len(result), 2)
+        self.assertEqual(sys.path, self.sys_path_before)
+        self.assertNotIn(str(self.temp_dir), sys.path)
+
+
 if __name__ == "__main__":
     unittest.main()